@@ -1,9 +1,10 @@
-
 """
 Answer 모듈
 LLM API를 사용하여 크롤링된 CSV 파일에 요약을 추가하는 모듈
 """
 
+from .cache import SummaryCache
+from .rate_limit import AdaptiveRateLimiter
 from .summarizer import ArticleSummarizer
 
-__all__ = ['ArticleSummarizer']
\ No newline at end of file
+__all__ = ['ArticleSummarizer', 'AdaptiveRateLimiter', 'SummaryCache']
\ No newline at end of file
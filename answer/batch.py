@@ -0,0 +1,65 @@
+# answer/batch.py
+"""
+OpenAI Batch API용 요청/결과 JSONL 파일 처리
+
+요청 파일은 한 줄에 {"custom_id", "method", "url", "body"} 하나이며,
+custom_id는 (모델/프롬프트/파라미터, 기사 텍스트)의 해시라 같은 기사는 매번 같은 ID를 받습니다.
+결과 파일의 줄 순서는 요청 순서와 다를 수 있으므로 custom_id로 다시 맞춥니다.
+"""
+
+import hashlib
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+COMPLETION_WINDOW = "24h"
+# 더 이상 상태가 바뀌지 않는 배치 상태
+TERMINAL_STATUSES = ('completed', 'failed', 'expired', 'cancelled')
+CUSTOM_ID_PREFIX = "summary-"
+
+
+def custom_id_for(text, namespace=''):
+    """기사 텍스트의 안정적인 custom_id (같은 텍스트/네임스페이스면 항상 같음)"""
+    digest = hashlib.blake2b(f"{namespace}\0{text}".encode('utf-8'), digest_size=12).hexdigest()
+    return f"{CUSTOM_ID_PREFIX}{digest}"
+
+
+def write_batch_requests(path, bodies_by_id):
+    """{custom_id: 요청 본문}을 Batch API 요청 JSONL 파일로 쓰는 함수 (요청 수 반환)"""
+    with open(path, 'w', encoding='utf-8') as f:
+        for custom_id, body in bodies_by_id.items():
+            record = {'custom_id': custom_id, 'method': 'POST', 'url': BATCH_ENDPOINT, 'body': body}
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+    return len(bodies_by_id)
+
+
+def parse_batch_output(text):
+    """
+    결과 파일(또는 오류 파일) 내용을 {custom_id: 요약}으로 바꾸는 함수
+    요청이 실패한 줄은 요약 대신 None이 들어가고, JSON으로 읽을 수 없는 줄은 건너뜁니다.
+    """
+    results = {}
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            # 잘린 줄 등은 건너뜁니다 (그 기사는 결과가 없는 것으로 보고 일반 요청으로 다시 요약됨).
+            logger.warning(f"배치 결과 줄을 JSON으로 읽지 못해 건너뜁니다: {line[:80]!r}")
+            continue
+        custom_id = record.get('custom_id')
+        response = record.get('response') or {}
+        summary = None
+        if not record.get('error') and response.get('status_code') == 200:
+            try:
+                summary = response['body']['choices'][0]['message']['content'].strip()
+            except (KeyError, IndexError, TypeError, AttributeError):
+                logger.warning(f"배치 결과 형식 오류: {custom_id}")
+        else:
+            error = record.get('error') or (response.get('body') or {}).get('error')
+            logger.warning(f"배치 요청 실패: {custom_id}: {error}")
+        results[custom_id] = summary
+    return results
@@ -0,0 +1,71 @@
+# answer/cache.py
+
+import hashlib
+import json
+import time
+
+from common.sqlite_cache import SQLiteLRUCache, content_key
+
+
+def summary_namespace(model, prompts, params):
+    """모델, 프롬프트 템플릿, 생성 파라미터를 묶은 캐시 네임스페이스 문자열"""
+    material = json.dumps([model, list(prompts), params], ensure_ascii=False, sort_keys=True)
+    return hashlib.blake2b(material.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class SummaryCache(SQLiteLRUCache):
+    """
+    기사 텍스트의 해시를 키로 LLM 요약을 보관하는 SQLite 디스크 캐시
+
+    - 키에는 모델, 프롬프트 템플릿, 생성 파라미터(namespace)가 함께 들어가므로
+      그중 하나라도 바뀌면 예전 요약을 쓰지 않습니다.
+    - max_age_hours를 지정하면 그보다 오래된 요약은 만료로 보고 다시 요청합니다.
+      allow_stale=True로 조회하면 만료된 요약도 돌려줍니다 (API 장애 시 대체용).
+    - 요약 크기 합이 max_bytes를 넘으면 가장 오래 사용되지 않은 항목부터 지웁니다(LRU).
+    """
+
+    TABLE = 'summaries'
+    VALUE_COLUMNS = ('summary TEXT NOT NULL', 'created_at REAL NOT NULL')
+    COUNTERS = ('hits', 'stale_hits', 'misses')
+
+    def __init__(self, path='summary_cache.sqlite', max_bytes=50 * 1024 * 1024, max_age_hours=None):
+        super().__init__(path, max_bytes)
+        self.max_age_hours = max_age_hours
+
+    def _is_fresh(self, created_at, now):
+        return self.max_age_hours is None or now - created_at <= self.max_age_hours * 3600
+
+    def get(self, text, namespace='', allow_stale=False):
+        """요약을 조회하는 함수 (없거나 만료되었으면 None)"""
+        return self.get_many([text], namespace, allow_stale).get(text)
+
+    def get_many(self, texts, namespace='', allow_stale=False):
+        """
+        여러 텍스트의 요약을 조회해 {텍스트: 요약}으로 반환하는 함수 (없는 텍스트는 빠짐)
+        allow_stale=True이면 만료된 요약도 포함하고 stale_hits로 따로 셉니다.
+        """
+        keys = {content_key(text, namespace): text for text in texts}
+        found = {}
+        stale = 0
+        now = time.time()
+        for key, (summary, created_at) in self._fetch(keys).items():
+            if self._is_fresh(created_at, now):
+                found[keys[key]] = summary
+            elif allow_stale:
+                found[keys[key]] = summary
+                stale += 1
+        with self._lock:
+            self.hits += len(found) - stale
+            self.stale_hits += stale
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put(self, text, summary, namespace=''):
+        """요약을 저장하는 함수"""
+        self.put_many({text: summary}, namespace)
+
+    def put_many(self, summaries_by_text, namespace=''):
+        """{텍스트: 요약}을 한 번에 저장하는 함수"""
+        now = time.time()
+        self._store([(content_key(text, namespace), (summary, now), len(summary.encode('utf-8')))
+                     for text, summary in summaries_by_text.items()])
@@ -0,0 +1,89 @@
+# answer/checkpoint.py
+
+import hashlib
+import json
+import os
+import threading
+
+
+def text_digest(text):
+    """행의 텍스트가 바뀌었는지 확인하기 위한 짧은 해시 (16자리 hex)"""
+    return hashlib.blake2b(str(text).encode('utf-8'), digest_size=8).hexdigest()
+
+
+class SummaryJournal:
+    """
+    요약 실행의 체크포인트 저널 (JSON Lines)
+
+    요약이 끝난 행마다 {"row", "digest", "summary"}를 덧붙여 기록하고(기록마다 flush),
+    sync_every개 기록마다 디스크에 fsync합니다.
+    다시 시작하면 저널을 한 번만 읽어 완료된 행을 복원하며,
+    같은 행 번호라도 텍스트가 바뀌었으면 완료되지 않은 것으로 봅니다.
+    """
+
+    def __init__(self, path='summary_journal.jsonl', sync_every=20):
+        self.path = path
+        self.sync_every = sync_every
+        self.done = {}   # 행 번호 -> (텍스트 해시, 요약)
+        self._since_sync = 0
+        self._lock = threading.Lock()
+
+        needs_newline = False
+        if os.path.exists(path):
+            needs_newline = self._replay()
+        self._file = open(path, 'a', encoding='utf-8')
+        if needs_newline:
+            # 잘린 마지막 줄 뒤에 새 기록이 붙지 않도록 줄을 바꿔 둡니다.
+            self._file.write('\n')
+
+    def _replay(self):
+        """저널을 읽어 완료된 행을 복원하는 함수 (마지막 줄이 잘려 있으면 True 반환)"""
+        line = '\n'
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # 강제 종료로 마지막 줄이 잘린 경우
+                    continue
+                self.done[record['row']] = (record['digest'], record['summary'])
+        return not line.endswith('\n')
+
+    def get(self, row, text):
+        """행의 요약을 반환하는 함수 (완료되지 않았거나 텍스트가 바뀌었으면 None)"""
+        entry = self.done.get(row)
+        if entry is None or entry[0] != text_digest(text):
+            return None
+        return entry[1]
+
+    def record(self, rows, text, summary):
+        """같은 텍스트를 가진 행들(rows)의 요약이 끝났음을 기록하는 함수"""
+        digest = text_digest(text)
+        lines = ''.join(json.dumps({'row': row, 'digest': digest, 'summary': summary}, ensure_ascii=False) + '\n'
+                        for row in rows)
+        with self._lock:
+            for row in rows:
+                self.done[row] = (digest, summary)
+            self._file.write(lines)
+            self._file.flush()
+            self._since_sync += len(rows)
+            if self._since_sync >= self.sync_every:
+                self._sync()
+
+    def _sync(self):
+        # 호출하는 쪽에서 lock을 잡고 있어야 합니다.
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._since_sync = 0
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._sync()
+                self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
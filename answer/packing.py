@@ -0,0 +1,89 @@
+# answer/packing.py
+"""
+여러 기사를 한 요청에 묶어 요약하는 프롬프트 패킹
+
+content 컬럼은 30자 안팎의 제목인 경우가 많아, 기사마다 요청을 보내면 요청 오버헤드가 대부분을 차지합니다.
+토큰 예산 안에서 기사 여러 개를 {ID: 기사} JSON으로 묶어 보내고 {ID: 요약} JSON 객체로 받습니다.
+응답에서 형식이 맞지 않거나 빠진 ID는 호출하는 쪽에서 기사 하나씩 다시 요청합니다.
+"""
+
+import json
+import logging
+
+from .rate_limit import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+PACKED_SYSTEM_PROMPT = "당신은 뉴스를 요약하는 전문가입니다. 항상 JSON 객체로만 답합니다."
+PACKED_PROMPT_TEMPLATE = """
+다음은 ID별 뉴스 목록(JSON)입니다. 각 뉴스를 100자 내외로 요약한 내용을 한글로 생성해서,
+ID를 키로, 요약을 값으로 하는 JSON 객체로만 주세요. 예: {{"1": "요약", "2": "요약"}}
+
+{articles}
+"""
+# 한 요청에 묶는 기사들의 프롬프트 토큰 예산과 최대 기사 수
+DEFAULT_PACK_TOKEN_BUDGET = 2000
+DEFAULT_PACK_MAX_ARTICLES = 20
+# 기사 하나의 요약에 잡아 두는 응답 토큰 수 (max_tokens = 이 값 x 기사 수 + 여유분)
+PACKED_TOKENS_PER_ARTICLE = 200
+PACKED_TOKENS_OVERHEAD = 50
+# JSON 키/따옴표/쉼표 등 기사 하나당 더해지는 토큰 수
+ITEM_OVERHEAD_TOKENS = 6
+
+
+def pack_texts(texts, token_budget=DEFAULT_PACK_TOKEN_BUDGET, max_articles=DEFAULT_PACK_MAX_ARTICLES):
+    """
+    텍스트들을 순서대로 토큰 예산과 최대 기사 수를 넘지 않는 묶음으로 나누는 함수 (묶음 = 텍스트 목록)
+    예산보다 큰 텍스트는 혼자 한 묶음이 됩니다.
+    """
+    packs = []
+    current, current_tokens = [], 0
+    for text in texts:
+        tokens = estimate_tokens(text) + ITEM_OVERHEAD_TOKENS
+        if current and (current_tokens + tokens > token_budget or len(current) >= max_articles):
+            packs.append(current)
+            current, current_tokens = [], 0
+        current.append(text)
+        current_tokens += tokens
+    if current:
+        packs.append(current)
+    return packs
+
+
+def packed_ids(count):
+    """묶음 안의 기사 ID ('1'부터)"""
+    return [str(i + 1) for i in range(count)]
+
+
+def build_packed_messages(texts):
+    """묶음 요청에 보낼 메시지 목록 (기사는 한 줄짜리 {ID: 기사} JSON으로 넣음)"""
+    articles = json.dumps(dict(zip(packed_ids(len(texts)), texts)), ensure_ascii=False)
+    return [
+        {"role": "system", "content": PACKED_SYSTEM_PROMPT},
+        {"role": "user", "content": PACKED_PROMPT_TEMPLATE.format(articles=articles)}
+    ]
+
+
+def parse_packed_response(content, expected_ids):
+    """
+    묶음 응답을 검증해 {ID: 요약}으로 반환하는 함수
+    JSON 객체가 아니면 빈 dict를 반환하고, 요청하지 않은 ID와 빈 문자열/문자열이 아닌 값은 버립니다.
+    """
+    try:
+        data = json.loads(content)
+    except (TypeError, ValueError):
+        logger.warning(f"묶음 응답이 JSON이 아닙니다: {str(content)[:80]!r}")
+        return {}
+    if not isinstance(data, dict):
+        logger.warning(f"묶음 응답이 JSON 객체가 아닙니다: {type(data).__name__}")
+        return {}
+    # {"summaries": {...}}처럼 한 번 감싸서 답한 경우
+    if len(data) == 1 and isinstance(next(iter(data.values())), dict):
+        data = next(iter(data.values()))
+
+    summaries = {}
+    for article_id in expected_ids:
+        value = data.get(article_id)
+        if isinstance(value, str) and value.strip():
+            summaries[article_id] = value.strip()
+    return summaries
@@ -0,0 +1,103 @@
+# answer/rate_limit.py
+"""
+LLM API 호출 속도 제한기
+
+분당 요청 수(RPM)와 분당 토큰 수(TPM) 두 예산을 함께 지키고,
+429(Rate limit) 응답을 받으면 속도를 절반으로 낮췄다가 성공할 때마다 조금씩 되돌립니다 (AIMD).
+"""
+
+import threading
+import time
+
+from common.rate_limit import TokenBucket
+
+# 429를 받았을 때 속도에 곱하는 값과 성공할 때마다 더하는 값
+DECREASE_FACTOR = 0.5
+RECOVERY_STEP = 0.05
+MIN_FACTOR = 0.05
+# 서버가 Retry-After를 주지 않았을 때 쉬는 시간 (초)
+DEFAULT_PAUSE = 1.0
+
+
+def estimate_tokens(text):
+    """
+    프롬프트의 토큰 수를 어림하는 함수 (토크나이저 없이 TPM 예산 계산용)
+    한글 등 ASCII가 아닌 글자는 글자당 1토큰, ASCII는 4글자당 1토큰으로 셉니다.
+    """
+    text = str(text)
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    return non_ascii + (len(text) - non_ascii + 3) // 4
+
+
+class AdaptiveRateLimiter:
+    """
+    RPM/TPM 토큰 버킷 두 개와 429 적응형 백오프를 묶은 속도 제한기
+    requests_per_minute / tokens_per_minute가 None이면 그 예산은 제한하지 않습니다.
+    여러 스레드에서 동시에 사용해도 안전합니다.
+    """
+
+    def __init__(self, requests_per_minute=None, tokens_per_minute=None):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = self._bucket(requests_per_minute)
+        self._tokens = self._bucket(tokens_per_minute)
+        self.factor = 1.0
+        self.rate_limited = 0
+        self.waited = 0.0
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _bucket(per_minute):
+        if not per_minute:
+            return None
+        rate = per_minute / 60
+        # 1초 분량만큼 몰아서 보낼 수 있게 하고, 그보다 큰 요청은 빚으로 남겨 예산 전부를 차감합니다.
+        return TokenBucket(rate, burst=max(1, rate), allow_debt=True)
+
+    def acquire(self, tokens=0):
+        """
+        요청 하나(예상 토큰 tokens개)를 보내도 될 때까지 기다리는 함수 (기다린 시간을 초 단위로 반환)
+        429 이후의 휴식 시간이 남아 있으면 먼저 기다립니다.
+        """
+        waited = 0.0
+        pause = self._paused_until - time.monotonic()
+        if pause > 0:
+            time.sleep(pause)
+            waited += pause
+        if self._requests is not None:
+            waited += self._requests.acquire()
+        if self._tokens is not None and tokens:
+            waited += self._tokens.acquire(tokens)
+        if waited:
+            with self._lock:
+                self.waited += waited
+        return waited
+
+    def on_rate_limited(self, retry_after=None):
+        """429 응답을 받았을 때 호출: 속도를 낮추고 retry_after초(없으면 기본값) 동안 새 요청을 멈춤"""
+        with self._lock:
+            self.rate_limited += 1
+            self._set_factor(max(MIN_FACTOR, self.factor * DECREASE_FACTOR))
+            pause = retry_after if retry_after is not None else DEFAULT_PAUSE / self.factor
+            self._paused_until = max(self._paused_until, time.monotonic() + pause)
+
+    def on_success(self):
+        """요청이 성공했을 때 호출: 낮췄던 속도를 조금씩 되돌림"""
+        if self.factor < 1.0:
+            with self._lock:
+                self._set_factor(min(1.0, self.factor + RECOVERY_STEP))
+
+    def _set_factor(self, factor):
+        self.factor = factor
+        for bucket, per_minute in ((self._requests, self.requests_per_minute),
+                                   (self._tokens, self.tokens_per_minute)):
+            if bucket is not None:
+                bucket.set_rate(per_minute / 60 * factor)
+
+    def stats(self):
+        return {
+            'rate_limited': self.rate_limited,
+            'factor': round(self.factor, 3),
+            'waited_sec': round(self.waited, 3),
+        }
@@ -1,111 +1,496 @@
+
 import pandas as pd
 import openai
+import itertools
 import time
 import logging
-from typing import Optional
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
 import os
 import dotenv
+
+from .batch import (BATCH_ENDPOINT, COMPLETION_WINDOW, TERMINAL_STATUSES, custom_id_for,
+                    parse_batch_output, write_batch_requests)
+from .cache import SummaryCache, summary_namespace
+from .checkpoint import SummaryJournal
+from .packing import (DEFAULT_PACK_MAX_ARTICLES, PACKED_PROMPT_TEMPLATE, PACKED_SYSTEM_PROMPT,
+                      PACKED_TOKENS_OVERHEAD, PACKED_TOKENS_PER_ARTICLE, build_packed_messages,
+                      pack_texts, packed_ids, parse_packed_response)
+from .rate_limit import AdaptiveRateLimiter, estimate_tokens
+
 dotenv.load_dotenv()
 
 
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MODEL = "gpt-4o"
+SYSTEM_PROMPT = "당신은 뉴스를 요약하는 전문가입니다."
+USER_PROMPT_TEMPLATE = """
+다음은 뉴스 입니다. 이를 바탕으로 100자 내외로 요약한 내용을 생성해서 한글로 주세요:
+
+"{text}"
+"""
+# 생성 파라미터
+MAX_TOKENS = 300
+TEMPERATURE = 0.5
+# 요약에 실패한 행에 넣는 값
+FAILED_SUMMARY = "요약 실패"
+# 동시에 보내는 요청 수 기본값
+DEFAULT_CONCURRENCY = 4
+# 배치 상태를 조회하는 간격 (초)
+BATCH_POLL_INTERVAL = 60
+# 진행 상황을 로그로 남기는 간격 (행 수)
+PROGRESS_EVERY = 100
+# 다시 시도할 오류 (요청 과다, 서버 오류, 연결/타임아웃)
+RETRYABLE_ERRORS = (openai.RateLimitError, openai.InternalServerError,
+                    openai.APIConnectionError, openai.APITimeoutError)
+
+
+def _retry_after(error):
+    """429 응답의 retry-after-ms / retry-after 헤더 값 (초, 없으면 None)"""
+    response = getattr(error, 'response', None)
+    if response is None:
+        return None
+    try:
+        if response.headers.get('retry-after-ms'):
+            return float(response.headers['retry-after-ms']) / 1000
+        if response.headers.get('retry-after'):
+            return float(response.headers['retry-after'])
+    except ValueError:
+        pass
+    return None
+
+
 class ArticleSummarizer:
     """LLM API를 사용하여 CSV 파일에 요약을 추가하는 클래스"""
-    
-    def __init__(self, api_key: str = None, model: str = "gpt-4o"):
+
+    def __init__(self, api_key: str = None, model: str = DEFAULT_MODEL,
+                 base_url: str = None,
+                 max_retries: int = 3,
+                 concurrency: int = DEFAULT_CONCURRENCY,
+                 requests_per_minute: int = None,
+                 tokens_per_minute: int = None,
+                 rate_limiter: AdaptiveRateLimiter = None,
+                 cache: SummaryCache = None,
+                 serve_stale: bool = False,
+                 pack_token_budget: int = None,
+                 pack_max_articles: int = DEFAULT_PACK_MAX_ARTICLES):
+        """
+        base_url: OpenAI 호환 서버 주소 (None이면 OPENAI_BASE_URL 환경 변수 또는 OpenAI 기본값)
+        max_retries: 429/서버 오류 시 다시 시도하는 횟수
+        concurrency: process_csv에서 동시에 보내는 요청 수
+        requests_per_minute / tokens_per_minute: 계정 한도에 맞춘 분당 요청/토큰 예산 (None이면 제한 없음)
+        cache: 요약 캐시 (SummaryCache). 같은 기사/모델/프롬프트/파라미터의 요약은 다시 요청하지 않습니다.
+        serve_stale: 요청이 끝내 실패하면 만료된 캐시 요약이라도 사용할지 여부
+        pack_token_budget: 지정하면 기사 여러 개(최대 pack_max_articles개)를 이 프롬프트 토큰 예산 안에서
+                           한 요청으로 묶어 JSON으로 요약받습니다 (None이면 기사마다 한 요청).
+        """
         if api_key is None:
             api_key = os.getenv("OPENAI_API_KEY")
-        self.client = openai.OpenAI(api_key=api_key)
+        if base_url is None:
+            base_url = os.getenv("OPENAI_BASE_URL")
+        # 재시도는 속도 제한기와 함께 여기서 직접 처리하므로 클라이언트 자체 재시도는 끕니다.
+        self.client = openai.OpenAI(api_key=api_key, base_url=base_url, max_retries=0)
         self.model = model
+        self.max_retries = max_retries
+        self.concurrency = concurrency
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter(requests_per_minute, tokens_per_minute)
+        self.cache = cache
+        self.serve_stale = serve_stale
+        self.pack_token_budget = pack_token_budget
+        self.pack_max_articles = pack_max_articles
+
+    def cache_namespace(self) -> str:
+        """기사 하나씩 요청한 요약의 캐시 키에 넣을 모델/프롬프트/생성 파라미터 문자열 (배치 custom_id에도 사용)"""
+        return summary_namespace(self.model, (SYSTEM_PROMPT, USER_PROMPT_TEMPLATE),
+                                 {'max_tokens': MAX_TOKENS, 'temperature': TEMPERATURE})
+
+    def packed_cache_namespace(self) -> str:
+        """묶음 응답에서 얻은 요약의 캐시 네임스페이스 (다른 프롬프트로 만들어지므로 따로 저장)"""
+        return summary_namespace(self.model, (PACKED_SYSTEM_PROMPT, PACKED_PROMPT_TEMPLATE),
+                                 {'max_tokens_per_article': PACKED_TOKENS_PER_ARTICLE, 'temperature': TEMPERATURE,
+                                  'response_format': 'json_object'})
+
+    def _cached_summaries(self, texts: List[str], allow_stale: bool = False) -> dict:
+        """
+        캐시에서 {텍스트: 요약}을 찾는 함수
+        묶음 모드에서는 개별 요청 요약을 먼저 찾고, 없는 텍스트만 묶음 응답 요약에서 찾습니다.
+        """
+        found = self.cache.get_many(texts, self.cache_namespace(), allow_stale=allow_stale)
+        if self.pack_token_budget:
+            rest = [text for text in texts if text not in found]
+            if rest:
+                found.update(self.cache.get_many(rest, self.packed_cache_namespace(), allow_stale=allow_stale))
+        return found
+
+    def build_messages(self, text: str) -> list:
+        """요약 요청에 보낼 메시지 목록"""
+        return [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": USER_PROMPT_TEMPLATE.format(text=text)}
+        ]
+
+    def request_body(self, text: str) -> dict:
+        """chat completions 요청 본문 (일반 요청과 배치 요청 파일에서 함께 사용)"""
+        return {
+            "model": self.model,
+            "messages": self.build_messages(text),
+            "max_tokens": MAX_TOKENS,
+            "temperature": TEMPERATURE,
+        }
 
     def summarize_text(self, text: str) -> str:
         """
         텍스트 요약 (직접 OpenAI API 호출)
+        속도 제한기의 예산을 기다린 뒤 요청하며, 429/서버 오류는 max_retries번까지 다시 시도합니다.
         """
-        prompt = f"""
-다음은 뉴스 입니다. 이를 바탕으로 100자 내외로 요약한 내용을 생성해서 한글로 주세요:
-
-"{text}"
-"""
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": "당신은 뉴스를 요약하는 전문가입니다."},
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=300,
-            temperature=0.5
-        )
+        response = self._create_completion(self.request_body(text))
         return response.choices[0].message.content.strip()
 
-    
-    def process_csv(self, 
+    def summarize_pack(self, texts: List[str]) -> dict:
+        """
+        여러 텍스트를 한 요청으로 요약해 {텍스트: 요약}으로 반환하는 함수
+        응답은 {ID: 요약} JSON 객체로 받아 검증하며, 형식이 맞지 않거나 빠진 텍스트는 결과에서 빠집니다.
+        """
+        ids = packed_ids(len(texts))
+        body = {
+            "model": self.model,
+            "messages": build_packed_messages(texts),
+            "max_tokens": PACKED_TOKENS_PER_ARTICLE * len(texts) + PACKED_TOKENS_OVERHEAD,
+            "temperature": TEMPERATURE,
+            "response_format": {"type": "json_object"},
+        }
+        response = self._create_completion(body)
+        parsed = parse_packed_response(response.choices[0].message.content, ids)
+        return {text: parsed[article_id] for article_id, text in zip(ids, texts) if article_id in parsed}
+
+    def _create_completion(self, body: dict):
+        """
+        chat completions 요청 (속도 제한기의 예산을 기다린 뒤 요청하고, 429/서버 오류는 max_retries번까지 다시 시도)
+        """
+        # TPM은 프롬프트 토큰과 max_tokens를 합쳐서 계산됩니다.
+        tokens = sum(estimate_tokens(m["content"]) for m in body["messages"]) + body["max_tokens"]
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire(tokens)
+            try:
+                response = self.client.chat.completions.create(**body)
+            except RETRYABLE_ERRORS as e:
+                if attempt == self.max_retries:
+                    raise
+                if isinstance(e, openai.RateLimitError):
+                    self.rate_limiter.on_rate_limited(_retry_after(e))
+                else:
+                    time.sleep(min(2 ** attempt, 30) * 0.5)
+                logger.debug(f"요약 요청 재시도 ({attempt + 1}/{self.max_retries}): {e}")
+                continue
+            self.rate_limiter.on_success()
+            return response
+
+    def summarize_texts(self, texts: List[str], concurrency: int = None,
+                        on_summary: Callable[[str, str], None] = None) -> List[str]:
+        """
+        여러 텍스트를 요약하는 함수 (결과는 입력 순서대로)
+        캐시에 있는 요약은 그대로 쓰고, 나머지 텍스트만 중복 없이 동시에 요청합니다.
+        요약에 실패한 텍스트는 (serve_stale이면 만료된 캐시 요약, 그것도 없으면) FAILED_SUMMARY로 채웁니다.
+        on_summary(텍스트, 요약)는 요약을 얻은 텍스트마다 (요청이 끝나는 즉시) 한 번씩 호출됩니다.
+        """
+        texts = [str(text) for text in texts]
+        unique_texts = list(dict.fromkeys(texts))
+        summaries = self._cached_summaries(unique_texts) if self.cache is not None else {}
+        pending = [text for text in unique_texts if text not in summaries]
+        if summaries:
+            logger.info(f"캐시된 요약 사용: {len(summaries)}건, 새로 요청: {len(pending)}건")
+        if on_summary is not None:
+            for text, summary in summaries.items():
+                on_summary(text, summary)
+
+        results, from_packs = self._request_summaries(pending, concurrency or self.concurrency, on_summary)
+        fresh = {text: summary for text, summary in zip(pending, results) if summary is not None}
+        failed = [text for text, summary in zip(pending, results) if summary is None]
+        summaries.update(fresh)
+        if self.cache is not None:
+            # 묶음 응답의 요약과 하나씩 다시 요청한 요약은 프롬프트가 다르므로 네임스페이스를 나눠 저장합니다.
+            self.cache.put_many({text: summary for text, summary in fresh.items() if text not in from_packs},
+                                self.cache_namespace())
+            self.cache.put_many({text: summary for text, summary in fresh.items() if text in from_packs},
+                                self.packed_cache_namespace())
+            if failed and self.serve_stale:
+                stale = self._cached_summaries(failed, allow_stale=True)
+                if stale:
+                    logger.warning(f"요청에 실패한 {len(failed)}건 중 {len(stale)}건은 만료된 캐시 요약으로 대신합니다.")
+                summaries.update(stale)
+                if on_summary is not None:
+                    for text, summary in stale.items():
+                        on_summary(text, summary)
+        return [summaries.get(text, FAILED_SUMMARY) for text in texts]
+
+    def _request_summaries(self, texts: List[str], concurrency: int,
+                           on_summary: Callable[[str, str], None] = None):
+        """
+        텍스트들을 동시에 요청해 (요약 목록, 묶음 응답에서 요약을 얻은 텍스트 집합)을 반환하는 함수 (실패한 텍스트는 None)
+        pack_token_budget이 있으면 텍스트들을 묶음으로 나눠 묶음마다 한 요청을 보냅니다.
+        """
+        total = len(texts)
+        progress = itertools.count(1)
+        if self.pack_token_budget:
+            jobs = pack_texts(texts, self.pack_token_budget, self.pack_max_articles)
+        else:
+            jobs = [[text] for text in texts]
+
+        def run_job(item):
+            i, job = item
+            summaries, packed = self._summarize_job(i, job)
+            for text, summary in zip(job, summaries):
+                if summary is not None and on_summary is not None:
+                    on_summary(text, summary)
+                done = next(progress)
+                if done % PROGRESS_EVERY == 0:
+                    logger.info(f"요약 진행중: {done}/{total}")
+            return summaries, packed
+
+        started = time.perf_counter()
+        if concurrency > 1 and len(jobs) > 1:
+            # executor.map은 입력 순서대로 결과를 돌려주므로 행 순서가 유지됩니다.
+            executor = ThreadPoolExecutor(max_workers=concurrency)
+            try:
+                results = list(executor.map(run_job, enumerate(jobs)))
+            finally:
+                # Ctrl-C 등으로 중단되면 아직 시작하지 않은 요청은 보내지 않습니다.
+                executor.shutdown(cancel_futures=True)
+        else:
+            results = [run_job(item) for item in enumerate(jobs)]
+        summaries = [summary for job_summaries, _ in results for summary in job_summaries]
+        from_packs = {text for _, packed in results for text in packed}
+        elapsed = time.perf_counter() - started
+        failed = sum(summary is None for summary in summaries)
+        logger.info(f"요약 요청 완료: {total}건 ({elapsed:.1f}초, 실패 {failed}건, "
+                    f"속도 제한 {self.rate_limiter.stats()})")
+        if self.pack_token_budget:
+            packed = sum(len(job) > 1 for job in jobs)
+            fallbacks = sum(len(job) - len(packed_texts) for job, (_, packed_texts) in zip(jobs, results)
+                            if len(job) > 1)
+            logger.info(f"묶음 요청 {packed}건 (요청 {len(jobs)}건으로 {total}건 처리), 개별 재요청 {fallbacks}건")
+        return summaries, from_packs
+
+    def _summarize_job(self, i: int, job: List[str]):
+        """
+        요청 하나(텍스트 하나 또는 묶음)를 요약해 (요약 목록, 묶음 응답에서 얻은 {텍스트: 요약})을 반환하는 함수
+        묶음 응답에서 빠지거나 형식이 맞지 않은 텍스트는 하나씩 다시 요청합니다.
+        """
+        packed = {}
+        if len(job) > 1:
+            try:
+                packed = self.summarize_pack(job)
+            except Exception as e:
+                logger.warning(f"{i + 1}번째 묶음 요청 실패 ({len(job)}건): {e}")
+            if len(packed) < len(job):
+                logger.info(f"{i + 1}번째 묶음에서 {len(job) - len(packed)}건을 하나씩 다시 요청합니다.")
+
+        summaries = []
+        for text in job:
+            summary = packed.get(text)
+            if summary is None:
+                try:
+                    summary = self.summarize_text(text)
+                except Exception as e:
+                    logger.warning(f"{i + 1}번째 요청 요약 실패 ({text[:30]!r}): {e}")
+            summaries.append(summary)
+        return summaries, packed
+
+    def process_csv(self,
                    csv_path: str,
                    text_column: str = "content",
-                   output_path: Optional[str] = None) -> str:
+                   output_path: Optional[str] = None,
+                   concurrency: int = None,
+                   checkpoint_path: Optional[str] = None) -> str:
         """
         CSV 파일의 텍스트를 요약하여 새 컬럼 추가
-        
+
         Args:
             csv_path: 입력 CSV 파일 경로
             text_column: 요약할 텍스트 컬럼명
             output_path: 출력 파일 경로 (None이면 자동 생성)
-            
+            concurrency: 동시에 보내는 요청 수 (None이면 생성자에서 정한 값)
+            checkpoint_path: 체크포인트 저널(JSONL) 경로. 지정하면 행마다 요약이 끝나는 즉시 기록하고,
+                             중단 후 같은 경로로 다시 실행하면 완료된 행은 건너뜁니다.
+
         Returns:
             출력 파일 경로
         """
         # CSV 파일 읽기
         df = pd.read_csv(csv_path)
-        print(f"CSV 파일 로드: {len(df)}개 행")
-        
+        logger.info(f"CSV 파일 로드: {len(df)}개 행")
+
         # 출력 경로 설정
         if output_path is None:
             output_path = csv_path.replace('.csv', '_with_summaries.csv')
-        
-        # 요약 컬럼 추가
-        df['summary'] = ''
-        
+
         # 각 행에 대해 요약 생성
-        for i in range(len(df)):
-            text = df.iloc[i][text_column]
-            
-            print(f"요약 진행중: {i+1}/{len(df)}")
-            
-            try:
-                summary = self.summarize_text(text)
-                df.iloc[i, df.columns.get_loc('summary')] = summary
-            except Exception as e:
-                print(f"행 {i} 요약 실패: {e}")
-                df.iloc[i, df.columns.get_loc('summary')] = "요약 실패"
-            
-            # API 호출 제한을 위한 지연
-            time.sleep(1)
-        
+        texts = [str(text) for text in df[text_column].tolist()]
+        if checkpoint_path is None:
+            df['summary'] = self.summarize_texts(texts, concurrency=concurrency)
+        else:
+            with SummaryJournal(checkpoint_path) as journal:
+                df['summary'] = self._summarize_with_journal(texts, journal, concurrency)
+
         # 결과 저장
         df.to_csv(output_path, index=False, encoding='utf-8-sig')
-    
-        print(f"요약 완료! 결과 파일: {output_path}")
-        
+
+        logger.info(f"요약 완료! 결과 파일: {output_path}")
+        if self.cache is not None:
+            logger.info(f"요약 캐시: {self.cache.stats()}")
+
         return output_path
-    
 
-    
-# ArticleSummarizer 인스턴스 생성
-summarizer = ArticleSummarizer(model="gpt-4o")  # api_key는 None이면 .env에서 자동 로드
+    def _summarize_with_journal(self, texts: List[str], journal: SummaryJournal, concurrency: int = None) -> List[str]:
+        """저널에 완료로 남은 행은 건너뛰고 나머지 행만 요약하며, 요약이 끝난 행을 저널에 기록하는 함수"""
+        summaries = [journal.get(row, text) for row, text in enumerate(texts)]
+        rows_by_text = defaultdict(list)
+        for row, summary in enumerate(summaries):
+            if summary is None:
+                rows_by_text[texts[row]].append(row)
+        resumed = sum(summary is not None for summary in summaries)
+        if resumed:
+            logger.info(f"체크포인트에서 {resumed}행 복원, 남은 행 {len(texts) - resumed}개")
 
-# CSV 파일 경로 지정
-csv_path = "/Users/woody/smart_summary_bot/naver_news_articles_cleaned.csv"  # 또는 "answer/test_articles.csv" 경로에 따라 수정
+        def record(text, summary):
+            journal.record(rows_by_text[text], text, summary)
 
-# 요약 실행
-output_path = summarizer.process_csv(
-    csv_path=csv_path,
-    text_column="content",  # 기사 내용 컬럼명
-    output_path=None        # None이면 자동으로 _with_summaries.csv 생성
-)
+        results = self.summarize_texts(list(rows_by_text), concurrency=concurrency, on_summary=record)
+        for text, summary in zip(rows_by_text, results):
+            for row in rows_by_text[text]:
+                summaries[row] = summary
+        return summaries
 
-# 결과 확인
-import pandas as pd
-result_df = pd.read_csv(output_path)
-print(result_df.head())
\ No newline at end of file
+    def submit_batch(self, texts: List[str], requests_path: str) -> str:
+        """
+        텍스트들의 요청 파일(JSONL)을 쓰고 Batch API에 제출해 배치 ID를 반환하는 함수
+        custom_id는 custom_id_for(텍스트)이므로 결과를 같은 텍스트 목록으로 다시 맞출 수 있습니다.
+        """
+        namespace = self.cache_namespace()
+        bodies = {custom_id_for(text, namespace): self.request_body(text) for text in texts}
+        count = write_batch_requests(requests_path, bodies)
+        with open(requests_path, 'rb') as f:
+            uploaded = self.client.files.create(file=f, purpose="batch")
+        batch = self.client.batches.create(input_file_id=uploaded.id, endpoint=BATCH_ENDPOINT,
+                                           completion_window=COMPLETION_WINDOW)
+        logger.info(f"배치 제출: {batch.id} ({count}건, 요청 파일 {requests_path})")
+        return batch.id
+
+    def wait_for_batch(self, batch_id: str, poll_interval: float = BATCH_POLL_INTERVAL,
+                       timeout: Optional[float] = None):
+        """
+        배치가 끝날 때까지 poll_interval초마다 상태를 조회하는 함수 (마지막 배치 객체 반환)
+        timeout초 안에 끝나지 않으면 TimeoutError를 냅니다. 배치는 서버에서 계속 진행되므로
+        나중에 같은 batch_id로 summarize_batch를 다시 호출해 결과를 받을 수 있습니다.
+        """
+        started = time.monotonic()
+        while True:
+            batch = self.client.batches.retrieve(batch_id)
+            counts = batch.request_counts
+            logger.info(f"배치 {batch_id} 상태: {batch.status}"
+                        + (f" ({counts.completed}/{counts.total}, 실패 {counts.failed})" if counts else ""))
+            if batch.status in TERMINAL_STATUSES:
+                return batch
+            if timeout is not None and time.monotonic() - started + poll_interval > timeout:
+                raise TimeoutError(f"배치 {batch_id}가 {timeout}초 안에 끝나지 않았습니다 (상태: {batch.status}).")
+            time.sleep(poll_interval)
+
+    def fetch_batch_results(self, batch) -> dict:
+        """끝난 배치의 결과/오류 파일을 받아 {custom_id: 요약(실패하면 None)}으로 반환하는 함수"""
+        if batch.status == 'failed':
+            raise RuntimeError(f"배치 {batch.id} 실패: {batch.errors}")
+        results = {}
+        # 만료/취소된 배치도 그때까지 끝난 요청의 결과 파일은 남아 있습니다.
+        for file_id in (batch.error_file_id, batch.output_file_id):
+            if file_id:
+                results.update(parse_batch_output(self.client.files.content(file_id).text))
+        return results
+
+    def summarize_batch(self, texts: List[str], requests_path: str = "summary_batch_requests.jsonl",
+                        poll_interval: float = BATCH_POLL_INTERVAL, timeout: Optional[float] = None,
+                        batch_id: Optional[str] = None, retry_failed_online: bool = True) -> List[str]:
+        """
+        Batch API로 여러 텍스트를 요약하는 함수 (결과는 입력 순서대로)
+
+        - 캐시에 있는 텍스트는 제외하고 나머지만 중복 없이 요청 파일에 씁니다.
+        - batch_id를 넘기면 새로 제출하지 않고 그 배치의 결과를 기다려 받습니다 (중단된 실행 이어받기).
+        - 배치에서 실패하거나 결과가 없는 텍스트는 retry_failed_online이면 일반 요청으로 다시 요약하고,
+          그래도 실패하면 FAILED_SUMMARY로 채웁니다.
+        """
+        texts = [str(text) for text in texts]
+        unique_texts = list(dict.fromkeys(texts))
+        namespace = self.cache_namespace()
+        summaries = self.cache.get_many(unique_texts, namespace) if self.cache is not None else {}
+        pending = [text for text in unique_texts if text not in summaries]
+
+        if pending:
+            if batch_id is None:
+                batch_id = self.submit_batch(pending, requests_path)
+            batch = self.wait_for_batch(batch_id, poll_interval=poll_interval, timeout=timeout)
+            results = self.fetch_batch_results(batch)
+            fresh = {}
+            for text in pending:
+                summary = results.get(custom_id_for(text, namespace))
+                if summary is not None:
+                    fresh[text] = summary
+            failed = [text for text in pending if text not in fresh]
+            logger.info(f"배치 결과: 성공 {len(fresh)}건, 실패 {len(failed)}건")
+            if self.cache is not None:
+                self.cache.put_many(fresh, namespace)
+            summaries.update(fresh)
+            if failed and retry_failed_online:
+                logger.info(f"배치에서 실패한 {len(failed)}건을 일반 요청으로 다시 요약합니다.")
+                summaries.update(zip(failed, self.summarize_texts(failed)))
+        return [summaries.get(text, FAILED_SUMMARY) for text in texts]
+
+    def process_csv_batch(self,
+                          csv_path: str,
+                          text_column: str = "content",
+                          output_path: Optional[str] = None,
+                          requests_path: Optional[str] = None,
+                          poll_interval: float = BATCH_POLL_INTERVAL,
+                          timeout: Optional[float] = None,
+                          batch_id: Optional[str] = None) -> str:
+        """
+        process_csv의 Batch API 버전 (야간 일괄 요약용)
+        응답이 늦게(최대 24시간) 오는 대신 대량 요청을 한 번에 처리합니다.
+        requests_path가 None이면 출력 파일 옆에 요청 JSONL 파일을 만듭니다.
+        """
+        df = pd.read_csv(csv_path)
+        logger.info(f"CSV 파일 로드: {len(df)}개 행")
+
+        if output_path is None:
+            output_path = csv_path.replace('.csv', '_with_summaries.csv')
+        if requests_path is None:
+            requests_path = os.path.splitext(output_path)[0] + '_batch_requests.jsonl'
+
+        df['summary'] = self.summarize_batch(df[text_column].tolist(), requests_path=requests_path,
+                                             poll_interval=poll_interval, timeout=timeout, batch_id=batch_id)
+
+        df.to_csv(output_path, index=False, encoding='utf-8-sig')
+        logger.info(f"요약 완료! 결과 파일: {output_path}")
+        return output_path
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    # ArticleSummarizer 인스턴스 생성
+    summarizer = ArticleSummarizer(model="gpt-4o")  # api_key는 None이면 .env에서 자동 로드
+
+    # CSV 파일 경로 지정
+    csv_path = "/Users/woody/smart_summary_bot/naver_news_articles_cleaned.csv"  # 또는 "answer/test_articles.csv" 경로에 따라 수정
+
+    # 요약 실행
+    output_path = summarizer.process_csv(
+        csv_path=csv_path,
+        text_column="content",  # 기사 내용 컬럼명
+        output_path=None        # None이면 자동으로 _with_summaries.csv 생성
+    )
+
+    # 결과 확인
+    result_df = pd.read_csv(output_path)
+    print(result_df.head())
@@ -0,0 +1,4 @@
+"""
+Benchmarks 모듈
+로컬 재생(replay) 서버를 사용해 네트워크 없이 크롤러와 전처리기의 성능을 측정합니다.
+"""
@@ -0,0 +1,67 @@
+# benchmarks/bench_artifacts.py
+"""
+전처리 결과 저장 형식 벤치마크: CSV vs Parquet vs Arrow IPC
+
+같은 전처리 결과를 세 형식으로 저장한 뒤 파일 크기, 저장 시간,
+전체 로드 시간(CSV는 tokens 문자열을 리스트로 다시 파싱하는 시간 포함),
+tokens 컬럼만 읽는 시간을 비교합니다.
+
+사용 예:
+    python -m benchmarks.bench_artifacts --rows 100000
+"""
+
+import argparse
+import ast
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.bench_preprocess import build_frame
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+def load_csv_artifact(path, columns=None):
+    """CSV로 저장한 전처리 결과를 읽고 tokens 문자열을 리스트로 되돌리는 함수"""
+    df = pd.read_csv(path, usecols=columns)
+    if 'tokens' in df.columns:
+        df['tokens'] = df['tokens'].map(ast.literal_eval)
+    return df
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="전처리 결과 저장 형식 벤치마크")
+    parser.add_argument('--rows', type=int, default=50000, help="전처리할 행 수")
+    args = parser.parse_args(argv)
+
+    from preprocessor import load_artifact, preprocess_dataframe, save_artifact
+
+    result = preprocess_dataframe(build_frame(args.rows)).reset_index(drop=True)
+    print(f"전처리 결과 {len(result)}행")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        formats = [
+            ('csv', lambda path: result.to_csv(path, index=False), load_csv_artifact),
+            ('parquet', lambda path: save_artifact(result, path), load_artifact),
+            ('arrow', lambda path: save_artifact(result, path), load_artifact),
+        ]
+        for name, save, load in formats:
+            path = os.path.join(tmp_dir, f'articles.{name}')
+            _, save_seconds = timed(lambda: save(path))
+            loaded, load_seconds = timed(lambda: load(path))
+            tokens, tokens_seconds = timed(lambda: load(path, columns=['tokens']))
+            assert loaded['tokens'].tolist() == result['tokens'].tolist()
+            assert tokens['tokens'].tolist() == result['tokens'].tolist()
+            size_mb = os.path.getsize(path) / (1024 * 1024)
+            print(f"{name:<8} {size_mb:7.1f}MB  저장 {save_seconds:6.2f}초  "
+                  f"전체 로드 {load_seconds:6.2f}초  tokens만 {tokens_seconds:6.2f}초")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# benchmarks/bench_crawler.py
+"""
+크롤러 처리량 벤치마크
+
+로컬 재생 서버에 녹화된 섹션/기사 페이지를 올려 두고
+crawl_news_articles와 crawl_multiple_sections를 동시성 설정별로 실행합니다.
+각 시나리오는 별도 프로세스에서 실행되어 최대 메모리(peak RSS)가 서로 섞이지 않습니다.
+
+사용 예:
+    python -m benchmarks.bench_crawler --sections 7 --articles 50 --latency 0.05 --workers 1,4,8,16
+"""
+
+import argparse
+import json
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.replay_server import ReplayServer
+
+
+def percentile(values, pct):
+    """정렬된 값 목록에서 백분위수를 구하는 함수 (최근접 순위 방식)"""
+    if not values:
+        return 0.0
+    values = sorted(values)
+    rank = max(0, min(len(values) - 1, int(round(pct / 100 * len(values) + 0.5)) - 1))
+    return values[rank]
+
+
+def peak_rss_mb():
+    """현재 프로세스의 최대 RSS(MB)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위입니다.
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_scenario(scenario):
+    """시나리오 하나를 실행하고 결과를 dict로 반환하는 함수 (자식 프로세스에서 실행)"""
+    from crawler import crawler
+    from crawler.http_client import HttpClient
+
+    # 기사별 지연 시간을 재기 위해 get_article_details를 감쌉니다.
+    latencies = []
+    original = crawler.get_article_details
+
+    def timed_get_article_details(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            latencies.append(time.perf_counter() - started)
+
+    crawler.get_article_details = timed_get_article_details
+
+    client = HttpClient(backoff_factor=0.05)
+    started = time.perf_counter()
+    if scenario['target'] == 'crawl_news_articles':
+        first_url = next(iter(scenario['urls'].values()))
+        rows = crawler.crawl_news_articles(first_url, max_workers=scenario['max_workers'],
+                                           client=client, parser=scenario['parser'])
+    else:
+        rows = crawler.crawl_multiple_sections(scenario['urls'], max_workers=scenario['max_workers'],
+                                               client=client, parser=scenario['parser'],
+                                               section_workers=scenario['section_workers'])
+    elapsed = time.perf_counter() - started
+
+    return {
+        'target': scenario['target'],
+        'max_workers': scenario['max_workers'],
+        'section_workers': scenario['section_workers'],
+        'parser': scenario['parser'],
+        'articles': len(rows),
+        'seconds': elapsed,
+        'articles_per_sec': len(rows) / elapsed if elapsed else 0.0,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p95_ms': percentile(latencies, 95) * 1000,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="로컬 재생 서버 기반 크롤러 벤치마크")
+    parser.add_argument('--sections', type=int, default=7, help="섹션 수")
+    parser.add_argument('--articles', type=int, default=50, help="섹션당 기사 수")
+    parser.add_argument('--latency', type=float, default=0.05, help="응답 지연 시간(초)")
+    parser.add_argument('--jitter', type=float, default=0.02, help="응답 지연 시간의 무작위 범위(초)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="503 오류 주입 확률")
+    parser.add_argument('--workers', default='1,4,8,16', help="기사 동시 요청 수 목록 (쉼표 구분)")
+    parser.add_argument('--section-workers', type=int, default=7, help="crawl_multiple_sections의 섹션 동시 실행 수")
+    parser.add_argument('--parser', default=None, help="기사 HTML 파서 백엔드 (기본값: crawler.parsers.DEFAULT_PARSER)")
+    parser.add_argument('--json', dest='json_path', help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args(argv)
+
+    from crawler.parsers import DEFAULT_PARSER
+    parser_backend = args.parser or DEFAULT_PARSER
+    worker_counts = [int(w) for w in args.workers.split(',') if w.strip()]
+
+    results = []
+    with ReplayServer(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate) as server:
+        urls = server.build_site(args.sections, args.articles)
+        for target in ('crawl_news_articles', 'crawl_multiple_sections'):
+            for workers in worker_counts:
+                scenario = {
+                    'target': target,
+                    'urls': urls,
+                    'max_workers': workers,
+                    'section_workers': args.section_workers if target == 'crawl_multiple_sections' else 1,
+                    'parser': parser_backend,
+                }
+                with ProcessPoolExecutor(max_workers=1) as executor:
+                    result = executor.submit(run_scenario, scenario).result()
+                results.append(result)
+                print(f"{result['target']:<24} workers={result['max_workers']:<3} "
+                      f"sections={result['section_workers']:<2} articles={result['articles']:<5} "
+                      f"{result['articles_per_sec']:8.1f} articles/s  "
+                      f"p50={result['p50_ms']:7.1f}ms  p95={result['p95_ms']:7.1f}ms  "
+                      f"peak RSS={result['peak_rss_mb']:6.1f}MB")
+        print(f"서버 요청 {server.requests}회, 주입된 오류 {server.errors}회")
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"결과를 {args.json_path} 파일로 저장했습니다.")
+    return results
+
+
+if __name__ == "__main__":
+    main()
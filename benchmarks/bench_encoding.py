@@ -0,0 +1,84 @@
+# benchmarks/bench_encoding.py
+"""
+CSV 인코딩 판별 벤치마크: 여러 인코딩을 차례로 전체 읽기 vs 앞부분으로 판별 후 한 번 읽기
+
+같은 기사 데이터를 utf-8 / utf-8-sig / cp949 / euc-kr 파일로 만들고 (한글이 파일 뒷부분에서야 나오는 cp949 파일 포함),
+예전 방식(인코딩마다 pd.read_csv를 끝까지 시도)과 현재 _read_csv의 소요 시간을 비교합니다.
+
+사용 예:
+    python -m benchmarks.bench_encoding --rows 200000
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.bench_preprocess import build_frame
+
+ENCODINGS = ['utf-8', 'utf-8-sig', 'cp949', 'euc-kr']
+
+
+def legacy_read_csv(csv_path):
+    """예전 load_csv의 방식: 인코딩마다 파일 전체를 읽어 보다가 처음 성공한 결과를 사용"""
+    for encoding in ['utf-8-sig', 'utf-8', 'cp949', 'euc-kr', 'latin-1']:
+        try:
+            return pd.read_csv(csv_path, encoding=encoding)
+        except (UnicodeDecodeError, UnicodeError):
+            continue
+    raise Exception("Failed to load CSV with any encoding")
+
+
+def timed(fn):
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = fn()
+    return result, time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CSV 인코딩 판별 벤치마크")
+    parser.add_argument('--rows', type=int, default=200000, help="파일당 행 수")
+    args = parser.parse_args(argv)
+
+    from preprocessor.preprocess import _read_csv
+
+    df = build_frame(args.rows).dropna()
+    # euc-kr로 표현할 수 없는 문자가 섞이지 않도록 걸러 둡니다.
+    df = df[df['content'].map(lambda text: _encodable(text, 'euc-kr'))]
+
+    # 영문 행이 앞에 몰려 있어 한글(cp949 바이트)이 파일 뒷부분에서야 나오는 경우
+    english = pd.DataFrame({'content': [f"market update number {i} for overseas readers"
+                                        for i in range(len(df))]})
+    late_korean = pd.concat([english, df], ignore_index=True)
+    fixtures = [(encoding, encoding, df) for encoding in ENCODINGS]
+    fixtures.append(('cp949-late', 'cp949', late_korean))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, encoding, frame in fixtures:
+            csv_path = os.path.join(tmp_dir, f'articles_{name}.csv')
+            frame.to_csv(csv_path, index=False, encoding=encoding)
+            size_mb = os.path.getsize(csv_path) / (1024 * 1024)
+
+            legacy, legacy_seconds = timed(lambda: legacy_read_csv(csv_path))
+            current, current_seconds = timed(lambda: _read_csv(csv_path))
+            pd.testing.assert_frame_equal(current, legacy)
+            print(f"{name:<10} {size_mb:7.1f}MB  예전 {legacy_seconds:6.2f}초  "
+                  f"현재 {current_seconds:6.2f}초 ({current.attrs['source_encoding']})  "
+                  f"{legacy_seconds / current_seconds:5.1f}배")
+
+
+def _encodable(text, encoding):
+    try:
+        text.encode(encoding)
+        return True
+    except UnicodeEncodeError:
+        return False
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# benchmarks/bench_import.py
+"""
+패키지 import 시간 벤치마크
+
+새 파이썬 프로세스에서 패키지를 import하는 데 걸리는 시간을 여러 번 재고,
+import만으로 무거운 모듈(KoNLPy/JVM, NLTK, langdetect 등)이 불러와지지 않는지 확인합니다.
+--max-ms를 넘거나 무거운 모듈이 불러와지면 종료 코드 1로 끝나므로 CI에서 회귀 방지용으로 쓸 수 있습니다.
+
+사용 예:
+    python -m benchmarks.bench_import --repeat 5 --max-ms 1500
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# import만으로는 불러와지면 안 되는 모듈
+HEAVY_MODULES = ['konlpy', 'jpype', 'nltk', 'langdetect']
+
+MEASURE_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps({{'seconds': elapsed, 'heavy': heavy}}))
+"""
+
+
+def measure_import(module, heavy_modules=HEAVY_MODULES):
+    """새 프로세스에서 module을 import하고 (소요 시간, 불러와진 무거운 모듈 목록)을 반환하는 함수"""
+    script = MEASURE_SCRIPT.format(module=module, heavy=list(heavy_modules))
+    output = subprocess.run([sys.executable, '-c', script], cwd=ROOT_DIR,
+                            capture_output=True, text=True, check=True).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    return result['seconds'], result['heavy']
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="패키지 import 시간 벤치마크")
+    parser.add_argument('--module', default='preprocessor', help="측정할 모듈")
+    parser.add_argument('--repeat', type=int, default=5, help="반복 횟수")
+    parser.add_argument('--max-ms', type=float, default=None, help="허용할 import 시간 중앙값(ms)")
+    args = parser.parse_args(argv)
+
+    timings = []
+    heavy = set()
+    for _ in range(args.repeat):
+        seconds, loaded = measure_import(args.module)
+        timings.append(seconds * 1000)
+        heavy.update(loaded)
+
+    median_ms = statistics.median(timings)
+    print(f"import {args.module}: 중앙값 {median_ms:.1f}ms, 최소 {min(timings):.1f}ms, "
+          f"최대 {max(timings):.1f}ms ({args.repeat}회)")
+
+    failed = False
+    if heavy:
+        print(f"import만으로 무거운 모듈이 불러와졌습니다: {sorted(heavy)}")
+        failed = True
+    if args.max_ms is not None and median_ms > args.max_ms:
+        print(f"import 시간이 기준({args.max_ms:.0f}ms)을 넘었습니다.")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+# benchmarks/bench_preprocess.py
+"""
+전처리 벤치마크: 행 단위 처리와 Series 일괄 처리 비교
+
+저장소의 기사 CSV를 바탕으로 원하는 행 수만큼 데이터를 만들고(중복/결측/짧은 행 포함)
+두 경로의 소요 시간을 재고 결과가 같은지 확인합니다.
+
+사용 예:
+    python -m benchmarks.bench_preprocess --rows 100000 --workers 8
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import time
+
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_CSV = os.path.join(ROOT_DIR, 'naver_news_articles.csv')
+
+
+def build_frame(rows, seed=42):
+    """기사 제목을 섞고 변형해서 rows개의 'content' 행을 만드는 함수"""
+    rng = random.Random(seed)
+    titles = pd.read_csv(SOURCE_CSV)['content'].dropna().astype(str).tolist()
+    contents = []
+    for i in range(rows):
+        kind = rng.random()
+        if kind < 0.02:
+            contents.append(None)
+        elif kind < 0.04:
+            contents.append('짧음')
+        else:
+            title = rng.choice(titles)
+            # 절반 정도는 번호를 붙여 고유한 텍스트로, 나머지는 그대로 두어 중복을 만듭니다.
+            contents.append(f"{title} {i}" if kind < 0.5 else title)
+    return pd.DataFrame({'content': contents})
+
+
+def timed(fn):
+    started = time.perf_counter()
+    # 행 단위 처리의 행별 출력은 측정에서 제외합니다.
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = fn()
+    return result, time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="행 단위 / 일괄 전처리 비교 벤치마크")
+    parser.add_argument('--rows', type=int, default=20000, help="생성할 행 수")
+    parser.add_argument('--workers', type=int, default=0,
+                        help="병렬 토큰화 프로세스 수 (0이면 병렬 경로를 측정하지 않음)")
+    parser.add_argument('--chunksize', type=int, default=None, help="워커에 한 번에 넘길 텍스트 수")
+    args = parser.parse_args(argv)
+
+    from preprocessor import preprocess_dataframe
+
+    df = build_frame(args.rows)
+    row_result, row_seconds = timed(lambda: preprocess_dataframe(df.copy(), batch=False))
+    batch_result, batch_seconds = timed(lambda: preprocess_dataframe(df.copy(), batch=True))
+
+    pd.testing.assert_frame_equal(batch_result, row_result)
+    print(f"입력 {len(df)}행 -> 결과 {len(batch_result)}행 (두 경로 결과 동일)")
+    print(f"행 단위: {row_seconds:8.2f}초 ({len(df) / row_seconds:10.0f} rows/s)")
+    print(f"일괄   : {batch_seconds:8.2f}초 ({len(df) / batch_seconds:10.0f} rows/s)")
+    print(f"속도 향상: {row_seconds / batch_seconds:.1f}배")
+
+    if args.workers:
+        from preprocessor import ParallelTokenizer
+
+        # 워커(JVM) 시작 비용은 따로 재고, 띄워 둔 워커로 처리 시간을 잽니다.
+        with ParallelTokenizer(workers=args.workers, chunksize=args.chunksize) as tokenizer:
+            _, startup_seconds = timed(lambda: tokenizer.tokenize(['워커 시작 확인용 문장']))
+            parallel_result, parallel_seconds = timed(
+                lambda: preprocess_dataframe(df.copy(), tokenizer=tokenizer))
+        pd.testing.assert_frame_equal(parallel_result, batch_result)
+        print(f"병렬({args.workers}개 프로세스): {parallel_seconds:8.2f}초 "
+              f"({len(df) / parallel_seconds:10.0f} rows/s, 워커 시작 {startup_seconds:.2f}초 별도)")
+
+
+if __name__ == "__main__":
+    main()
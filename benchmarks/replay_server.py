@@ -0,0 +1,33 @@
+# benchmarks/replay_server.py
+
+from tests.page_server import PageServer, load_article_templates
+
+
+class ReplayServer(PageServer):
+    """
+    녹화된 섹션/기사 HTML을 돌려주는 로컬 HTTP 서버 (tests.page_server.PageServer 사용)
+
+    - latency: 모든 응답에 더할 지연 시간(초), jitter: 지연 시간에 더할 무작위 범위(초)
+    - error_rate: 503 오류를 돌려줄 확률 (seed로 재현 가능)
+    """
+
+    def build_site(self, sections=7, articles_per_section=50):
+        """
+        섹션 페이지와 기사 페이지를 생성해 등록하고 {섹션 이름: 섹션 URL}을 반환하는 함수
+        기사 본문은 저장된 기사 페이지들을 돌아가며 사용합니다.
+        """
+        templates = load_article_templates()
+        urls = {}
+        for s in range(sections):
+            items = []
+            for a in range(articles_per_section):
+                path = f'/mnews/article/{100 + s:03d}/{a:010d}'
+                self.pages[path] = templates[(s * articles_per_section + a) % len(templates)]
+                items.append(
+                    f'<li class="sa_item _SECTION_HEADLINE"><div class="sa_text">'
+                    f'<a href="{self.url(path)}" class="sa_text_title">'
+                    f'<strong class="sa_text_strong">섹션 {s} 기사 {a}</strong></a></div></li>'
+                )
+            self.pages[f'/section/{s}'] = f'<ul class="sa_list">{"".join(items)}</ul>'
+            urls[f'섹션{s}'] = self.url(f'/section/{s}')
+        return urls
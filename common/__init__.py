@@ -0,0 +1,9 @@
+"""
+Common 모듈
+여러 모듈(crawler, preprocessor, answer)이 함께 쓰는 디스크 캐시와 속도 제한 도구
+"""
+
+from .rate_limit import TokenBucket
+from .sqlite_cache import SQLiteLRUCache, content_key
+
+__all__ = ['SQLiteLRUCache', 'TokenBucket', 'content_key']
@@ -0,0 +1,51 @@
+# common/rate_limit.py
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    토큰 버킷 방식의 요청 속도 제한기
+    초당 rate개의 토큰이 채워지고 최대 burst개까지 모아 둘 수 있습니다.
+    allow_debt=True이면 버킷 용량보다 큰 요청도 용량만큼 차면 보내고 모자란 만큼을 음수(빚)로 남겨,
+    다음 요청이 그만큼 더 기다립니다 (LLM 토큰 예산처럼 요청 크기가 제각각인 경우).
+    여러 스레드에서 동시에 사용해도 안전합니다.
+    """
+
+    def __init__(self, rate, burst=None, allow_debt=False):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1, rate)
+        self.allow_debt = allow_debt
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """토큰을 얻을 때까지 기다리는 함수 (기다린 시간을 초 단위로 반환)"""
+        waited = 0.0
+        # 빚을 허용하면 용량보다 큰 요청도 영원히 기다리지 않도록 용량만큼 차면 보냅니다.
+        required = min(tokens, self.capacity) if self.allow_debt else tokens
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= required:
+                    self.tokens -= tokens
+                    return waited
+                wait = (required - self.tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+    def _refill(self):
+        # 호출하는 쪽에서 lock을 잡고 있어야 합니다.
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def set_rate(self, rate):
+        """채우는 속도를 바꾸는 함수 (바꾸기 전까지는 이전 속도로 채움)"""
+        with self._lock:
+            self._refill()
+            self.rate = rate
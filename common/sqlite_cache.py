@@ -0,0 +1,135 @@
+# common/sqlite_cache.py
+
+import hashlib
+import sqlite3
+import threading
+import time
+
+# 한 번의 SQL 문에 넣을 키 수 (SQLite 변수 개수 제한 이내)
+QUERY_BATCH = 500
+# 용량을 넘으면 max_bytes의 이 비율까지 한 번에 줄여서 매번 정리하지 않도록 함
+EVICT_TO_RATIO = 0.9
+
+
+def content_key(text, namespace=''):
+    """텍스트와 네임스페이스로 16바이트 캐시 키를 만드는 함수"""
+    return hashlib.blake2b(f"{namespace}\0{text}".encode('utf-8'), digest_size=16).digest()
+
+
+class SQLiteLRUCache:
+    """
+    키 하나에 값 컬럼 몇 개를 보관하는 SQLite 디스크 캐시의 공통 부분
+
+    - 테이블은 (키, 값 컬럼..., last_access, size)이며, 하위 클래스는 TABLE / KEY_COLUMN / VALUE_COLUMNS와
+      값의 인코딩/디코딩만 정합니다.
+    - 값 크기(size) 합이 max_bytes를 넘으면 가장 오래 사용되지 않은 항목부터 지웁니다(LRU).
+    - COUNTERS는 stats()에 나오는 적중/실패 카운터 이름, HIT_COUNTERS는 그중 hit_ratio에 적중으로 세는 것입니다.
+    """
+
+    TABLE = None
+    KEY_COLUMN = 'key'
+    KEY_TYPE = 'BLOB'
+    VALUE_COLUMNS = ()          # ('summary TEXT NOT NULL', ...)
+    COUNTERS = ('hits', 'misses')
+    HIT_COUNTERS = ('hits',)
+    EVICT_TO_RATIO = EVICT_TO_RATIO
+
+    def __init__(self, path, max_bytes):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._value_names = [column.split()[0] for column in self.VALUE_COLUMNS]
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        columns = ',\n'.join([f"{self.KEY_COLUMN} {self.KEY_TYPE} PRIMARY KEY", *self.VALUE_COLUMNS,
+                              "last_access REAL NOT NULL", "size INTEGER NOT NULL"])
+        self._conn.execute(f"CREATE TABLE IF NOT EXISTS {self.TABLE} (\n{columns}\n)")
+        self._conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{self.TABLE}_last_access ON {self.TABLE} (last_access)"
+        )
+        self._conn.commit()
+        self._total_bytes = self._conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self.TABLE}").fetchone()[0]
+
+        for name in self.COUNTERS:
+            setattr(self, name, 0)
+        self.evictions = 0
+
+    def _fetch(self, keys):
+        """키들의 값 컬럼을 {키: (값...)}으로 조회하고 찾은 항목의 마지막 사용 시각을 갱신하는 함수"""
+        found = {}
+        key_list = list(keys)
+        with self._lock:
+            for start in range(0, len(key_list), QUERY_BATCH):
+                batch = key_list[start:start + QUERY_BATCH]
+                placeholders = ','.join('?' * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT {', '.join([self.KEY_COLUMN, *self._value_names])} FROM {self.TABLE} "
+                    f"WHERE {self.KEY_COLUMN} IN ({placeholders})", batch
+                ).fetchall()
+                for row in rows:
+                    found[row[0]] = row[1:]
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    f"UPDATE {self.TABLE} SET last_access = ? WHERE {self.KEY_COLUMN} = ?",
+                    [(now, key) for key in found]
+                )
+                self._conn.commit()
+        return found
+
+    def _store(self, rows):
+        """(키, (값...), 크기) 목록을 한 번에 저장하고 용량을 넘으면 정리하는 함수"""
+        now = time.time()
+        rows = [(key, *values, now, size) for key, values, size in rows]
+        if not rows:
+            return
+        placeholders_row = ','.join('?' * len(rows[0]))
+        with self._lock:
+            for start in range(0, len(rows), QUERY_BATCH):
+                batch = rows[start:start + QUERY_BATCH]
+                placeholders = ','.join('?' * len(batch))
+                old_size = self._conn.execute(
+                    f"SELECT COALESCE(SUM(size), 0) FROM {self.TABLE} WHERE {self.KEY_COLUMN} IN ({placeholders})",
+                    [row[0] for row in batch]
+                ).fetchone()[0]
+                self._conn.executemany(f"INSERT OR REPLACE INTO {self.TABLE} VALUES ({placeholders_row})", batch)
+                self._total_bytes += sum(row[-1] for row in batch) - old_size
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        # 호출하는 쪽에서 lock을 잡고 있어야 합니다.
+        if self._total_bytes <= self.max_bytes:
+            return
+        target = self.max_bytes * self.EVICT_TO_RATIO
+        victims = []
+        for key, size in self._conn.execute(f"SELECT {self.KEY_COLUMN}, size FROM {self.TABLE} ORDER BY last_access"):
+            if self._total_bytes <= target:
+                break
+            victims.append((key,))
+            self._total_bytes -= size
+        self._conn.executemany(f"DELETE FROM {self.TABLE} WHERE {self.KEY_COLUMN} = ?", victims)
+        self.evictions += len(victims)
+
+    def record(self, kind, count=1):
+        """COUNTERS 중 하나('hits' / 'misses' 등)를 count만큼 올리는 함수"""
+        with self._lock:
+            setattr(self, kind, getattr(self, kind) + count)
+
+    def stats(self):
+        """캐시 적중/실패 통계"""
+        with self._lock:
+            entries = self._conn.execute(f"SELECT COUNT(*) FROM {self.TABLE}").fetchone()[0]
+            counters = {name: getattr(self, name) for name in self.COUNTERS}
+            total = sum(counters.values())
+            hits = sum(counters[name] for name in self.HIT_COUNTERS)
+            return {
+                **counters,
+                'evictions': self.evictions,
+                'hit_ratio': hits / total if total else 0.0,
+                'entries': entries,
+                'bytes': self._total_bytes,
+            }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,88 @@
+# crawler/cache.py
+
+import json
+import time
+import zlib
+from collections import namedtuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from common.sqlite_cache import SQLiteLRUCache
+
+# 캐시에 함께 보관할 응답 헤더 (조건부 요청과 디코딩에 필요한 것만)
+CACHED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+CacheEntry = namedtuple('CacheEntry', ['url', 'body', 'headers', 'encoding', 'fetched_at'])
+
+
+class ResponseCache(SQLiteLRUCache):
+    """
+    URL을 키로 응답 본문을 zlib 압축해 보관하는 SQLite 디스크 캐시
+
+    - trust_hours를 지정하면 저장된 지 N시간 이내의 응답은 네트워크 없이 그대로 사용합니다.
+    - 그 외에는 ETag / Last-Modified로 조건부 요청을 보내 304면 캐시 본문을 재사용합니다.
+    - 압축된 본문 크기 합이 max_bytes를 넘으면 가장 오래 사용되지 않은 항목부터 지웁니다(LRU).
+    """
+
+    TABLE = 'responses'
+    KEY_COLUMN = 'url'
+    KEY_TYPE = 'TEXT'
+    VALUE_COLUMNS = ('body BLOB NOT NULL', 'headers TEXT NOT NULL', 'encoding TEXT', 'fetched_at REAL NOT NULL')
+    # hits: 네트워크 없이 캐시에서 응답, revalidated: 조건부 요청 결과 304로 캐시 재사용,
+    # misses: 캐시에 없거나 변경되어 새로 받은 경우
+    COUNTERS = ('hits', 'revalidated', 'misses')
+    HIT_COUNTERS = ('hits', 'revalidated')
+    # 항목(페이지 본문) 하나가 크므로 용량 안으로 들어올 때까지만 지웁니다.
+    EVICT_TO_RATIO = 1.0
+
+    def __init__(self, path='http_cache.sqlite', max_bytes=200 * 1024 * 1024, trust_hours=None):
+        super().__init__(path, max_bytes)
+        self.trust_hours = trust_hours
+
+    def get(self, url):
+        """캐시 항목을 조회하는 함수 (없으면 None)"""
+        row = self._fetch([url]).get(url)
+        if row is None:
+            return None
+        body, headers, encoding, fetched_at = row
+        return CacheEntry(url, zlib.decompress(body), json.loads(headers), encoding, fetched_at)
+
+    def is_fresh(self, entry):
+        """trust_hours 이내에 저장된 항목인지 확인하는 함수"""
+        if self.trust_hours is None:
+            return False
+        return time.time() - entry.fetched_at < self.trust_hours * 3600
+
+    def put(self, url, response):
+        """200 응답을 압축해 저장하는 함수"""
+        body = zlib.compress(response.content)
+        headers = {name: response.headers[name] for name in CACHED_HEADERS if name in response.headers}
+        self._store([(url, (body, json.dumps(headers), response.encoding, time.time()), len(body))])
+
+    def refresh(self, url):
+        """304 응답을 받은 항목의 저장 시각을 갱신하는 함수"""
+        with self._lock:
+            self._conn.execute("UPDATE responses SET fetched_at = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+
+    def conditional_headers(self, entry):
+        """조건부 요청 헤더(If-None-Match / If-Modified-Since)를 만드는 함수"""
+        headers = {}
+        if 'ETag' in entry.headers:
+            headers['If-None-Match'] = entry.headers['ETag']
+        if 'Last-Modified' in entry.headers:
+            headers['If-Modified-Since'] = entry.headers['Last-Modified']
+        return headers
+
+    def to_response(self, entry):
+        """캐시 항목을 requests.Response 객체로 되돌리는 함수"""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.url = entry.url
+        response._content = entry.body
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response.encoding = entry.encoding
+        response.from_cache = True
+        return response
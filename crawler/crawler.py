@@ -1,66 +1,80 @@
 # crawler/crawler.py
 
-import requests
 from bs4 import BeautifulSoup
-import csv
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-import re
+import logging
+import time
 
-def get_article_details(article_url):
+from .cache import ResponseCache
+from .frontier import CrawlFrontier, date_range
+from .http_client import HttpClient, get_default_client
+from .metrics import NULL_METRICS, CrawlMetrics
+from .parsers import DEFAULT_PARSER, clean_article_text, parse_article_html
+from .rate_limit import HostRateLimiter
+from .seen_index import SeenArticleIndex, parse_article_key
+from .sink import NEWS_FIELDS, CsvSink, open_sink
+
+logger = logging.getLogger(__name__)
+
+# 기사 상세 페이지 요청이 실패했을 때 돌려주는 기본값
+FAILED_DETAILS = ("No Agency", "No Reporter", "No Content")
+
+# 섹션 첫 페이지의 헤드라인 기사 / 딥 크롤링 목록 페이지의 전체 기사
+HEADLINE_SELECTOR = 'li.sa_item._SECTION_HEADLINE'
+DEEP_ARTICLE_SELECTOR = 'li.sa_item'
+
+# 딥 크롤링에서 날짜별 목록 페이지 URL을 만드는 템플릿
+# (task의 section_url, date(YYYYMMDD), page, category 값을 사용할 수 있습니다)
+DEFAULT_PAGE_URL_TEMPLATE = '{section_url}?date={date}&page={page}'
+
+def is_failed_row(row):
+    """상세 페이지 요청에 실패해 기본값(FAILED_DETAILS)만 들어 있는 기사 행인지 확인하는 함수"""
+    return (row['news_agency'], row['reporters'], row['full_content']) == FAILED_DETAILS
+
+def get_article_details(article_url, client=None, parser=DEFAULT_PARSER, metrics=None):
     """
     개별 뉴스 기사 페이지에서 뉴스사, 기자 이름, 기사 본문을 추출하는 함수
+    client를 지정하지 않으면 공유 HttpClient를 사용합니다.
+    parser로 HTML 파서 백엔드('html.parser', 'strainer', 'lxml')를 선택할 수 있습니다.
+    metrics(CrawlMetrics)를 주면 요청/파싱/정리 단계별 시간과 실패를 기록합니다.
     """
+    client = client or get_default_client()
+    metrics = metrics or NULL_METRICS
+    stage = 'article_fetch'
     try:
-        response = requests.get(article_url, headers={'User-Agent': 'Mozilla/5.0'})
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # 뉴스사 추출
-        agency_tag = soup.select_one('a.media_end_head_top_logo img')
-        agency = agency_tag['alt'] if agency_tag and 'alt' in agency_tag.attrs else "No Agency"
-
-        # 기자 이름 추출 (기자가 여러 명일 수 있으므로 모두 찾아서 합칩니다)
-        reporter_tags = soup.select('em.media_end_head_journalist_name')
-        reporters = ", ".join([tag.get_text(strip=True) for tag in reporter_tags])
-        if not reporters:
-            reporters = "No Reporter"
-
-        # 기사 본문 추출
-        content_area = soup.select_one('#dic_area')
-        if content_area:
-            # 불필요한 태그 제거 (테이블, 이미지 캡션 등)
-            for br in content_area.find_all('br'):
-                br.replace_with('\n')
-            
-            # 본문 내의 스팬 태그 제거 (번역 기능 등)
-            for span in content_area.find_all('span'):
-                span.unwrap()
+        with metrics.timer('article_fetch'):
+            response = client.get(article_url)
+        metrics.record_response(response)
 
-            # 본문 텍스트 가져오기
-            content_text = content_area.get_text(strip=True, separator='\n')
-            
-            # 괄호 안의 문자 제거 (예: [헤럴드경제(워싱턴DC)=서영상 기자·문혜현 기자])
-            content_text = re.sub(r'\[.*?\]', '', content_text)
-            
-            # 문장 앞에 나오는 공백 제거
-            content_text = re.sub(r'^\s+', '', content_text, flags=re.MULTILINE)
-        else:
-            content_text = "No Content"
+        stage = 'parse'
+        with metrics.timer('parse'):
+            agency, reporters, content_text = parse_article_html(response.text, parser=parser)
+
+        stage = 'clean'
+        with metrics.timer('clean'):
+            if content_text is not None:
+                content_text = clean_article_text(content_text)
+            else:
+                content_text = "No Content"
+                metrics.incr('articles_without_content')
 
+        metrics.incr('articles')
         return agency, reporters, content_text.strip()
 
     except Exception as e:
-        print(f"Error fetching article details from {article_url}: {e}")
-        return "No Agency", "No Reporter", "No Content"
+        logger.warning("Error fetching article details from %s: %s", article_url, e)
+        metrics.record_failure(stage, article_url, e)
+        return FAILED_DETAILS
 
-def crawl_news_articles(url):
-    response = requests.get(url)
-    soup = BeautifulSoup(response.text, 'html.parser')
+def parse_headlines(html, selector=HEADLINE_SELECTOR):
+    """섹션 페이지 HTML에서 (index, 제목, 링크) 목록을 추출하는 함수"""
+    soup = BeautifulSoup(html, 'html.parser')
     
     # 모든 기사 아이템을 담고 있는 리스트를 찾습니다.
-    article_list = soup.select('li.sa_item._SECTION_HEADLINE')
-    
-    news_data = []
+    article_list = soup.select(selector)
     
+    headlines = []
     for index, article in enumerate(article_list):
         try:
             title_tag = article.select_one('strong.sa_text_strong')
@@ -68,58 +82,280 @@ def crawl_news_articles(url):
             
             title = title_tag.get_text(strip=True) if title_tag else "No Title"
             link = link_tag['href'] if link_tag and 'href' in link_tag.attrs else "No Link"
-            
-            # **새로운 로직: 개별 기사 페이지에서 뉴스사, 기자, 본문 정보를 모두 가져옵니다.**
-            news_agency, reporters, full_content = get_article_details(link)
-
-            current_date = date.today().strftime('%Y-%m-%d')
-
-            news_data.append({
-                'index': index,
-                'content': title,
-                'link': link,
-                'news_agency': news_agency,
-                'reporters': reporters,
-                'full_content': full_content,
-                'date': current_date
-            })
+            headlines.append((index, title, link))
         except Exception as e:
-            print(f"Error processing article at index {index}: {e}")
+            logger.warning("Error processing article at index %d: %s", index, e)
             continue
+    return headlines
+
+def fetch_article_rows(headlines, max_workers=1, client=None, seen_index=None, parser=DEFAULT_PARSER,
+                       category=None, sink=None, article_date=None, metrics=None):
+    """
+    (index, 제목, 링크) 목록의 상세 페이지를 가져와 기사 데이터(dict) 목록을 만드는 함수
 
-    return news_data
+    max_workers가 1보다 크면 개별 기사 페이지를 스레드 풀로 동시에 가져옵니다.
+    동시에 진행되는 요청 수는 max_workers개로 제한되며,
+    반환되는 목록의 순서와 형태는 순차 실행과 동일합니다.
 
-def crawl_multiple_sections(urls_dict):
+    seen_index(SeenArticleIndex)를 주면 증분 모드로 동작합니다.
+    이미 수집한 (oid, aid) 기사는 상세 페이지를 요청하지 않고 결과에서도 제외하며,
+    새로 수집한 기사는 인덱스에 추가됩니다. 인덱스 저장(save)은 호출하는 쪽에서 합니다.
+
+    category를 주면 각 행에 'category' 필드를 넣고,
+    sink(CsvSink / JsonlSink)를 주면 기사 하나가 끝날 때마다 바로 기록합니다.
+    상세 페이지 요청에 실패한 기사(FAILED_DETAILS)는 반환 목록에는 남지만 sink에는 쓰지 않고
+    seen_index에도 넣지 않으므로, 다음 실행에서 다시 시도해 한 번만 기록됩니다.
+    article_date('YYYY-MM-DD')를 주면 'date' 필드에 오늘 날짜 대신 그 값을 넣습니다.
+    metrics(CrawlMetrics)를 주면 단계별 시간, 바이트 수, 상태 코드, 실패를 기록합니다.
+    """
+    client = client or get_default_client()
+
+    # 증분 모드: 이미 수집한 기사는 건너뜁니다.
+    if seen_index is not None:
+        new_headlines = []
+        for index, title, link in headlines:
+            key = parse_article_key(link)
+            if key is not None and key in seen_index:
+                continue
+            new_headlines.append((index, title, link))
+        if metrics is not None:
+            metrics.incr('articles_skipped_seen', len(headlines) - len(new_headlines))
+        headlines = new_headlines
+
+    current_date = article_date or date.today().strftime('%Y-%m-%d')
+
+    def fetch_row(headline):
+        index, title, link = headline
+        news_agency, reporters, full_content = get_article_details(link, client=client, parser=parser,
+                                                                   metrics=metrics)
+        row = {
+            'index': index,
+            'content': title,
+            'link': link,
+            'news_agency': news_agency,
+            'reporters': reporters,
+            'full_content': full_content,
+            'date': current_date
+        }
+        if category is not None:
+            row['category'] = category
+        # 상세 정보를 하나라도 가져온 기사만 기록합니다 (요청 실패 시 다음 실행에서 재시도).
+        if is_failed_row(row):
+            return row
+        if sink is not None:
+            sink.write(row)
+
+        if seen_index is not None:
+            key = parse_article_key(link)
+            if key is not None:
+                seen_index.add(key)
+        return row
+
+    # executor.map은 입력 순서대로 결과를 돌려주므로 기사 순서가 유지됩니다.
+    if max_workers > 1 and len(headlines) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fetch_row, headlines))
+    return [fetch_row(headline) for headline in headlines]
+
+def crawl_news_articles(url, max_workers=1, client=None, seen_index=None, parser=DEFAULT_PARSER,
+                        category=None, sink=None, metrics=None):
+    """
+    섹션 페이지의 헤드라인 기사 목록과 각 기사의 상세 정보를 수집하는 함수
+    옵션(max_workers, seen_index, parser, category, sink, metrics)은 fetch_article_rows와 같습니다.
+    """
+    client = client or get_default_client()
+    recorder = metrics or NULL_METRICS
+
+    # 섹션 페이지는 자주 바뀌므로 캐시가 있어도 항상 변경 여부를 확인합니다.
+    with recorder.timer('section_fetch'):
+        response = client.get(url, revalidate=True)
+    recorder.record_response(response)
+
+    # 1단계: 목록 페이지에서 제목과 링크를 먼저 모읍니다.
+    with recorder.timer('section_parse'):
+        headlines = parse_headlines(response.text)
+    recorder.incr('headlines', len(headlines))
+
+    # 2단계: 개별 기사 페이지에서 뉴스사, 기자, 본문 정보를 가져옵니다.
+    return fetch_article_rows(headlines, max_workers=max_workers, client=client, seen_index=seen_index,
+                              parser=parser, category=category, sink=sink, metrics=metrics)
+
+def crawl_multiple_sections(urls_dict, max_workers=1, client=None, seen_index=None,
+                            parser=DEFAULT_PARSER, section_workers=1, sink=None, collect=True,
+                            metrics=None):
     """
     딕셔너리 형태의 URL 목록을 받아 여러 섹션의 뉴스를 크롤링하는 함수
+    max_workers는 섹션별 기사 상세 페이지의 동시 요청 수입니다.
+    seen_index를 주면 이미 수집한 기사를 건너뛰는 증분 모드로 동작합니다.
+    parser는 기사 상세 페이지의 HTML 파서 백엔드입니다.
+
+    section_workers가 1보다 크면 여러 섹션을 동시에 크롤링합니다.
+    이때 서버에 보내는 전체 요청 속도는 client의 rate_limiter(HostRateLimiter)로 제한됩니다.
+    client를 주지 않으면 호스트별 속도 제한이 걸린 기본 클라이언트(get_default_client)를 사용합니다.
+    결과는 섹션 순서(urls_dict 순서)대로 합쳐지며, 마지막에 섹션별 소요 시간을 출력합니다.
+
+    sink를 주면 기사 하나가 끝날 때마다 바로 파일에 기록합니다.
+    collect=False이면 결과를 메모리에 모으지 않고 빈 리스트를 반환하므로
+    대량 크롤링에서도 메모리 사용량이 섹션 하나 분량으로 유지됩니다.
+
+    metrics(CrawlMetrics)를 주면 단계별 타이머와 카운터를 기록하며, 섹션별 소요 시간도
+    'section' 타이머로 남습니다. 실행이 끝나면 metrics.export_json()으로 요약을 저장하세요.
     """
-    all_news_data = []
-    
-    for category, url in urls_dict.items():
+    def crawl_section(category, url):
         print(f"[{category}] 섹션의 뉴스를 크롤링합니다...")
-        
-        # 기존 함수를 사용하여 각 URL의 데이터를 가져옵니다.
-        section_data = crawl_news_articles(url)
-        
-        # 각 뉴스 데이터에 'category' 필드를 추가합니다.
-        for item in section_data:
-            item['category'] = category
-        
+        started = time.perf_counter()
+
+        # 기존 함수를 사용하여 각 URL의 데이터를 가져옵니다. (각 뉴스 데이터에 'category' 필드 포함)
+        try:
+            section_data = crawl_news_articles(url, max_workers=max_workers, client=client,
+                                               seen_index=seen_index, parser=parser,
+                                               category=category, sink=sink, metrics=metrics)
+        except Exception as e:
+            # 섹션 하나가 실패해도 나머지 섹션은 계속 크롤링합니다.
+            logger.warning("Error crawling section %s (%s): %s", category, url, e)
+            if metrics is not None:
+                metrics.record_failure('section_fetch', url, e)
+            section_data = []
+        count = len(section_data)
+        if metrics is not None:
+            metrics.record_timing('section', time.perf_counter() - started)
+        if not collect:
+            section_data = []
+
+        return section_data, count, time.perf_counter() - started
+
+    started = time.perf_counter()
+    if section_workers > 1 and len(urls_dict) > 1:
+        with ThreadPoolExecutor(max_workers=section_workers) as executor:
+            results = list(executor.map(crawl_section, urls_dict.keys(), urls_dict.values()))
+    else:
+        results = [crawl_section(category, url) for category, url in urls_dict.items()]
+    total_elapsed = time.perf_counter() - started
+
+    all_news_data = []
+    total_count = 0
+    print("섹션별 소요 시간:")
+    for category, (section_data, count, elapsed) in zip(urls_dict, results):
+        print(f"  [{category}] {count}개 기사, {elapsed:.2f}초")
         all_news_data.extend(section_data)
-        
+        total_count += count
+    print(f"  전체 {total_count}개 기사, {total_elapsed:.2f}초")
+
     return all_news_data
 
-def save_data_to_csv(data, filename='naver_news_articles.csv'):
+class _FrontierSink:
+    """
+    기사 행을 원래 sink에 기록한 뒤 frontier 저널에 수집 완료로 남기는 래퍼
+    상세 페이지 요청에 실패한 기사는 sink와 저널 모두에 남기지 않아 다음 실행에서 다시 시도합니다.
+    """
+
+    def __init__(self, frontier, sink=None):
+        self.frontier = frontier
+        self.sink = sink
+
+    def write(self, row):
+        if is_failed_row(row):
+            return
+        if self.sink is not None:
+            self.sink.write(row)
+        self.frontier.record_article(row['link'])
+
+def deep_crawl(urls_dict, start_date, end_date=None, max_pages=10, section_options=None,
+               journal_path='deep_crawl_journal.jsonl', sync_every=5, max_workers=1, client=None,
+               parser=DEFAULT_PARSER, sink=None, page_url_template=DEFAULT_PAGE_URL_TEMPLATE, metrics=None):
+    """
+    섹션별 날짜 목록 페이지를 따라가며 과거 기사까지 수집하는 딥 크롤링 함수
+
+    - start_date ~ end_date(기본값: 오늘) 기간의 날짜마다 1페이지부터 max_pages까지 따라갑니다.
+      목록이 비었거나 이전 페이지와 같은 목록이 다시 나오면 그 날짜의 페이지 탐색을 멈춥니다.
+    - section_options로 섹션별 max_pages / start_date / end_date를 따로 지정할 수 있습니다.
+      예: {"정치": {"max_pages": 30, "start_date": "2025-01-01"}}
+    - 진행 상황은 journal_path의 CrawlFrontier 저널에 남으므로, 중간에 중단되더라도
+      같은 journal_path로 다시 실행하면 완료된 페이지와 기사를 다시 요청하지 않고 이어서 진행합니다.
+    - 수집한 기사는 sink에 바로 기록되며, 이번 실행에서 새로 수집한 기사 수를 반환합니다.
+    - metrics(CrawlMetrics)를 주면 목록 페이지와 기사 단계별 지표를 기록합니다.
+    """
+    client = client or get_default_client()
+    recorder = metrics or NULL_METRICS
+    section_options = section_options or {}
+    end_date = end_date or date.today()
+
+    frontier = CrawlFrontier(journal_path, sync_every=sync_every)
+    if frontier.resumed:
+        print(f"저널에서 이어서 진행합니다: 완료 페이지 {len(frontier.done_pages)}개, "
+              f"수집 기사 {len(frontier.seen_links)}개")
+
+    # 섹션 x 날짜별 첫 페이지를 작업 큐에 넣습니다. (완료된 페이지는 다음 페이지부터 이어집니다)
+    for category, url in urls_dict.items():
+        options = section_options.get(category, {})
+        for day in date_range(options.get('start_date', start_date), options.get('end_date', end_date)):
+            frontier.push({
+                'category': category,
+                'section_url': url,
+                'date': day,
+                'page': 1,
+                'max_pages': options.get('max_pages', max_pages),
+            })
+
+    journaling_sink = _FrontierSink(frontier, sink)
+    collected = 0
+    try:
+        while len(frontier):
+            task = frontier.pop()
+            page_url = page_url_template.format(**task)
+            try:
+                with recorder.timer('section_fetch'):
+                    response = client.get(page_url, revalidate=True)
+                recorder.record_response(response)
+            except Exception as e:
+                # 완료로 기록하지 않으므로 다음 실행에서 다시 시도합니다.
+                logger.warning("Error fetching list page %s: %s", page_url, e)
+                recorder.record_failure('section_fetch', page_url, e)
+                continue
+
+            with recorder.timer('section_parse'):
+                headlines = parse_headlines(response.text, selector=DEEP_ARTICLE_SELECTOR)
+            new_headlines = [h for h in headlines if h[2] not in frontier.seen_links]
+
+            day = task['date']
+            rows = fetch_article_rows(new_headlines, max_workers=max_workers, client=client, parser=parser,
+                                      category=task['category'], sink=journaling_sink,
+                                      article_date=f"{day[:4]}-{day[4:6]}-{day[6:]}", metrics=metrics)
+            collected += sum(not is_failed_row(row) for row in rows)
+
+            # 목록이 비었거나 마지막 페이지가 반복되면 더 이상 다음 페이지로 가지 않습니다.
+            next_task = None
+            first_link = headlines[0][2] if headlines else None
+            if (first_link is not None and first_link != task.get('prev_first_link')
+                    and task['page'] < task['max_pages']):
+                next_task = dict(task, page=task['page'] + 1, prev_first_link=first_link)
+            frontier.record_page(task, next_task)
+    finally:
+        frontier.close()
+
+    print(f"딥 크롤링 완료: 이번 실행에서 {collected}개 기사 수집")
+    return collected
+
+def save_data_to_csv(data, filename='naver_news_articles.csv', fieldnames=None):
+    """
+    기사 데이터 목록을 CSV 파일로 저장하는 함수
+    헤더는 고정 스키마(NEWS_FIELDS)에 데이터에만 있는 필드를 덧붙여 만들므로
+    행마다 필드가 달라도 저장할 수 있습니다.
+    """
     if not data:
         print("No data to save.")
         return
-        
-    # 첫 번째 데이터 항목의 키를 사용하여 CSV 헤더를 자동으로 생성합니다.
-    keys = data[0].keys()
-    with open(filename, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=keys)
-        writer.writeheader()
-        writer.writerows(data)
+
+    if fieldnames is None:
+        fieldnames = list(NEWS_FIELDS)
+        for row in data:
+            for key in row:
+                if key not in fieldnames:
+                    fieldnames.append(key)
+
+    with CsvSink(filename, fieldnames=fieldnames, flush=False) as sink:
+        for row in data:
+            sink.write(row)
     print(f"Successfully saved data to {filename}")
 
 if __name__ == "__main__":
@@ -134,12 +370,32 @@ if __name__ == "__main__":
         "오피니언": "https://news.naver.com/section/110"
     }
     
-    # 1. 새로운 함수를 호출하여 여러 섹션의 데이터를 한 번에 가져옵니다.
-    all_articles = crawl_multiple_sections(naver_urls)
-    
-    if all_articles:
-        # 2. 모든 데이터를 하나의 CSV 파일로 저장합니다.
-        save_data_to_csv(all_articles)
-        print(f"총 {len(all_articles)}개의 기사를 하나의 CSV 파일로 저장했습니다.")
+    # 기사 페이지는 발행 후 거의 바뀌지 않으므로 디스크 캐시를 12시간 동안 신뢰합니다.
+    # 섹션을 동시에 크롤링하더라도 호스트당 초당 5회(순간 최대 10회)를 넘지 않도록 제한합니다.
+    client = HttpClient(cache=ResponseCache('naver_http_cache.sqlite', trust_hours=12),
+                        rate_limiter=HostRateLimiter(rate=5, burst=10))
+
+    # 이전 실행에서 수집한 기사 목록 (매시간 실행 시 새 기사만 가져옵니다)
+    seen_index = SeenArticleIndex('naver_seen_articles.idx')
+
+    # 단계별 소요 시간, 다운로드 바이트 수, 상태 코드, 실패 기록
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+    metrics = CrawlMetrics()
+
+    # 1. 여러 섹션의 기사를 크롤링하면서 끝난 기사부터 바로 CSV 파일에 추가합니다.
+    #    (증분 모드이므로 이전 실행 결과 뒤에 새 기사만 이어서 기록합니다)
+    #    중간에 중단되더라도 이미 기록한 기사는 인덱스에 남겨 다음 실행에서 다시 추가하지 않습니다.
+    try:
+        with open_sink('naver_news_articles.csv', append=True) as sink:
+            crawl_multiple_sections(naver_urls, max_workers=8, client=client, seen_index=seen_index,
+                                    section_workers=len(naver_urls), sink=sink, collect=False,
+                                    metrics=metrics)
+    finally:
+        seen_index.save()
+    print(f"HTTP 캐시 통계: {client.cache.stats()}")
+    print(f"크롤링 지표를 {metrics.export_json('crawl_metrics.json')} 파일로 저장했습니다.")
+
+    if sink.count:
+        print(f"총 {sink.count}개의 새 기사를 {sink.path} 파일에 저장했습니다.")
     else:
-        print("크롤링할 기사가 없습니다. URL을 확인해 주세요.")
\ No newline at end of file
+        print("새로 크롤링한 기사가 없습니다. URL을 확인해 주세요.")
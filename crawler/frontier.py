@@ -0,0 +1,130 @@
+# crawler/frontier.py
+
+import json
+import os
+import threading
+from collections import deque
+from datetime import date, datetime, timedelta
+
+
+def page_key(task):
+    """페이지 작업을 구분하는 키 (섹션|날짜|페이지)"""
+    return f"{task['category']}|{task['date']}|{task['page']}"
+
+
+def date_range(start_date, end_date):
+    """end_date부터 start_date까지 하루씩 거슬러 올라가며 'YYYYMMDD' 문자열을 돌려주는 함수"""
+    start = _to_date(start_date)
+    current = _to_date(end_date)
+    while current >= start:
+        yield current.strftime('%Y%m%d')
+        current -= timedelta(days=1)
+
+
+def _to_date(value):
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value.replace('-', ''), '%Y%m%d').date()
+
+
+class CrawlFrontier:
+    """
+    딥 크롤링용 영구 작업 큐 (frontier)
+
+    완료된 페이지와 기사 링크를 JSON Lines 저널 파일에 계속 덧붙여 기록하고(기록마다 flush),
+    sync_every개 페이지마다 디스크에 fsync하여 체크포인트를 남깁니다.
+    다시 시작하면 저널을 한 번 읽어 완료된 페이지는 건너뛰고,
+    완료된 페이지의 다음 페이지부터 이어서 작업 큐를 복원합니다.
+    """
+
+    def __init__(self, path='deep_crawl_journal.jsonl', sync_every=5):
+        self.path = path
+        self.sync_every = sync_every
+        self.pending = deque()
+        self.done_pages = {}     # page_key -> 다음 페이지 작업 (없으면 None)
+        self.seen_links = set()  # 상세 정보를 이미 수집한 기사 링크
+        self._queued = set()
+        self._pages_since_sync = 0
+        self._lock = threading.Lock()
+
+        needs_newline = False
+        if os.path.exists(path):
+            needs_newline = self._replay()
+        self._file = open(path, 'a', encoding='utf-8')
+        if needs_newline:
+            # 잘린 마지막 줄 뒤에 새 기록이 붙지 않도록 줄을 바꿔 둡니다.
+            self._file.write('\n')
+
+    @property
+    def resumed(self):
+        return bool(self.done_pages or self.seen_links)
+
+    def _replay(self):
+        """저널을 읽어 상태를 복원하는 함수 (마지막 줄이 잘려 있으면 True 반환)"""
+        line = '\n'
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # 강제 종료로 마지막 줄이 잘린 경우
+                    continue
+                if 'article' in record:
+                    self.seen_links.add(record['article'])
+                elif 'page' in record:
+                    self.done_pages[record['page']] = record.get('next')
+        return not line.endswith('\n')
+
+    def push(self, task):
+        """
+        페이지 작업을 큐에 넣는 함수
+        이미 완료된 페이지면 그 페이지에서 이어지는 다음 페이지 작업을 대신 넣습니다.
+        """
+        while task is not None:
+            key = page_key(task)
+            if key not in self.done_pages:
+                if key not in self._queued:
+                    self._queued.add(key)
+                    self.pending.append(task)
+                return
+            task = self.done_pages[key]
+
+    def pop(self):
+        task = self.pending.popleft()
+        self._queued.discard(page_key(task))
+        return task
+
+    def __len__(self):
+        return len(self.pending)
+
+    def record_article(self, link):
+        """기사 하나의 수집이 끝났음을 기록하는 함수"""
+        with self._lock:
+            self.seen_links.add(link)
+            self._file.write(json.dumps({'article': link}, ensure_ascii=False) + '\n')
+            self._file.flush()
+
+    def record_page(self, task, next_task=None):
+        """페이지 하나의 처리가 끝났음을 기록하고 다음 페이지 작업을 큐에 넣는 함수"""
+        key = page_key(task)
+        with self._lock:
+            self.done_pages[key] = next_task
+            self._file.write(json.dumps({'page': key, 'next': next_task}, ensure_ascii=False) + '\n')
+            self._file.flush()
+            self._pages_since_sync += 1
+            if self._pages_since_sync >= self.sync_every:
+                self._sync()
+        if next_task is not None:
+            self.push(next_task)
+
+    def _sync(self):
+        # 호출하는 쪽에서 lock을 잡고 있어야 합니다.
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pages_since_sync = 0
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._sync()
+                self._file.close()
@@ -0,0 +1,171 @@
+# crawler/http_client.py
+
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .rate_limit import HostRateLimiter
+
+# 모든 요청에 공통으로 사용할 헤더
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# (연결 타임아웃, 읽기 타임아웃) 초 단위
+DEFAULT_TIMEOUT = (5, 15)
+
+# 재시도할 HTTP 상태 코드 (요청 과다 + 서버 오류)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# 호스트별 커넥션 풀 크기 (기사 본문 호스트에 요청이 가장 많이 몰립니다)
+HOST_POOL_SIZES = {
+    'news.naver.com': 10,
+    'n.news.naver.com': 20,
+}
+DEFAULT_POOL_SIZE = 10
+
+# 기본 클라이언트의 호스트별 요청 속도 (초당 5회, 순간 최대 10회)
+# 동시 수집(max_workers / section_workers > 1)에서도 호스트에 보내는 요청이 이 속도를 넘지 않습니다.
+DEFAULT_HOST_RATE = 5
+DEFAULT_HOST_BURST = 10
+
+
+class JitterRetry(Retry):
+    """지수 백오프 대기 시간에 무작위 지터를 더하는 재시도 정책"""
+
+    def get_backoff_time(self):
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return 0
+        # 절반은 고정, 절반은 무작위로 두어 동시에 실패한 요청들이 한꺼번에 재시도하지 않게 합니다.
+        return backoff / 2 + random.uniform(0, backoff / 2)
+
+
+class HttpClient:
+    """
+    keep-alive 커넥션 풀을 공유하는 HTTP 클라이언트
+    크롤러와 전처리기의 모든 페이지 요청은 이 클래스를 통해 나갑니다.
+    """
+
+    def __init__(self,
+                 timeout=DEFAULT_TIMEOUT,
+                 retries=3,
+                 backoff_factor=0.5,
+                 host_pool_sizes=None,
+                 default_pool_size=DEFAULT_POOL_SIZE,
+                 headers=None,
+                 cache=None,
+                 rate_limiter=None):
+        self.timeout = timeout
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.session = requests.Session()
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+
+        # rate_limiter가 있으면 429/5xx 재시도는 _send에서 매번 토큰을 받은 뒤 보내고,
+        # 어댑터는 연결 오류만 재시도합니다 (어댑터 안의 재시도는 속도 제한기를 거치지 않음).
+        retry = JitterRetry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES if rate_limiter is None else (),
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+
+        # 기본 어댑터 + 호스트별 어댑터 (requests는 가장 긴 접두사가 일치하는 어댑터를 사용합니다)
+        default_adapter = HTTPAdapter(pool_connections=default_pool_size,
+                                      pool_maxsize=default_pool_size,
+                                      max_retries=retry)
+        self.session.mount('http://', default_adapter)
+        self.session.mount('https://', default_adapter)
+
+        pool_sizes = HOST_POOL_SIZES if host_pool_sizes is None else host_pool_sizes
+        for host, size in pool_sizes.items():
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=size, max_retries=retry)
+            self.session.mount(f'http://{host}/', adapter)
+            self.session.mount(f'https://{host}/', adapter)
+
+    def get(self, url, revalidate=False, **kwargs):
+        """
+        GET 요청 (타임아웃을 지정하지 않으면 기본 타임아웃 정책을 적용)
+
+        캐시가 설정되어 있으면 먼저 캐시를 확인합니다.
+        rate_limiter가 설정되어 있으면 실제 네트워크 요청 전에 호스트별 토큰을 기다립니다.
+        revalidate=True이면 trust_hours와 관계없이 항상 조건부 요청으로 변경 여부를 확인합니다.
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        if self.cache is None:
+            return self._send(url, **kwargs)
+
+        entry = self.cache.get(url)
+        if entry is not None and not revalidate and self.cache.is_fresh(entry):
+            self.cache.record('hits')
+            return self.cache.to_response(entry)
+
+        if entry is not None:
+            headers = dict(kwargs.pop('headers', None) or {})
+            headers.update(self.cache.conditional_headers(entry))
+            kwargs['headers'] = headers
+
+        response = self._send(url, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            self.cache.record('revalidated')
+            self.cache.refresh(url)
+            return self.cache.to_response(entry)
+
+        self.cache.record('misses')
+        if response.status_code == 200:
+            self.cache.put(url, response)
+        return response
+
+    def _send(self, url, **kwargs):
+        if self.rate_limiter is None:
+            return self.session.get(url, **kwargs)
+        for attempt in range(self.retries + 1):
+            self.rate_limiter.acquire(url)
+            response = self.session.get(url, **kwargs)
+            if response.status_code not in RETRY_STATUS_CODES or attempt == self.retries:
+                return response
+            response.close()
+            time.sleep(self._retry_delay(response, attempt))
+
+    def _retry_delay(self, response, attempt):
+        """재시도 전 대기 시간 (Retry-After 헤더가 있으면 그 값, 없으면 JitterRetry와 같은 지터 백오프)"""
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is not None:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+        backoff = self.backoff_factor * (2 ** attempt)
+        return backoff / 2 + random.uniform(0, backoff / 2)
+
+    def close(self):
+        self.session.close()
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client():
+    """
+    프로세스 전체에서 공유하는 기본 HttpClient를 반환하는 함수
+    호스트별 속도 제한기(DEFAULT_HOST_RATE / DEFAULT_HOST_BURST)가 설정되어 있습니다.
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = HttpClient(
+                    rate_limiter=HostRateLimiter(rate=DEFAULT_HOST_RATE, burst=DEFAULT_HOST_BURST)
+                )
+    return _default_client
+
@@ -0,0 +1,135 @@
+# crawler/metrics.py
+
+import json
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+# summary()에 남길 실패 사례의 최대 개수
+MAX_FAILURE_SAMPLES = 50
+
+
+class MetricsHook:
+    """
+    외부 메트릭 시스템(StatsD, Prometheus 등)에 연결하기 위한 훅 인터페이스
+    필요한 메서드만 재정의해서 CrawlMetrics.add_hook()으로 등록하세요.
+    """
+
+    def on_timing(self, stage, seconds):
+        """단계별 소요 시간이 기록될 때 호출됩니다."""
+
+    def on_counter(self, name, value):
+        """카운터가 value만큼 증가할 때 호출됩니다."""
+
+    def on_failure(self, stage, url, error):
+        """요청/파싱 실패가 기록될 때 호출됩니다."""
+
+
+class CrawlMetrics:
+    """
+    크롤링 단계별 타이머와 카운터를 모으는 클래스 (여러 스레드에서 동시에 사용 가능)
+
+    단계(stage): section_fetch, section_parse, article_fetch, parse, clean, section
+    카운터: articles, bytes_downloaded, cache_hits, failures 등
+    """
+
+    def __init__(self, hooks=None):
+        self.started = time.time()
+        self.timers = {}
+        self.counters = Counter()
+        self.status_codes = Counter()
+        self.failures = []
+        self.hooks = list(hooks or [])
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook):
+        self.hooks.append(hook)
+
+    @contextmanager
+    def timer(self, stage):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_timing(stage, time.perf_counter() - started)
+
+    def record_timing(self, stage, seconds):
+        with self._lock:
+            stats = self.timers.setdefault(stage, {'count': 0, 'total': 0.0, 'max': 0.0})
+            stats['count'] += 1
+            stats['total'] += seconds
+            stats['max'] = max(stats['max'], seconds)
+        for hook in self.hooks:
+            hook.on_timing(stage, seconds)
+
+    def incr(self, name, value=1):
+        with self._lock:
+            self.counters[name] += value
+        for hook in self.hooks:
+            hook.on_counter(name, value)
+
+    def record_response(self, response):
+        """HTTP 응답의 상태 코드, 다운로드 바이트 수, 캐시 사용 여부를 기록하는 함수"""
+        with self._lock:
+            self.status_codes[response.status_code] += 1
+        if getattr(response, 'from_cache', False):
+            self.incr('cache_hits')
+        else:
+            self.incr('bytes_downloaded', len(response.content))
+
+    def record_failure(self, stage, url, error):
+        with self._lock:
+            if len(self.failures) < MAX_FAILURE_SAMPLES:
+                self.failures.append({'stage': stage, 'url': url, 'error': repr(error)})
+        self.incr(f'failures.{stage}')
+        for hook in self.hooks:
+            hook.on_failure(stage, url, error)
+
+    def summary(self):
+        """지금까지 모은 지표를 JSON으로 저장할 수 있는 dict로 반환하는 함수"""
+        with self._lock:
+            timers = {
+                stage: {
+                    'count': stats['count'],
+                    'total_sec': round(stats['total'], 6),
+                    'mean_ms': round(stats['total'] / stats['count'] * 1000, 3) if stats['count'] else 0.0,
+                    'max_ms': round(stats['max'] * 1000, 3),
+                }
+                for stage, stats in self.timers.items()
+            }
+            return {
+                'elapsed_sec': round(time.time() - self.started, 3),
+                'timers': timers,
+                'counters': dict(self.counters),
+                'status_codes': {str(code): count for code, count in sorted(self.status_codes.items())},
+                'failures': list(self.failures),
+            }
+
+    def export_json(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.summary(), f, ensure_ascii=False, indent=2)
+        return path
+
+
+class _NullMetrics:
+    """metrics를 지정하지 않았을 때 쓰는 아무 일도 하지 않는 구현"""
+
+    @contextmanager
+    def timer(self, stage):
+        yield
+
+    def record_timing(self, stage, seconds):
+        pass
+
+    def incr(self, name, value=1):
+        pass
+
+    def record_response(self, response):
+        pass
+
+    def record_failure(self, stage, url, error):
+        pass
+
+
+NULL_METRICS = _NullMetrics()
@@ -0,0 +1,184 @@
+# crawler/parsers.py
+
+import logging
+import re
+import threading
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+# lxml (optional) - C로 구현된 파서라 html.parser보다 훨씬 빠릅니다.
+try:
+    import lxml.html
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+logger = logging.getLogger(__name__)
+
+# 사용할 수 있는 파서 백엔드
+# - html.parser: 문서 전체를 BeautifulSoup 트리로 만드는 기존 방식
+# - strainer: 필요한 세 영역(로고, 기자 이름, 본문)의 태그만 트리로 만드는 방식
+# - lxml: lxml로 파싱한 뒤 필요한 요소만 XPath로 찾는 방식
+PARSER_BACKENDS = ('html.parser', 'strainer', 'lxml')
+# 세 백엔드 모두 tests/fixtures 기준으로 같은 결과를 내므로 가장 빠른 것을 기본값으로 사용합니다.
+DEFAULT_PARSER = 'lxml' if HAS_LXML else 'strainer'
+
+# 기사 상세 페이지에서 사용하는 요소
+TARGET_CLASSES = {'media_end_head_top_logo', 'media_end_head_journalist_name'}
+TARGET_IDS = {'dic_area'}
+
+# 스레드별 lxml 파서 (_utf8_html_parser 참고)
+_lxml_parsers = threading.local()
+
+# lxml이 없다는 경고를 이미 남겼는지 (기사마다 반복하지 않도록 한 번만 남깁니다)
+_lxml_fallback_warned = False
+
+# get_text()가 무시하는 태그 (스크립트, 스타일, 루비 주석 등)
+NON_TEXT_TAGS = {'script', 'style', 'template', 'rt', 'rp'}
+
+BRACKET_PATTERN = re.compile(r'\[.*?\]')
+LEADING_SPACE_PATTERN = re.compile(r'^\s+', flags=re.MULTILINE)
+
+
+def _is_target(attrs):
+    """태그 속성이 필요한 영역(로고, 기자 이름, 본문)에 해당하는지 확인하는 함수"""
+    if not attrs:
+        return False
+    if attrs.get('id') in TARGET_IDS:
+        return True
+    classes = attrs.get('class') or ''
+    if isinstance(classes, str):
+        classes = classes.split()
+    return any(c in TARGET_CLASSES for c in classes)
+
+
+class ArticleStrainer(SoupStrainer):
+    """
+    필요한 영역의 태그와 그 하위 트리만 만들도록 하는 SoupStrainer
+    (bs4 4.13 이상은 allow_tag_creation, 그 이전 버전은 search_tag를 사용합니다)
+    """
+
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        return _is_target(attrs)
+
+    def allow_string_creation(self, string):
+        return False
+
+    def search_tag(self, markup_name=None, markup_attrs=None):
+        markup_attrs = markup_attrs or {}
+        return _is_target(dict(markup_attrs) if markup_attrs else None)
+
+
+def _extract_with_soup(soup):
+    """BeautifulSoup 트리에서 뉴스사, 기자, 본문(정리 전)을 추출하는 함수"""
+    # 뉴스사 추출
+    agency_tag = soup.select_one('a.media_end_head_top_logo img')
+    agency = agency_tag['alt'] if agency_tag and 'alt' in agency_tag.attrs else "No Agency"
+
+    # 기자 이름 추출 (기자가 여러 명일 수 있으므로 모두 찾아서 합칩니다)
+    reporter_tags = soup.select('em.media_end_head_journalist_name')
+    reporters = ", ".join([tag.get_text(strip=True) for tag in reporter_tags])
+    if not reporters:
+        reporters = "No Reporter"
+
+    # 기사 본문 추출
+    content_area = soup.select_one('#dic_area')
+    if content_area is None:
+        return agency, reporters, None
+
+    # 불필요한 태그 제거 (테이블, 이미지 캡션 등)
+    for br in content_area.find_all('br'):
+        br.replace_with('\n')
+
+    # 본문 내의 스팬 태그 제거 (번역 기능 등)
+    for span in content_area.find_all('span'):
+        span.unwrap()
+
+    return agency, reporters, content_area.get_text(strip=True, separator='\n')
+
+
+def _lxml_strings(element):
+    """lxml 요소의 텍스트 노드를 문서 순서대로 돌려주는 함수 (BeautifulSoup get_text와 같은 규칙)"""
+    if element.text and element.tag not in NON_TEXT_TAGS:
+        yield element.text
+    for child in element:
+        # 주석/처리 명령은 tag가 문자열이 아니며, 내용은 건너뛰고 뒤따르는 텍스트(tail)만 사용합니다.
+        if isinstance(child.tag, str):
+            yield from _lxml_strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def _lxml_text(element, separator=''):
+    return separator.join(s.strip() for s in _lxml_strings(element) if s.strip())
+
+
+def _has_class(class_name):
+    return f'contains(concat(" ", normalize-space(@class), " "), " {class_name} ")'
+
+
+def _utf8_html_parser():
+    """스레드마다 하나씩 만들어 쓰는 UTF-8 고정 lxml HTML 파서 (파서 객체는 스레드 간에 공유하지 않음)"""
+    parser = getattr(_lxml_parsers, 'utf8', None)
+    if parser is None:
+        parser = _lxml_parsers.utf8 = lxml.html.HTMLParser(encoding='utf-8')
+    return parser
+
+
+def _extract_with_lxml(html):
+    """lxml로 뉴스사, 기자, 본문(정리 전)을 추출하는 함수"""
+    if not html or not html.strip():
+        # lxml은 빈 문서를 오류로 처리하므로 html.parser와 같은 결과를 직접 돌려줍니다.
+        return "No Agency", "No Reporter", None
+    if isinstance(html, str):
+        # lxml은 XML 인코딩 선언(<?xml ... encoding=...?>)이 있는 str을 거부하므로 UTF-8 바이트로 넘기고,
+        # 이미 디코딩된 텍스트이므로 선언된 인코딩 대신 UTF-8로 읽게 합니다.
+        root = lxml.html.fromstring(html.encode('utf-8'), parser=_utf8_html_parser())
+    else:
+        root = lxml.html.fromstring(html)
+
+    agency_tags = root.xpath(f'//a[{_has_class("media_end_head_top_logo")}]//img')
+    agency = agency_tags[0].get('alt') if agency_tags else None
+    if agency is None:
+        agency = "No Agency"
+
+    reporter_tags = root.xpath(f'//em[{_has_class("media_end_head_journalist_name")}]')
+    reporters = ", ".join([_lxml_text(tag) for tag in reporter_tags])
+    if not reporters:
+        reporters = "No Reporter"
+
+    content_areas = root.xpath('//*[@id="dic_area"]')
+    if not content_areas:
+        return agency, reporters, None
+    return agency, reporters, _lxml_text(content_areas[0], separator='\n')
+
+
+def parse_article_html(html, parser=DEFAULT_PARSER):
+    """
+    기사 상세 페이지 HTML에서 (뉴스사, 기자, 본문)을 추출하는 함수
+    본문 영역이 없으면 본문은 None이며, 본문 정리는 clean_article_text에서 합니다.
+    """
+    global _lxml_fallback_warned
+    if parser == 'lxml' and not HAS_LXML:
+        if not _lxml_fallback_warned:
+            logger.warning("lxml이 설치되어 있지 않아 'strainer' 파서로 대신 파싱합니다")
+            _lxml_fallback_warned = True
+        parser = 'strainer'
+
+    if parser == 'html.parser':
+        return _extract_with_soup(BeautifulSoup(html, 'html.parser'))
+    if parser == 'strainer':
+        return _extract_with_soup(BeautifulSoup(html, 'html.parser', parse_only=ArticleStrainer()))
+    if parser == 'lxml':
+        return _extract_with_lxml(html)
+    raise ValueError(f"지원하지 않는 파서입니다: {parser} (사용 가능: {', '.join(PARSER_BACKENDS)})")
+
+
+def clean_article_text(content_text):
+    """추출한 본문 텍스트를 정리하는 함수"""
+    # 괄호 안의 문자 제거 (예: [헤럴드경제(워싱턴DC)=서영상 기자·문혜현 기자])
+    content_text = BRACKET_PATTERN.sub('', content_text)
+
+    # 문장 앞에 나오는 공백 제거
+    content_text = LEADING_SPACE_PATTERN.sub('', content_text)
+    return content_text
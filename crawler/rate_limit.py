@@ -0,0 +1,34 @@
+# crawler/rate_limit.py
+
+import threading
+from urllib.parse import urlsplit
+
+# TokenBucket은 answer 모듈과 함께 쓰므로 common.rate_limit에 있습니다 (기존 import 경로도 유지).
+from common.rate_limit import TokenBucket
+
+
+class HostRateLimiter:
+    """
+    호스트별로 토큰 버킷을 따로 두는 속도 제한기
+    host_rates로 특정 호스트의 (rate, burst)를 따로 지정할 수 있습니다.
+    """
+
+    def __init__(self, rate=5, burst=10, host_rates=None):
+        self.rate = rate
+        self.burst = burst
+        self.host_rates = host_rates or {}
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket_for(self, host):
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, burst = self.host_rates.get(host, (self.rate, self.burst))
+                bucket = TokenBucket(rate, burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def acquire(self, url):
+        """URL의 호스트에 요청을 보내도 될 때까지 기다리는 함수"""
+        return self.bucket_for(urlsplit(url).hostname or '').acquire()
@@ -0,0 +1,59 @@
+# crawler/seen_index.py
+
+import os
+import re
+import threading
+from array import array
+
+# 네이버 기사 링크의 (언론사 id, 기사 id) 부분
+# 예: https://n.news.naver.com/mnews/article/015/0005175719 -> ('015', '0005175719')
+ARTICLE_KEY_PATTERN = re.compile(r'/article/(\d{3})/(\d{1,10})(?:\D|$)')
+
+
+def parse_article_key(link):
+    """
+    기사 링크에서 (oid, aid)를 추출해 하나의 정수 키로 만드는 함수
+    네이버 기사 형식이 아닌 링크는 None을 반환합니다.
+    """
+    match = ARTICLE_KEY_PATTERN.search(link or '')
+    if not match:
+        return None
+    oid, aid = match.groups()
+    # aid는 최대 10자리이므로 oid * 10^10 + aid는 64비트 정수 안에 들어갑니다.
+    return int(oid) * 10 ** 10 + int(aid)
+
+
+class SeenArticleIndex:
+    """
+    이미 수집한 기사 키를 보관하는 영구 인덱스
+    파일에는 정렬된 64비트 정수 배열로 저장되어 기사당 8바이트만 차지합니다.
+    """
+
+    def __init__(self, path='seen_articles.idx'):
+        self.path = path
+        self._lock = threading.Lock()
+        self._keys = set()
+        if os.path.exists(path):
+            keys = array('Q')
+            with open(path, 'rb') as f:
+                keys.frombytes(f.read())
+            self._keys.update(keys)
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def __len__(self):
+        return len(self._keys)
+
+    def add(self, key):
+        with self._lock:
+            self._keys.add(key)
+
+    def save(self):
+        """인덱스를 파일로 저장하는 함수 (임시 파일에 쓴 뒤 교체하므로 중간에 끊겨도 안전합니다)"""
+        with self._lock:
+            keys = array('Q', sorted(self._keys))
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            keys.tofile(f)
+        os.replace(tmp_path, self.path)
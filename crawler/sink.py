@@ -0,0 +1,89 @@
+# crawler/sink.py
+
+import csv
+import json
+import os
+import threading
+
+# 크롤러가 만드는 기사 데이터의 고정 스키마 (CSV 헤더 순서)
+NEWS_FIELDS = ['index', 'content', 'link', 'news_agency', 'reporters', 'full_content', 'date', 'category']
+
+
+class CsvSink:
+    """
+    기사 데이터를 한 행씩 바로 CSV 파일에 쓰는 스트리밍 출력
+    행마다 flush하므로 크롤링이 중간에 죽어도 이미 끝난 행은 파일에 남습니다.
+    스키마(fieldnames)를 미리 고정하므로 없는 필드는 빈 값, 모르는 필드는 무시합니다.
+    """
+
+    def __init__(self, path, fieldnames=NEWS_FIELDS, append=False, flush=True):
+        self.path = path
+        self.fieldnames = list(fieldnames)
+        self.flush = flush
+        self.count = 0
+        self._lock = threading.Lock()
+
+        write_header = not (append and os.path.exists(path) and os.path.getsize(path) > 0)
+        self._file = open(path, 'a' if append else 'w', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames,
+                                      restval='', extrasaction='ignore')
+        if write_header:
+            self._writer.writeheader()
+            self._file.flush()
+
+    def write(self, row):
+        with self._lock:
+            self._writer.writerow(row)
+            if self.flush:
+                self._file.flush()
+            self.count += 1
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class JsonlSink:
+    """기사 데이터를 한 행씩 JSON Lines 파일에 쓰는 스트리밍 출력 (CsvSink와 같은 규칙)"""
+
+    def __init__(self, path, fieldnames=NEWS_FIELDS, append=False, flush=True):
+        self.path = path
+        self.fieldnames = list(fieldnames)
+        self.flush = flush
+        self.count = 0
+        self._lock = threading.Lock()
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8')
+
+    def write(self, row):
+        record = {name: row.get(name, '') for name in self.fieldnames}
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + '\n')
+            if self.flush:
+                self._file.flush()
+            self.count += 1
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def open_sink(path, fieldnames=NEWS_FIELDS, append=False):
+    """파일 확장자(.jsonl / .csv)에 맞는 스트리밍 출력을 여는 함수"""
+    if path.endswith('.jsonl'):
+        return JsonlSink(path, fieldnames=fieldnames, append=append)
+    return CsvSink(path, fieldnames=fieldnames, append=append)
@@ -4,14 +4,43 @@ from .preprocess import (
     clean_text,
     tokenize_and_normalize,
     load_csv,
+    detect_csv_encoding,
+    preprocess_dataframe,
     load_article,
-    load_and_preprocess
+    load_and_preprocess,
+    configure_token_cache
 )
+from .artifacts import ArtifactWriter, iter_artifact, load_artifact, save_artifact
+from .language import detect_language_batch, detect_language_safe, language_detection_stats
+from .near_dup import NearDuplicateIndex, mark_near_duplicates
+from .parallel import ParallelTokenizer, tokenize_texts
+from .stats import PreprocessStats, set_verbosity
+from .streaming import load_and_preprocess_chunks, load_csv_chunks
+from .token_cache import TokenCache
 
 __all__ = [
     "clean_text",
     "tokenize_and_normalize",
     "load_csv",
+    "detect_csv_encoding",
+    "preprocess_dataframe",
     "load_article",
-    "load_and_preprocess"
+    "load_and_preprocess",
+    "load_csv_chunks",
+    "load_and_preprocess_chunks",
+    "configure_token_cache",
+    "save_artifact",
+    "load_artifact",
+    "iter_artifact",
+    "ArtifactWriter",
+    "detect_language_safe",
+    "detect_language_batch",
+    "language_detection_stats",
+    "NearDuplicateIndex",
+    "mark_near_duplicates",
+    "ParallelTokenizer",
+    "PreprocessStats",
+    "set_verbosity",
+    "tokenize_texts",
+    "TokenCache"
 ]
@@ -0,0 +1,225 @@
+# preprocessor/artifacts.py
+"""
+전처리 결과를 컬럼 기반 파일(Parquet / Arrow IPC)로 저장하고 다시 읽는 함수들
+
+CSV로 저장하면 tokens 리스트가 문자열로 바뀌어 다음 단계에서 다시 파싱하거나 토큰화해야 합니다.
+여기서는 tokens를 list<string> 컬럼 그대로 저장하므로 읽을 때 리스트로 바로 돌아옵니다.
+
+- '.parquet': 압축(zstd)과 사전 인코딩이 적용되어 파일이 작습니다. 필요한 컬럼만 읽습니다.
+- '.arrow' / '.feather': 압축하지 않은 Arrow IPC 파일이라 메모리 맵으로 열면 복사 없이 바로 씁니다.
+  여러 단계가 같은 파일을 반복해서 읽을 때 유리합니다.
+- df.attrs(source_path, source_encoding, preprocess_stats)와 토큰화 백엔드 정보는 스키마 메타데이터로 함께 저장됩니다.
+
+pyarrow는 선택 의존성입니다. 설치되어 있지 않으면 저장/읽기 함수가 ImportError를 냅니다.
+"""
+
+import json
+import logging
+import os
+from importlib.util import find_spec
+from typing import Iterator
+
+import pandas as pd
+
+from .preprocess import token_cache_namespace
+
+logger = logging.getLogger(__name__)
+
+# 선택 의존성 설치 여부 (실제 import 없이 확인)
+HAS_PYARROW = find_spec('pyarrow') is not None
+
+# 확장자 -> 파일 형식
+ARTIFACT_FORMATS = {
+    '.parquet': 'parquet',
+    '.arrow': 'arrow',
+    '.feather': 'arrow',
+}
+ARTIFACT_VERSION = 1
+# 스키마 메타데이터에서 이 패키지가 쓰는 키
+METADATA_KEY = b'smart_summary_bot'
+PARQUET_COMPRESSION = 'zstd'
+# iter_artifact가 한 번에 읽는 기본 행 수
+DEFAULT_BATCH_ROWS = 10000
+
+
+def _pyarrow():
+    if not HAS_PYARROW:
+        raise ImportError("pyarrow가 설치되어 있지 않습니다. 'pip install pyarrow'로 설치하세요.")
+    import pyarrow
+    return pyarrow
+
+
+def artifact_format(path, format=None):
+    """파일 형식('parquet' / 'arrow')을 정하는 함수 (format이 없으면 확장자로 판단)"""
+    if format is None:
+        format = ARTIFACT_FORMATS.get(os.path.splitext(str(path))[1].lower())
+    if format not in ('parquet', 'arrow'):
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {path} (.parquet, .arrow, .feather 중 하나를 사용하세요)")
+    return format
+
+
+def _column_types():
+    """전처리 결과 컬럼의 Arrow 타입 (이 밖의 컬럼은 pyarrow가 추론)"""
+    pa = _pyarrow()
+    return {
+        'content': pa.string(),
+        'content_clean': pa.string(),
+        'tokens': pa.list_(pa.string()),
+        'dup_cluster': pa.int64(),
+        'is_canonical': pa.bool_(),
+    }
+
+
+def _metadata(attrs):
+    """스키마 메타데이터에 넣을 JSON (df.attrs와 토큰화 백엔드/버전)"""
+    return json.dumps({
+        'version': ARTIFACT_VERSION,
+        'tokenizer': token_cache_namespace(),
+        'attrs': attrs,
+    }, ensure_ascii=False, default=str).encode('utf-8')
+
+
+def to_arrow_table(df: pd.DataFrame, schema=None):
+    """
+    전처리 결과 DataFrame을 pyarrow Table로 바꾸는 함수
+    index는 저장하지 않습니다. schema를 넘기면 그 스키마에 맞춰 변환합니다 (청크를 같은 파일에 이어 쓸 때).
+    """
+    pa = _pyarrow()
+    if schema is not None:
+        arrays = [pa.array(df[field.name], type=field.type, from_pandas=True) for field in schema]
+        return pa.Table.from_arrays(arrays, schema=schema)
+
+    types = _column_types()
+    arrays = [pa.array(df[column], type=types.get(column), from_pandas=True) for column in df.columns]
+    table = pa.Table.from_arrays(arrays, names=[str(column) for column in df.columns])
+    return table.replace_schema_metadata({METADATA_KEY: _metadata(dict(df.attrs))})
+
+
+class ArtifactWriter:
+    """
+    전처리 결과를 청크 단위로 한 파일에 이어 쓰는 클래스 (load_csv_chunks 결과 저장용)
+    스키마와 메타데이터는 처음 쓴 청크를 따르며, Parquet은 청크마다 row group, Arrow는 record batch가 됩니다.
+    """
+
+    def __init__(self, path, format=None, compression=PARQUET_COMPRESSION):
+        self.path = path
+        self.format = artifact_format(path, format)
+        self.compression = compression
+        self.rows = 0
+        self._writer = None
+        self._schema = None
+
+    def write(self, df: pd.DataFrame):
+        if df.empty and self._writer is not None:
+            return
+        table = to_arrow_table(df, schema=self._schema)
+        if self._writer is None:
+            self._schema = table.schema
+            self._writer = self._open(table.schema)
+        self._writer.write_table(table)
+        self.rows += len(df)
+
+    def _open(self, schema):
+        pa = _pyarrow()
+        if self.format == 'parquet':
+            import pyarrow.parquet as pq
+            return pq.ParquetWriter(self.path, schema, compression=self.compression)
+        return pa.ipc.new_file(self.path, schema)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            logger.info(f"전처리 결과 저장: {self.path} ({self.rows}행, {self.format})")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def save_artifact(df: pd.DataFrame, path, format=None, compression=PARQUET_COMPRESSION):
+    """전처리 결과 DataFrame을 Parquet 또는 Arrow IPC 파일로 저장하는 함수"""
+    with ArtifactWriter(path, format=format, compression=compression) as writer:
+        writer.write(df)
+    return path
+
+
+def read_artifact_table(path, columns=None, memory_map=True, format=None):
+    """
+    저장된 전처리 결과를 pyarrow Table로 읽는 함수
+    columns를 지정하면 그 컬럼만 읽습니다. Arrow IPC 파일을 memory_map으로 열면
+    데이터를 복사하지 않고 실제로 접근한 컬럼의 페이지만 디스크에서 읽힙니다.
+    """
+    pa = _pyarrow()
+    if artifact_format(path, format) == 'parquet':
+        import pyarrow.parquet as pq
+        return pq.read_table(path, columns=columns, memory_map=memory_map)
+
+    source = pa.memory_map(str(path), 'r') if memory_map else pa.OSFile(str(path), 'rb')
+    table = pa.ipc.open_file(source).read_all()
+    return table.select(columns) if columns is not None else table
+
+
+def artifact_metadata(table_or_schema):
+    """Table(또는 스키마)에 저장된 메타데이터 dict (없으면 빈 dict)"""
+    schema = getattr(table_or_schema, 'schema', table_or_schema)
+    raw = (schema.metadata or {}).get(METADATA_KEY)
+    return json.loads(raw) if raw else {}
+
+
+def to_dataframe(table) -> pd.DataFrame:
+    """
+    pyarrow Table을 DataFrame으로 바꾸는 함수
+    tokens는 load_csv 결과와 같이 행마다 파이썬 리스트가 되고, 저장할 때의 df.attrs가 복원됩니다.
+    문자열 컬럼은 pandas 문자열 dtype이므로 정규식 처리는 clean_text_series처럼 object로 바꿔서 하세요.
+    """
+    list_columns = [field.name for field in table.schema if _is_list_type(field.type)]
+    df = table.drop_columns(list_columns).to_pandas()
+    for column in list_columns:
+        position = table.schema.get_field_index(column)
+        df.insert(position, column, pd.Series(table.column(column).to_pylist(), dtype=object))
+
+    metadata = artifact_metadata(table)
+    df.attrs.update(metadata.get('attrs', {}))
+    if metadata.get('tokenizer'):
+        df.attrs['tokenizer'] = metadata['tokenizer']
+    return df
+
+
+def _is_list_type(arrow_type):
+    pa = _pyarrow()
+    return pa.types.is_list(arrow_type) or pa.types.is_large_list(arrow_type)
+
+
+def load_artifact(path, columns=None, memory_map=True, format=None) -> pd.DataFrame:
+    """
+    save_artifact로 저장한 파일을 DataFrame으로 읽는 함수
+    columns를 지정하면 그 컬럼만 읽습니다 (예: 요약 단계는 ['content']만).
+    """
+    table = read_artifact_table(path, columns=columns, memory_map=memory_map, format=format)
+    logger.info(f"전처리 결과 로드: {path} ({table.num_rows}행, 컬럼 {table.column_names})")
+    return to_dataframe(table)
+
+
+def iter_artifact(path, columns=None, batch_rows: int = DEFAULT_BATCH_ROWS,
+                  memory_map=True, format=None) -> Iterator[pd.DataFrame]:
+    """
+    저장된 전처리 결과를 batch_rows 행씩 DataFrame으로 내보내는 제너레이터
+    파일 전체를 DataFrame으로 만들지 않으므로 큰 결과도 일정한 메모리 안에서 처리할 수 있습니다.
+    """
+    if artifact_format(path, format) == 'parquet':
+        import pyarrow.parquet as pq
+        parquet_file = pq.ParquetFile(path, memory_map=memory_map)
+        schema = parquet_file.schema_arrow
+        batches = parquet_file.iter_batches(batch_size=batch_rows, columns=columns)
+    else:
+        table = read_artifact_table(path, columns=columns, memory_map=memory_map, format=format)
+        schema = table.schema
+        batches = table.to_batches(max_chunksize=batch_rows)
+
+    pa = _pyarrow()
+    for batch in batches:
+        table = pa.Table.from_batches([batch]).replace_schema_metadata(schema.metadata)
+        yield to_dataframe(table)
@@ -0,0 +1,118 @@
+# preprocessor/language.py
+"""
+단계별(tiered) 언어 감지
+
+1. 짧은 텍스트(3자 미만)는 'en'
+2. 한글 비율이 충분히 높으면 바로 'ko', 한글 없이 라틴 문자 비율이 높으면 바로 'en'
+3. 그 외 애매한 텍스트만 langdetect로 판정 (seed 고정)
+4. langdetect가 없거나 실패하면 한글 문자 수로 판단
+
+비율은 공백을 뺀 문자 수 기준이며, 단계별로 몇 번 쓰였는지 language_detection_stats()로 확인할 수 있습니다.
+"""
+
+import re
+import threading
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from .resources import get_language_detector
+
+HANGUL_PATTERN = re.compile(r'[가-힣]')
+LATIN_PATTERN = re.compile(r'[A-Za-z]')
+SPACE_PATTERN = re.compile(r'\s')
+
+# 이 비율 이상이면 langdetect 없이 판정
+KOREAN_CONFIDENT_RATIO = 0.3
+ENGLISH_CONFIDENT_RATIO = 0.5
+# 이보다 짧은 텍스트는 감지하지 않고 'en'
+MIN_DETECT_LENGTH = 3
+
+# 단계 이름: short / hangul / latin / langdetect / heuristic
+_stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def _record(tier, count=1):
+    if count:
+        with _stats_lock:
+            _stats[tier] += count
+
+
+def language_detection_stats():
+    """단계별 판정 횟수와 langdetect(느린 경로)를 쓴 비율"""
+    with _stats_lock:
+        stats = dict(_stats)
+    total = sum(stats.values())
+    stats['slow_path_ratio'] = stats.get('langdetect', 0) / total if total else 0.0
+    return stats
+
+
+def reset_language_detection_stats():
+    with _stats_lock:
+        _stats.clear()
+
+
+def _slow_language(text, hangul):
+    """애매한 텍스트를 langdetect(없거나 실패하면 한글 문자 수)로 판정하는 함수"""
+    detect = get_language_detector()
+    if detect is None:
+        _record('heuristic')
+        return 'ko' if hangul > len(text) * 0.1 else 'en'
+    try:
+        lang = detect(text)
+        _record('langdetect')
+        return lang
+    except Exception:
+        # 폴백: 한글 문자 비율로 판단
+        _record('heuristic')
+        return 'ko' if hangul > 0 else 'en'
+
+
+def detect_language_safe(text):
+    """안전한 언어 감지 (한글/라틴 문자 비율로 먼저 판정하고 애매할 때만 langdetect 사용)"""
+    if not text or len(text.strip()) < MIN_DETECT_LENGTH:
+        _record('short')
+        return 'en'
+
+    hangul = len(HANGUL_PATTERN.findall(text))
+    chars = len(text) - len(SPACE_PATTERN.findall(text))
+    if chars:
+        if hangul / chars >= KOREAN_CONFIDENT_RATIO:
+            _record('hangul')
+            return 'ko'
+        if hangul == 0 and len(LATIN_PATTERN.findall(text)) / chars >= ENGLISH_CONFIDENT_RATIO:
+            _record('latin')
+            return 'en'
+    return _slow_language(text, hangul)
+
+
+def detect_language_batch(texts: pd.Series) -> pd.Series:
+    """
+    Series 전체의 언어를 한 번에 감지하는 함수 (detect_language_safe와 같은 결과, 같은 index)
+    문자 비율은 Series 연산으로 계산하고, 애매한 텍스트만 하나씩 langdetect로 판정합니다.
+    """
+    # 파이썬 re로 처리되도록 object dtype으로 맞춥니다 (clean_text_series 참고).
+    texts = texts.fillna('').astype(object).map(str)
+    if texts.empty:
+        return pd.Series([], index=texts.index, dtype=object)
+
+    short = texts.str.strip().str.len() < MIN_DETECT_LENGTH
+    hangul = texts.str.count(HANGUL_PATTERN.pattern)
+    latin = texts.str.count(LATIN_PATTERN.pattern)
+    chars = (texts.str.len() - texts.str.count(SPACE_PATTERN.pattern)).astype(float)
+    chars = chars.where(chars > 0)  # 0이면 NaN이 되어 아래 비교가 모두 False
+
+    korean = ~short & (hangul / chars >= KOREAN_CONFIDENT_RATIO)
+    english = ~short & ~korean & (hangul == 0) & (latin / chars >= ENGLISH_CONFIDENT_RATIO)
+    ambiguous = ~short & ~korean & ~english
+
+    _record('short', int(short.sum()))
+    _record('hangul', int(korean.sum()))
+    _record('latin', int(english.sum()))
+
+    langs = np.where(korean.to_numpy(), 'ko', 'en').astype(object)
+    for pos in np.flatnonzero(ambiguous.to_numpy()):
+        langs[pos] = _slow_language(texts.iat[pos], int(hangul.iat[pos]))
+    return pd.Series(langs, index=texts.index, dtype=object)
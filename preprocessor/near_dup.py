@@ -0,0 +1,153 @@
+# preprocessor/near_dup.py
+"""
+MinHash + LSH 기반 유사 중복(near-duplicate) 기사 탐지
+
+같은 통신사 기사를 여러 언론사가 조금씩 고쳐 쓴 경우처럼 content_clean이 완전히 같지는 않지만
+거의 같은 기사를 묶어 클러스터 번호와 대표 기사(canonical)를 정합니다.
+
+- 텍스트를 글자 단위 shingle(기본 5글자)로 나누고 MinHash 서명(기본 128개 해시)을 만듭니다.
+- 서명을 band로 나눈 LSH 버킷에서 후보만 찾아 비교하므로 전체 쌍을 비교하지 않습니다(문서 수에 거의 비례).
+  band 구성은 threshold에 맞춰 자동으로 고릅니다(choose_bands).
+- 후보와 추정 Jaccard 유사도가 threshold 이상이면 같은 클러스터로 묶습니다.
+  새 문서는 기존 대표 기사와만 비교하므로 클러스터의 모든 문서는 대표 기사와 threshold 이상 유사합니다.
+- 대표 기사는 클러스터에서 가장 먼저 들어온 문서입니다 (완전 중복 제거의 keep='first'와 같은 기준).
+"""
+
+import zlib
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_THRESHOLD = 0.8
+DEFAULT_NUM_PERM = 128
+DEFAULT_SHINGLE_SIZE = 5
+# 2^32보다 큰 소수 (해시 a*x + b가 64비트 안에서 계산되도록 a, b, x는 32비트)
+MERSENNE_PRIME = (1 << 32) + 15
+MAX_HASH = (1 << 32) - 1
+# choose_bands에서 놓치는 쌍(거짓 음성)에 두는 가중치
+FALSE_NEGATIVE_WEIGHT = 0.9
+
+
+def shingle_hashes(text, shingle_size=DEFAULT_SHINGLE_SIZE):
+    """텍스트를 글자 shingle로 나눠 32비트 해시 배열로 반환하는 함수"""
+    text = ' '.join(str(text).lower().split())
+    if len(text) <= shingle_size:
+        shingles = {text}
+    else:
+        shingles = {text[i:i + shingle_size] for i in range(len(text) - shingle_size + 1)}
+    return np.fromiter((zlib.crc32(s.encode('utf-8')) for s in shingles),
+                       dtype=np.uint64, count=len(shingles))
+
+
+def _area(y, x):
+    """사다리꼴 공식으로 구한 곡선 아래 면적"""
+    return float(np.sum((y[1:] + y[:-1]) / 2 * np.diff(x)))
+
+
+@lru_cache(maxsize=None)
+def choose_bands(threshold, num_perm, false_negative_weight=FALSE_NEGATIVE_WEIGHT):
+    """
+    LSH의 band 수와 band당 행 수(bands x rows <= num_perm)를 고르는 함수
+
+    후보가 될 확률 P(s) = 1 - (1 - s^rows)^bands에 대해
+    threshold 아래에서 후보가 되는 면적(거짓 양성)과 위에서 놓치는 면적(거짓 음성)의
+    가중합이 가장 작은 조합을 고릅니다. 후보는 서명 유사도로 다시 확인하므로 놓치는 쪽에 더 큰 가중치를 둡니다.
+    """
+    below = np.linspace(0, threshold, 200)
+    above = np.linspace(threshold, 1, 200)
+    best = None
+    for bands in range(1, num_perm + 1):
+        for rows in range(1, num_perm // bands + 1):
+            false_positive = _area(1 - (1 - below ** rows) ** bands, below)
+            false_negative = _area((1 - above ** rows) ** bands, above)
+            error = (1 - false_negative_weight) * false_positive + false_negative_weight * false_negative
+            if best is None or error < best[0]:
+                best = (error, bands, rows)
+    return best[1], best[2]
+
+
+class NearDuplicateIndex:
+    """
+    문서를 차례로 추가하며 유사 중복 클러스터를 정하는 LSH 인덱스
+    청크 단위로 여러 번 add()해도 앞서 추가한 문서와의 중복을 찾습니다.
+    메모리에는 대표 기사의 MinHash 서명(num_perm x 4바이트)과 LSH 버킷만 보관합니다.
+    """
+
+    def __init__(self, threshold=DEFAULT_THRESHOLD, num_perm=DEFAULT_NUM_PERM,
+                 shingle_size=DEFAULT_SHINGLE_SIZE, seed=1):
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold는 0보다 크고 1 이하여야 합니다.")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = choose_bands(threshold, num_perm)
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, MAX_HASH, size=num_perm, dtype=np.uint64)[:, None]
+        self._b = rng.randint(0, MAX_HASH, size=num_perm, dtype=np.uint64)[:, None]
+
+        self._buckets = [{} for _ in range(self.bands)]   # band 값(bytes) -> 대표 기사 번호 목록
+        self._signatures = {}                             # 대표 기사 번호 -> MinHash 서명
+        self.count = 0                                    # 지금까지 추가한 문서 수
+
+    def signature(self, text):
+        """텍스트의 MinHash 서명 (uint32 배열)"""
+        hashes = shingle_hashes(text, self.shingle_size)
+        permuted = (self._a * hashes[None, :] + self._b) % MERSENNE_PRIME
+        return (permuted.min(axis=1) & MAX_HASH).astype(np.uint32)
+
+    def _band_keys(self, signature):
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def add(self, text):
+        """
+        문서 하나를 추가하고 (클러스터 번호, 대표 기사 여부)를 반환하는 함수
+        클러스터 번호는 대표 기사가 추가된 순번(0부터)입니다.
+        """
+        doc_id = self.count
+        self.count += 1
+        signature = self.signature(text)
+        keys = self._band_keys(signature)
+
+        candidates = {c for bucket, key in zip(self._buckets, keys) for c in bucket.get(key, ())}
+        cluster = None
+        if candidates:
+            candidates = sorted(candidates)
+            stacked = np.stack([self._signatures[c] for c in candidates])
+            similarity = (stacked == signature).mean(axis=1)
+            best = int(similarity.argmax())
+            if similarity[best] >= self.threshold:
+                cluster = candidates[best]
+
+        is_canonical = cluster is None
+        if is_canonical:
+            cluster = doc_id
+            self._signatures[doc_id] = signature
+        # 같은 band 값을 가진 서로 다른 클러스터를 모두 남겨, 나중에 추가한 대표 기사도 찾을 수 있게 합니다.
+        for bucket, key in zip(self._buckets, keys):
+            clusters = bucket.setdefault(key, [])
+            if cluster not in clusters:
+                clusters.append(cluster)
+        return cluster, is_canonical
+
+    def add_many(self, texts):
+        """여러 문서를 차례로 추가하고 (클러스터 번호 배열, 대표 기사 여부 배열)을 반환하는 함수"""
+        results = [self.add(text) for text in texts]
+        clusters = np.array([r[0] for r in results], dtype=np.int64)
+        canonical = np.array([r[1] for r in results], dtype=bool)
+        return clusters, canonical
+
+
+def mark_near_duplicates(df, column='content_clean', threshold=DEFAULT_THRESHOLD, index=None, **kwargs):
+    """
+    DataFrame에 유사 중복 클러스터 번호('dup_cluster')와 대표 기사 여부('is_canonical') 컬럼을 붙이는 함수
+    index(NearDuplicateIndex)를 넘기면 이전 호출에서 추가한 문서들과도 비교합니다.
+    """
+    if index is None:
+        index = NearDuplicateIndex(threshold=threshold, **kwargs)
+    clusters, canonical = index.add_many(df[column].tolist())
+    df = df.copy()
+    df['dup_cluster'] = pd.Series(clusters, index=df.index)
+    df['is_canonical'] = pd.Series(canonical, index=df.index)
+    return df
@@ -0,0 +1,95 @@
+# preprocessor/parallel.py
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# 워커에 한 번에 넘길 텍스트 수의 상한 (작업 분배와 전송 비용의 균형)
+MAX_CHUNKSIZE = 256
+# 워커당 나눠 받을 작업 묶음 수 (늦게 끝나는 워커가 전체를 붙잡지 않도록)
+CHUNKS_PER_WORKER = 4
+
+# 워커 시작 시 JVM과 형태소 분석기를 미리 깨우기 위한 문장
+WARM_UP_TEXT = "형태소 분석기 준비를 위한 문장입니다"
+
+
+def _init_worker():
+    """
+    워커 프로세스 초기화 함수
+    워커 전용 Okt(JVM)와 NLTK/언어 감지 리소스를 한 번 만들고,
+    첫 호출의 클래스 로딩 비용을 미리 치러 둡니다. 이후 작업에서는 같은 인스턴스를 재사용합니다.
+    """
+    from preprocessor import preprocess, resources
+    resources.warm_up()
+    preprocess.tokenize_and_normalize(WARM_UP_TEXT)
+
+
+def _tokenize_one(text, lang=None):
+    from preprocessor.preprocess import _safe_tokenize
+    # 캐시 조회/저장은 부모 프로세스에서 한 번에 합니다.
+    return _safe_tokenize(text, use_cache=False, detected_lang=lang)
+
+
+def default_chunksize(n_texts, workers):
+    """텍스트 수와 워커 수로 적당한 chunksize를 정하는 함수"""
+    return max(1, min(MAX_CHUNKSIZE, n_texts // (workers * CHUNKS_PER_WORKER)))
+
+
+class ParallelTokenizer:
+    """
+    여러 프로세스에 텍스트를 나눠 토큰화하는 엔진
+
+    KoNLPy의 Okt는 JPype JVM 위에서 동작하므로 fork 대신 spawn으로 워커를 띄우고,
+    워커마다 Okt를 한 번만 만들어 재사용합니다. 결과는 입력 순서대로 반환되며,
+    토큰화에 실패한 텍스트의 자리에는 None이 들어갑니다.
+    같은 인스턴스로 여러 번 tokenize()를 호출하면 워커(JVM)를 다시 띄우지 않습니다.
+    """
+
+    def __init__(self, workers=None, chunksize=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+        self._executor = None
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+            )
+        return self._executor
+
+    def tokenize(self, texts, langs=None):
+        """texts를 토큰화하는 함수 (langs를 주면 텍스트별 언어 감지를 건너뜀)"""
+        texts = list(texts)
+        if not texts:
+            return []
+        langs = list(langs) if langs is not None else [None] * len(texts)
+        chunksize = self.chunksize or default_chunksize(len(texts), self.workers)
+        return list(self._get_executor().map(_tokenize_one, texts, langs, chunksize=chunksize))
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def tokenize_texts(texts, workers=None, chunksize=None, langs=None):
+    """
+    텍스트 목록을 토큰화해서 입력 순서대로 반환하는 함수
+    workers가 None이거나 1 이하이면 현재 프로세스에서 순서대로 처리합니다.
+    langs(텍스트별 언어 코드)를 주면 텍스트마다 언어를 다시 감지하지 않습니다.
+    """
+    if workers is None or workers <= 1:
+        texts = list(texts)
+        langs = list(langs) if langs is not None else [None] * len(texts)
+        return [_tokenize_one(text, lang) for text, lang in zip(texts, langs)]
+
+    with ParallelTokenizer(workers=workers, chunksize=chunksize) as tokenizer:
+        return tokenizer.tokenize(texts, langs=langs)
@@ -1,23 +1,43 @@
 # preprocessor/preprocess.py - 최종 수정 버전
 
+import codecs
+import logging
 import pandas as pd
 import re
-import nltk
-import numpy as np
-import requests
-from bs4 import BeautifulSoup
 from typing import Union
-import warnings
-warnings.filterwarnings('ignore')
-
-# 한국어 형태소 분석기 (optional)
-try:
-    from konlpy.tag import Okt  
-    HAS_KONLPY = True
-    okt = Okt()
-except ImportError:
-    print("KoNLPy not available, Korean processing will be limited")
-    HAS_KONLPY = False
+
+from .language import detect_language_batch, detect_language_safe
+from .near_dup import mark_near_duplicates
+from .parallel import tokenize_texts
+from .resources import backend_signature, get_english_tools, get_okt
+from .stats import PreprocessStats
+from .token_cache import TokenCache
+
+logger = logging.getLogger(__name__)
+
+# 토큰화 규칙(불용어, 필터 조건 등)을 바꾸면 올려 주세요. 토큰 캐시의 예전 결과를 쓰지 않게 됩니다.
+TOKENIZER_VERSION = 2
+
+# configure_token_cache()로 설정한 토큰 캐시 (None이면 사용하지 않음)
+_token_cache = None
+
+def configure_token_cache(cache=None, max_bytes: int = 100 * 1024 * 1024):
+    """
+    tokenize_and_normalize / load_csv가 사용할 토큰 캐시를 설정하는 함수
+    cache에는 SQLite 파일 경로나 TokenCache 객체를 넣고, None이면 캐시를 끕니다.
+    """
+    global _token_cache
+    if isinstance(cache, str):
+        cache = TokenCache(cache, max_bytes=max_bytes)
+    _token_cache = cache
+    return cache
+
+def get_token_cache():
+    return _token_cache
+
+def token_cache_namespace():
+    """토큰 캐시 키에 넣을 토큰화 백엔드/버전 문자열"""
+    return f"v{TOKENIZER_VERSION}|{backend_signature()}"
 
 # 기본 한국어 불용어 리스트 (필요시 확장 가능)
 KOREAN_STOPWORDS = set([
@@ -26,60 +46,16 @@ KOREAN_STOPWORDS = set([
     "한다", "했다", "하는", "있다", "없다", "것", "수", "등"
 ])
 
-# NLTK 리소스 다운로드 함수
-def ensure_nltk_data():
-    """NLTK 데이터 확인 및 다운로드"""
-    required_data = [
-        ('tokenizers/punkt', 'punkt'),
-        ('corpora/wordnet', 'wordnet'),
-        ('corpora/stopwords', 'stopwords')
-    ]
-    
-    for data_path, name in required_data:
-        try:
-            nltk.data.find(data_path)
-        except LookupError:
-            print(f"Downloading {name}...")
-            nltk.download(name, quiet=True)
-
-ensure_nltk_data()
-
-# 형태소 분석기 초기화
-try:
-    from nltk.tokenize import word_tokenize
-    from nltk.corpus import stopwords
-    from nltk.stem import WordNetLemmatizer
-
-    stop_words_en = set(stopwords.words('english'))
-    lemmatizer = WordNetLemmatizer()
-except:
-    print("NLTK 초기화 중 오류 발생")
-
-# 언어 감지 라이브러리
-try:
-    from langdetect import detect, LangDetectError
-    HAS_LANGDETECT = True
-except ImportError:
-    print("langdetect not available, will use simple heuristics")
-    HAS_LANGDETECT = False
-    LangDetectError = Exception
-
-def detect_language_safe(text):
-    """안전한 언어 감지"""
-    if not text or len(text.strip()) < 3:
-        return 'en'
-        
-    if not HAS_LANGDETECT:
-        # 간단한 한국어 감지 (한글 유니코드 범위)
-        korean_chars = sum(1 for c in text if '\uac00' <= c <= '\ud7a3')
-        return 'ko' if korean_chars > len(text) * 0.1 else 'en'
-    
-    try:
-        return detect(text)
-    except:
-        # 폴백: 한글 문자 비율로 판단
-        korean_chars = sum(1 for c in text if '\uac00' <= c <= '\ud7a3')
-        return 'ko' if korean_chars > 0 else 'en'
+# 텍스트 정리용 정규식 (미리 컴파일해서 행마다 다시 해석하지 않도록 합니다)
+WHITESPACE_PATTERN = re.compile(r'\s+')
+URL_PATTERN = re.compile(r'http\S+')
+SPECIAL_CHAR_PATTERN = re.compile(r'[^\w\sㄱ-ㅎㅏ-ㅣ가-힣]')
+
+# 전처리 기준값
+MIN_CONTENT_LENGTH = 5   # 이보다 짧은 텍스트는 제외
+MIN_TOKEN_COUNT = 3      # 토큰이 이보다 적으면 제외
+
+PREPROCESSED_COLUMNS = ['content', 'content_clean', 'tokens']
 
 def clean_text(text: str) -> str:
     """텍스트 기본 정리"""
@@ -87,14 +63,25 @@ def clean_text(text: str) -> str:
         return ""
     
     text = str(text)
-    text = re.sub(r'\s+', ' ', text)           # 연속 공백 정리
-    text = re.sub(r'http\S+', '', text)        # 링크 제거
-    text = re.sub(r'[^\w\sㄱ-ㅎㅏ-ㅣ가-힣]', '', text)  # 특수문자 제거 (한글+영문만 남김)
+    text = WHITESPACE_PATTERN.sub(' ', text)    # 연속 공백 정리
+    text = URL_PATTERN.sub('', text)            # 링크 제거
+    text = SPECIAL_CHAR_PATTERN.sub('', text)   # 특수문자 제거 (한글+영문만 남김)
     return text.strip()
 
+def clean_text_series(texts: pd.Series) -> pd.Series:
+    """clean_text를 Series 전체에 한 번에 적용 (문자열 Series 입력)"""
+    # pandas의 문자열 dtype(pyarrow)은 정규식 문법이 달라 \w가 한글을 포함하지 않으므로
+    # 파이썬 re로 처리되는 object dtype으로 맞춥니다.
+    texts = texts.astype(object)
+    texts = texts.str.replace(WHITESPACE_PATTERN, ' ', regex=True)
+    texts = texts.str.replace(URL_PATTERN, '', regex=True)
+    texts = texts.str.replace(SPECIAL_CHAR_PATTERN, '', regex=True)
+    return texts.str.strip()
+
 def tokenize_korean_safe(input_text):
     """안전한 한국어 토큰화"""
-    if not HAS_KONLPY:
+    okt = get_okt()
+    if okt is None:
         # KoNLPy가 없는 경우 간단한 분할
         words = str(input_text).split()
         return [w for w in words if len(w) > 1 and w not in KOREAN_STOPWORDS]
@@ -106,10 +93,10 @@ def tokenize_korean_safe(input_text):
         if pd.isna(input_text):
             return []
         if callable(input_text):
-            print(f"ERROR: Function object passed to tokenize_korean_safe: {input_text}")
+            logger.debug(f"Function object passed to tokenize_korean_safe: {input_text}")
             return []
         if hasattr(input_text, '__call__'):
-            print(f"ERROR: Callable object passed to tokenize_korean_safe: {input_text}")
+            logger.debug(f"Callable object passed to tokenize_korean_safe: {input_text}")
             return []
             
         # 안전한 문자열 변환
@@ -122,7 +109,7 @@ def tokenize_korean_safe(input_text):
             
         # KoNLPy 호출 전 한번 더 검증
         if not isinstance(text_str, str):
-            print(f"ERROR: Not a string after conversion: {type(text_str)}")
+            logger.debug(f"Not a string after conversion: {type(text_str)}")
             return []
             
         # 실제 KoNLPy 호출
@@ -130,15 +117,15 @@ def tokenize_korean_safe(input_text):
         
         # 결과 검증
         if not isinstance(morphs_result, list):
-            print(f"ERROR: Unexpected morphs result type: {type(morphs_result)}")
+            logger.debug(f"Unexpected morphs result type: {type(morphs_result)}")
             return []
             
         filtered_tokens = [w for w in morphs_result if len(w) > 1 and w not in KOREAN_STOPWORDS]
         return filtered_tokens
         
     except Exception as e:
-        print(f"Korean tokenization error with text '{str(input_text)[:50]}...': {e}")
-        print(f"Input type: {type(input_text)}")
+        logger.debug(f"Korean tokenization error with text '{str(input_text)[:50]}...' "
+                     f"({type(input_text)}): {e}")
         # 실패 시 단순 분할
         try:
             words = str(input_text).split()
@@ -153,19 +140,20 @@ def tokenize_english_safe(input_text):
         if input_text is None or pd.isna(input_text):
             return []
         if callable(input_text) or hasattr(input_text, '__call__'):
-            print(f"ERROR: Callable object passed to tokenize_english_safe: {input_text}")
+            logger.debug(f"Callable object passed to tokenize_english_safe: {input_text}")
             return []
             
         text_str = str(input_text).strip().lower()
         if not text_str:
             return []
             
-        tokens = word_tokenize(text_str)
-        filtered_tokens = [lemmatizer.lemmatize(w) for w in tokens 
-                          if w.isalpha() and len(w) > 1 and w not in stop_words_en]
+        tools = get_english_tools()
+        tokens = tools.word_tokenize(text_str)
+        filtered_tokens = [tools.lemmatizer.lemmatize(w) for w in tokens 
+                          if w.isalpha() and len(w) > 1 and w not in tools.stop_words]
         return filtered_tokens
     except Exception as e:
-        print(f"English tokenization error with text '{str(input_text)[:50]}...': {e}")
+        logger.debug(f"English tokenization error with text '{str(input_text)[:50]}...': {e}")
         # 실패 시 단순 분할
         try:
             words = str(input_text).lower().split()
@@ -173,26 +161,43 @@ def tokenize_english_safe(input_text):
         except:
             return []
 
-def tokenize_and_normalize(input_text, lang: str = "en") -> list:
-    """언어별 토큰화 + 불용어 제거 + 표제어 추출"""
+def tokenize_and_normalize(input_text, lang: str = "en", use_cache: bool = True) -> list:
+    """
+    언어별 토큰화 + 불용어 제거 + 표제어 추출
+    토큰 캐시가 설정되어 있으면(configure_token_cache) 캐시된 결과를 먼저 찾습니다.
+    """
     # 매우 엄격한 입력 검증
     if input_text is None or pd.isna(input_text):
         return []
     if callable(input_text) or hasattr(input_text, '__call__'):
-        print(f"ERROR: Callable object passed to tokenize_and_normalize: {input_text}")
+        logger.debug(f"Callable object passed to tokenize_and_normalize: {input_text}")
         return []
     
     try:
         text_str = str(input_text).strip()
     except Exception as e:
-        print(f"ERROR: Cannot convert to string: {input_text}, error: {e}")
+        logger.debug(f"Cannot convert to string: {input_text}, error: {e}")
         return []
     
     if not text_str or len(text_str) < 3:
         return []
 
-    # 언어 감지
-    detected_lang = detect_language_safe(text_str)
+    cache = _token_cache if use_cache else None
+    if cache is None:
+        return _tokenize_text(text_str)
+
+    tokens = cache.get(text_str, token_cache_namespace())
+    if tokens is None:
+        tokens = _tokenize_text(text_str)
+        # 토큰화하면서 백엔드가 정해지므로 저장할 때 네임스페이스를 다시 구합니다.
+        cache.put(text_str, tokens, token_cache_namespace())
+    return tokens
+
+def _tokenize_text(text_str: str, detected_lang: str = None) -> list:
+    """언어를 감지해서 알맞은 토큰화 함수를 호출하는 함수 (캐시 사용 안 함)"""
+    # 언어 감지 (일괄 처리에서는 미리 감지한 언어를 받음)
+    if detected_lang is None:
+        detected_lang = detect_language_safe(text_str)
     
     # 토큰화
     if detected_lang == "ko":
@@ -200,35 +205,236 @@ def tokenize_and_normalize(input_text, lang: str = "en") -> list:
     else:
         return tokenize_english_safe(text_str)
 
-def load_csv(csv_path: str) -> pd.DataFrame: 
-    """CSV 파일 불러오고 전처리 - pandas apply 사용하지 않음"""
-    print(f"Loading CSV: {csv_path}")
-    
-    # 다양한 인코딩으로 시도
-    encodings = ['utf-8-sig', 'utf-8', 'cp949', 'euc-kr', 'latin-1']
-    df = None
-    
-    for encoding in encodings:
-        try:
-            df = pd.read_csv(csv_path, encoding=encoding)
-            print(f"Successfully loaded with {encoding} encoding")
-            break
-        except (UnicodeDecodeError, UnicodeError):
-            continue
-        except Exception as e:
-            print(f"Error with {encoding}: {e}")
+# CSV 파일을 읽을 때 차례로 시도할 인코딩
+CSV_ENCODINGS = ['utf-8-sig', 'utf-8', 'cp949', 'euc-kr', 'latin-1']
+# 인코딩 판별에 쓸 파일 앞부분 크기
+ENCODING_SAMPLE_BYTES = 1024 * 1024
+# BOM으로 바로 알 수 있는 인코딩
+BOM_ENCODINGS = [
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+def detect_csv_encoding(csv_path: str, sample_bytes: int = ENCODING_SAMPLE_BYTES) -> str:
+    """
+    파일 앞부분(sample_bytes, None이면 파일 전체)만 디코딩해 보고 인코딩을 판별하는 함수
+    BOM이 있으면 그에 맞는 인코딩을, 없으면 CSV_ENCODINGS 중 오류 없이 디코딩되는 첫 인코딩을 반환합니다.
+    앞부분이 모두 ASCII라 판별할 근거가 없으면 파일 전체를 디코딩해 봅니다.
+    """
+    with open(csv_path, 'rb') as f:
+        sample = f.read(sample_bytes) if sample_bytes is not None else f.read(ENCODING_SAMPLE_BYTES)
+        at_end = not f.read(1)
+    for bom, encoding in BOM_ENCODINGS:
+        if sample.startswith(bom):
+            return encoding
+    if sample.isascii() and not at_end:
+        sample_bytes = None
+
+    for encoding in CSV_ENCODINGS:
+        if encoding == 'utf-8-sig':
+            # BOM이 없으면 utf-8과 같으므로 건너뜀
             continue
-    
-    if df is None:
-        raise Exception("Failed to load CSV with any encoding")
-    
+        if _decodes(csv_path, encoding, sample_bytes):
+            return encoding
+    raise Exception("Failed to load CSV with any encoding")
+
+def _decodes(csv_path: str, encoding: str, limit: int = None) -> bool:
+    """파일의 앞 limit바이트(None이면 전체)가 encoding으로 오류 없이 디코딩되는지 확인하는 함수"""
+    # 멀티바이트 문자 중간에서 잘려도 되도록 블록 단위 증분 디코딩 (파일 끝에서만 final=True)
+    decoder = codecs.getincrementaldecoder(encoding)()
+    remaining = limit
+    try:
+        with open(csv_path, 'rb') as f:
+            while remaining is None or remaining > 0:
+                size = ENCODING_SAMPLE_BYTES if remaining is None else min(remaining, ENCODING_SAMPLE_BYTES)
+                block = f.read(size)
+                decoder.decode(block, final=not block)
+                if not block:
+                    break
+                if remaining is not None:
+                    remaining -= len(block)
+    except (UnicodeDecodeError, UnicodeError):
+        return False
+    return True
+
+def _read_csv(csv_path: str) -> pd.DataFrame:
+    """
+    인코딩을 판별해 CSV 파일을 한 번만 읽는 함수
+    판별에 쓴 앞부분 뒤에서 디코딩 오류가 나면 파일 전체를 디코딩해 다시 판별하고 한 번 더 읽습니다.
+    사용한 인코딩은 df.attrs['source_encoding']에 기록됩니다.
+    """
+    encoding = detect_csv_encoding(csv_path)
+    try:
+        df = pd.read_csv(csv_path, encoding=encoding)
+    except (UnicodeDecodeError, UnicodeError):
+        logger.info(f"Encoding {encoding} failed beyond the sampled bytes, checking the whole file")
+        # 디코딩만 하므로 CSV 파싱보다 훨씬 빠릅니다.
+        encoding = detect_csv_encoding(csv_path, sample_bytes=None)
+        df = pd.read_csv(csv_path, encoding=encoding)
+    logger.info(f"Successfully loaded with {encoding} encoding")
+    df.attrs['source_encoding'] = encoding
+    return df
+
+def load_csv(csv_path: str, batch: bool = True, workers: int = None,
+             chunksize: int = None, tokenizer=None, near_dup_threshold: float = None) -> pd.DataFrame: 
+    """
+    CSV 파일 불러오고 전처리
+    batch=True이면 Series 단위 일괄 처리, False이면 기존의 행 단위 처리 (결과는 동일)
+    workers/chunksize/tokenizer/near_dup_threshold는 preprocess_dataframe 참고
+    """
+    logger.info(f"Loading CSV: {csv_path}")
+    df = _read_csv(csv_path)
+    result = preprocess_dataframe(df, batch=batch, workers=workers, chunksize=chunksize,
+                                  tokenizer=tokenizer, near_dup_threshold=near_dup_threshold)
+    # 출처 기록 (어떤 파일을 어떤 인코딩으로 읽었는지)
+    result.attrs.update(source_path=csv_path, source_encoding=df.attrs['source_encoding'])
+    return result
+
+def preprocess_dataframe(df: pd.DataFrame, batch: bool = True, workers: int = None,
+                         chunksize: int = None, tokenizer=None,
+                         near_dup_threshold: float = None, stats: PreprocessStats = None) -> pd.DataFrame:
+    """
+    'content' 컬럼이 있는 DataFrame을 전처리 (정리 → 토큰화 → 길이 필터 → 중복 제거)
+
+    일괄 처리(batch=True)에서는 토큰화를 여러 프로세스로 나눌 수 있습니다.
+    - workers: 토큰화 프로세스 수 (None 또는 1이면 현재 프로세스에서 처리)
+    - chunksize: 워커에 한 번에 넘길 텍스트 수 (None이면 자동)
+    - tokenizer: 이미 띄워 둔 ParallelTokenizer (여러 번 호출할 때 워커를 재사용)
+
+    near_dup_threshold(Jaccard 유사도)를 지정하면 유사 중복 클러스터를 찾아
+    'dup_cluster', 'is_canonical' 컬럼을 붙입니다 (near_dup.mark_near_duplicates 참고).
+
+    실행 통계(제외 사유별 행 수, 토큰 수 분포, 처리 속도)는 끝날 때 한 번 로그로 남기고
+    결과의 attrs['preprocess_stats']에 기록합니다. stats를 넘기면 그 객체에 누적만 하고
+    결과 행 기록과 요약 출력은 호출한 쪽에서 합니다 (스트리밍처럼 여러 번 나눠 처리할 때).
+    """
+    own_stats = stats is None
+    if own_stats:
+        stats = PreprocessStats()
+
     # content 컬럼 확인
     if 'content' not in df.columns:
-        print("No 'content' column found. Available columns:", df.columns.tolist())
+        logger.warning(f"No 'content' column found. Available columns: {df.columns.tolist()}")
         df['content'] = ''
     
-    print(f"Original CSV rows: {len(df)}")
-    
+    logger.debug(f"Original CSV rows: {len(df)}")
+    stats.add_input(len(df))
+
+    if batch:
+        result = _preprocess_batch(df, stats, workers=workers, chunksize=chunksize, tokenizer=tokenizer)
+    else:
+        result = _preprocess_rows(df, stats)
+
+    if near_dup_threshold is not None:
+        result = mark_near_duplicates(result, threshold=near_dup_threshold)
+        logger.info(f"유사 중복: {len(result)}개 중 대표 기사 {int(result['is_canonical'].sum())}개")
+
+    if own_stats:
+        stats.record_output(result['tokens'])
+        result.attrs['preprocess_stats'] = stats.log_summary()
+    return result
+
+def _safe_tokenize(text, use_cache=True, detected_lang=None):
+    """
+    토큰화 중 예외가 나면 None을 반환
+    detected_lang이 있으면 정리된 텍스트로 보고 언어 감지 없이 바로 토큰화합니다 (캐시 사용 안 함).
+    """
+    try:
+        if detected_lang is not None:
+            text_str = str(text).strip()
+            return _tokenize_text(text_str, detected_lang) if len(text_str) >= 3 else []
+        return tokenize_and_normalize(text, use_cache=use_cache)
+    except Exception as token_error:
+        logger.debug(f"Tokenization failed for text '{str(text)[:50]}...': {token_error}")
+        return None
+
+def _preprocess_batch(df: pd.DataFrame, stats: PreprocessStats, workers: int = None,
+                      chunksize: int = None, tokenizer=None) -> pd.DataFrame:
+    """
+    Series 연산으로 일괄 전처리 (행 단위 처리와 같은 결과, 같은 통계)
+
+    정리된 텍스트가 같으면 토큰 결과도 같으므로 중복을 먼저 걸러
+    고유한 텍스트만 토큰화합니다. 결과의 index도 행 단위 처리와 같게 맞춥니다.
+    """
+    raw = df['content']
+
+    # 기본 검증: 결측값과 호출 가능한 객체 제외
+    missing = raw.isna()
+    is_callable = ~missing & raw.map(callable).astype(bool)
+    stats.skip('missing', missing.sum())
+    stats.skip('callable', is_callable.sum())
+    content = raw[~missing & ~is_callable].astype(object).map(str).str.strip()
+
+    # 너무 짧은 텍스트 제외
+    long_enough = content.str.len() >= MIN_CONTENT_LENGTH
+    stats.skip('too_short', (~long_enough).sum())
+    content = content[long_enough]
+
+    # 텍스트 정리 후 빈 문자열 제외
+    cleaned = clean_text_series(content)
+    keep = cleaned != ''
+    stats.skip('empty_after_cleaning', (~keep).sum())
+    content, cleaned = content[keep], cleaned[keep]
+
+    # 고유한 텍스트만 토큰화 (캐시에 있으면 재사용, workers/tokenizer가 있으면 여러 프로세스로 나눠 처리)
+    unique_texts = cleaned.drop_duplicates().tolist()
+    tokens_by_text = _tokenize_unique(unique_texts, workers, chunksize, tokenizer)
+
+    # 토큰화 실패 / 최소 토큰 수 체크
+    failed = cleaned.map(lambda text: tokens_by_text[text] is None).astype(bool)
+    passed = cleaned.map(lambda text: tokens_by_text[text] is not None
+                         and len(tokens_by_text[text]) >= MIN_TOKEN_COUNT).astype(bool)
+    stats.skip('tokenize_error', failed.sum())
+    stats.skip('few_tokens', (~failed & ~passed).sum())
+    content, cleaned = content[passed], cleaned[passed]
+
+    if cleaned.empty:
+        logger.info("No valid data after processing")
+        return pd.DataFrame(columns=PREPROCESSED_COLUMNS)
+
+    result_df = pd.DataFrame({
+        'content': content.tolist(),
+        'content_clean': cleaned.tolist(),
+        'tokens': [tokens_by_text[text] for text in cleaned],
+    })
+
+    # 중복 제거
+    original_len = len(result_df)
+    result_df = result_df.drop_duplicates(subset=['content_clean'])
+    stats.skip('duplicate', original_len - len(result_df))
+    return result_df
+
+def _tokenize_unique(texts, workers=None, chunksize=None, tokenizer=None) -> dict:
+    """고유한 텍스트 목록을 토큰화해 {텍스트: 토큰 목록 또는 None}으로 반환하는 함수"""
+    cache = _token_cache
+    # tokenize_and_normalize와 같은 기준으로 캐시 키를 만듭니다 (3자 미만은 항상 빈 목록).
+    cacheable = [text for text in texts if len(text.strip()) >= 3] if cache is not None else []
+    tokens_by_text = cache.get_many(cacheable, token_cache_namespace()) if cacheable else {}
+    missing = [text for text in texts if text not in tokens_by_text]
+
+    # 언어는 Series 단위로 한 번에 감지해서 토큰화 함수에 넘깁니다.
+    langs = detect_language_batch(pd.Series(missing, dtype=object)).tolist()
+    if tokenizer is not None:
+        token_lists = tokenizer.tokenize(missing, langs=langs)
+    else:
+        token_lists = tokenize_texts(missing, workers=workers, chunksize=chunksize, langs=langs)
+    computed = dict(zip(missing, token_lists))
+    tokens_by_text.update(computed)
+
+    if cache is not None:
+        # 실패(None)한 결과는 저장하지 않습니다.
+        cache.put_many({text: tokens for text, tokens in computed.items()
+                        if tokens is not None and len(text.strip()) >= 3},
+                       token_cache_namespace())
+        if cacheable:
+            hits = len(cacheable) - len([text for text in missing if len(text.strip()) >= 3])
+            logger.info(f"토큰 캐시: {hits}/{len(cacheable)}개 적중 "
+                        f"(누적 적중률 {cache.stats()['hit_ratio']:.1%})")
+    return tokens_by_text
+
+def _preprocess_rows(df: pd.DataFrame, stats: PreprocessStats) -> pd.DataFrame:
+    """행 단위 전처리 - pandas apply 사용하지 않음 (행별 상세 내용은 DEBUG 로그)"""
     # 수동으로 각 행 처리 (pandas apply 사용 안 함)
     processed_data = []
     
@@ -238,48 +444,56 @@ def load_csv(csv_path: str) -> pd.DataFrame:
             single_row = df.iloc[row_idx]
             raw_content = single_row['content']
             
-            print(f"Processing row {row_idx}: type={type(raw_content)}, value preview='{str(raw_content)[:50]}...'")
+            logger.debug(f"Processing row {row_idx}: type={type(raw_content)}, value preview='{str(raw_content)[:50]}...'")
             
             # 기본 검증
             if raw_content is None or pd.isna(raw_content):
-                print(f"Skipping row {row_idx}: None or NaN")
+                logger.debug(f"Skipping row {row_idx}: None or NaN")
+                stats.skip('missing')
                 continue
             
             if callable(raw_content) or hasattr(raw_content, '__call__'):
-                print(f"ERROR: Row {row_idx} contains callable object: {raw_content}")
+                logger.debug(f"Row {row_idx} contains callable object: {raw_content}")
+                stats.skip('callable')
                 continue
             
             try:
                 content_str = str(raw_content).strip()
             except Exception as str_error:
-                print(f"ERROR: Cannot convert row {row_idx} to string: {str_error}")
+                logger.debug(f"Cannot convert row {row_idx} to string: {str_error}")
+                stats.skip('error')
                 continue
                 
-            if len(content_str) < 5:  # 너무 짧은 텍스트 제외
-                print(f"Skipping row {row_idx}: too short ({len(content_str)} chars)")
+            if len(content_str) < MIN_CONTENT_LENGTH:  # 너무 짧은 텍스트 제외
+                logger.debug(f"Skipping row {row_idx}: too short ({len(content_str)} chars)")
+                stats.skip('too_short')
                 continue
             
             # 텍스트 정리
             try:
                 cleaned_content = clean_text(content_str)
             except Exception as clean_error:
-                print(f"ERROR: Cannot clean text for row {row_idx}: {clean_error}")
+                logger.debug(f"Cannot clean text for row {row_idx}: {clean_error}")
+                stats.skip('error')
                 continue
                 
             if not cleaned_content:
-                print(f"Skipping row {row_idx}: empty after cleaning")
+                logger.debug(f"Skipping row {row_idx}: empty after cleaning")
+                stats.skip('empty_after_cleaning')
                 continue
             
             # 토큰화 - 매우 안전하게
             try:
                 token_list = tokenize_and_normalize(cleaned_content)
             except Exception as token_error:
-                print(f"ERROR: Tokenization failed for row {row_idx}: {token_error}")
+                logger.debug(f"Tokenization failed for row {row_idx}: {token_error}")
+                stats.skip('tokenize_error')
                 continue
             
             # 최소 토큰 수 체크
-            if len(token_list) < 3:
-                print(f"Skipping row {row_idx}: insufficient tokens ({len(token_list)})")
+            if len(token_list) < MIN_TOKEN_COUNT:
+                logger.debug(f"Skipping row {row_idx}: insufficient tokens ({len(token_list)})")
+                stats.skip('few_tokens')
                 continue
             
             processed_data.append({
@@ -288,38 +502,35 @@ def load_csv(csv_path: str) -> pd.DataFrame:
                 'tokens': token_list
             })
             
-            print(f"Successfully processed row {row_idx}: {len(token_list)} tokens")
+            logger.debug(f"Successfully processed row {row_idx}: {len(token_list)} tokens")
             
         except Exception as row_error:
-            print(f"ERROR processing row {row_idx}: {row_error}")
-            import traceback
-            traceback.print_exc()
+            logger.debug(f"Error processing row {row_idx}: {row_error}", exc_info=True)
+            stats.skip('error')
             continue
     
     if not processed_data:
-        print("No valid data after processing")
-        return pd.DataFrame(columns=['content', 'content_clean', 'tokens'])
+        logger.info("No valid data after processing")
+        return pd.DataFrame(columns=PREPROCESSED_COLUMNS)
     
     result_df = pd.DataFrame(processed_data)
     
     # 중복 제거
     original_len = len(result_df)
     result_df = result_df.drop_duplicates(subset=['content_clean'])
-    if original_len != len(result_df):
-        print(f"Removed {original_len - len(result_df)} duplicates")
-    
-    print(f"CSV 전처리 완료: {len(result_df)}개 행 처리됨")
+    stats.skip('duplicate', original_len - len(result_df))
     return result_df
 
 def load_article(url: str) -> pd.DataFrame:
     """웹 기사 URL에서 본문 크롤링 및 전처리"""
-    print(f"Loading URL: {url}")
+    logger.info(f"Loading URL: {url}")
     
+    # 요청/HTML 파싱 모듈은 URL을 처리할 때만 불러옵니다.
+    from bs4 import BeautifulSoup
+    from crawler.http_client import get_default_client
+
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=15)
+        response = get_default_client().get(url)
         response.encoding = 'utf-8'
         
         soup = BeautifulSoup(response.text, 'html.parser')
@@ -329,10 +540,10 @@ def load_article(url: str) -> pd.DataFrame:
             tag.decompose()
         
         article_text = soup.get_text(separator=' ', strip=True)
-        print(f"Extracted {len(article_text)} characters from URL")
+        logger.info(f"Extracted {len(article_text)} characters from URL")
         
         if not article_text or len(article_text) < 50:
-            print(f"WARN: 추출된 텍스트가 너무 짧습니다: {len(article_text)} characters")
+            logger.warning(f"추출된 텍스트가 너무 짧습니다: {len(article_text)} characters")
             article_text = "No sufficient content extracted from URL"
         
         # 기본 정리
@@ -348,11 +559,11 @@ def load_article(url: str) -> pd.DataFrame:
             "tokens": tokens
         }])
         
-        print(f"URL 전처리 완료: {len(article_text)} characters extracted, {len(tokens)} tokens")
+        logger.info(f"URL 전처리 완료: {len(article_text)} characters extracted, {len(tokens)} tokens")
         return df
         
     except Exception as e:
-        print(f"URL 크롤링 실패: {e}")
+        logger.error(f"URL 크롤링 실패: {e}")
         # 빈 DataFrame 반환
         return pd.DataFrame(columns=['content', 'content_clean', 'tokens'])
 
@@ -371,7 +582,7 @@ def load_and_preprocess(source: Union[str, list]) -> pd.DataFrame:
                 if not df.empty:
                     dfs.append(df)
             except Exception as e:
-                print(f"소스 '{s}' 처리 중 오류: {e}")
+                logger.error(f"소스 '{s}' 처리 중 오류: {e}")
                 continue
         
         if dfs:
@@ -0,0 +1,180 @@
+# preprocessor/resources.py
+"""
+전처리에 쓰는 무거운 리소스(형태소 분석기, NLTK 데이터, 언어 감지기)를 처음 쓸 때 만드는 레지스트리
+
+패키지를 import할 때는 아무것도 만들지 않습니다(JVM 시작이나 네트워크 다운로드 없음).
+미리 준비해 두고 싶으면 warm_up()을 호출하세요.
+"""
+
+import logging
+import threading
+import warnings
+from functools import lru_cache
+from importlib.util import find_spec
+
+logger = logging.getLogger(__name__)
+
+# 선택 의존성 설치 여부 (실제 import 없이 확인)
+HAS_KONLPY = find_spec('konlpy') is not None
+HAS_NLTK = find_spec('nltk') is not None
+HAS_LANGDETECT = find_spec('langdetect') is not None
+
+# 리소스 이름 -> 만드는 함수
+_factories = {}
+# 리소스 이름 -> 만들어진 객체 (만들 수 없으면 None)
+_resources = {}
+_lock = threading.RLock()
+
+
+def register(name, factory):
+    """리소스를 만드는 함수를 등록하는 함수 (이미 만들어진 같은 이름의 리소스는 버림)"""
+    with _lock:
+        _factories[name] = factory
+        _resources.pop(name, None)
+
+
+def get(name):
+    """리소스를 반환하는 함수 (처음 호출할 때 한 번만 만듦)"""
+    try:
+        return _resources[name]
+    except KeyError:
+        pass
+    with _lock:
+        if name not in _resources:
+            _resources[name] = _factories[name]()
+        return _resources[name]
+
+
+def is_loaded(name):
+    return name in _resources
+
+
+def warm_up(names=None):
+    """리소스를 미리 만들어 두는 함수 (names가 없으면 등록된 전체)"""
+    for name in names or list(_factories):
+        get(name)
+
+
+# NLTK 리소스 다운로드 함수
+def ensure_nltk_data():
+    """NLTK 데이터 확인 및 다운로드"""
+    import nltk
+
+    required_data = [
+        ('tokenizers/punkt', 'punkt'),
+        ('corpora/wordnet', 'wordnet'),
+        ('corpora/stopwords', 'stopwords')
+    ]
+
+    for data_path, name in required_data:
+        try:
+            nltk.data.find(data_path)
+        except LookupError:
+            logger.info(f"Downloading {name}...")
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                nltk.download(name, quiet=True)
+    return True
+
+
+class EnglishTools:
+    """영어 토큰화에 필요한 NLTK 도구 묶음"""
+
+    def __init__(self):
+        from nltk.corpus import stopwords
+        from nltk.stem import WordNetLemmatizer
+        from nltk.tokenize import word_tokenize
+
+        get('nltk_data')
+        self.word_tokenize = word_tokenize
+        self.stop_words = set(stopwords.words('english'))
+        self.lemmatizer = WordNetLemmatizer()
+
+
+def _create_okt():
+    if not HAS_KONLPY:
+        logger.warning("KoNLPy not available, Korean processing will be limited")
+        return None
+    try:
+        # JVM을 시작할 때 나오는 JPype 경고는 이 호출 안에서만 숨깁니다.
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            from konlpy.tag import Okt
+            return Okt()
+    except Exception as e:
+        # Java가 없는 등 JVM을 시작할 수 없는 경우
+        logger.warning(f"KoNLPy 초기화 중 오류 발생, Korean processing will be limited: {e}")
+        return None
+
+
+def _create_english_tools():
+    if not HAS_NLTK:
+        logger.warning("NLTK not available, English processing will be limited")
+        return None
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            return EnglishTools()
+    except Exception as e:
+        logger.warning(f"NLTK 초기화 중 오류 발생: {e}")
+        return None
+
+
+def _create_language_detector():
+    if not HAS_LANGDETECT:
+        logger.warning("langdetect not available, will use simple heuristics")
+        return None
+    from langdetect import DetectorFactory, detect
+
+    # 같은 텍스트는 항상 같은 언어로 판정되도록 고정
+    DetectorFactory.seed = 0
+    return detect
+
+
+register('okt', _create_okt)
+register('nltk_data', ensure_nltk_data)
+register('english', _create_english_tools)
+register('language_detector', _create_language_detector)
+
+
+def get_okt():
+    """KoNLPy Okt 인스턴스 (사용할 수 없으면 None)"""
+    return get('okt')
+
+
+def get_english_tools():
+    """EnglishTools 인스턴스 (사용할 수 없으면 None)"""
+    return get('english')
+
+
+def get_language_detector():
+    """langdetect의 detect 함수 (사용할 수 없으면 None)"""
+    return get('language_detector')
+
+
+@lru_cache(maxsize=None)
+def _package_version(name):
+    from importlib.metadata import PackageNotFoundError, version
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return 'unknown'
+
+
+def _available(name, installed):
+    """리소스를 쓸 수 있는지 (아직 만들지 않았으면 설치 여부로 판단)"""
+    if name in _resources:
+        return _resources[name] is not None
+    return installed
+
+
+def backend_signature():
+    """
+    토큰화 결과를 결정하는 백엔드와 버전을 나타내는 문자열 (토큰 캐시 키에 사용)
+    리소스를 새로 만들지 않으므로 캐시 조회만으로 JVM이 시작되지 않습니다.
+    """
+    korean = f"okt-{_package_version('konlpy')}" if _available('okt', HAS_KONLPY) else 'split'
+    english = f"nltk-{_package_version('nltk')}" if _available('english', HAS_NLTK) else 'split'
+    detector = (f"langdetect-{_package_version('langdetect')}"
+                if _available('language_detector', HAS_LANGDETECT) else 'hangul')
+    return f"{korean}|{english}|{detector}"
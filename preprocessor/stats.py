@@ -0,0 +1,110 @@
+# preprocessor/stats.py
+"""
+전처리 실행 통계와 로그 출력 설정
+
+행마다 출력하는 대신 실행이 끝날 때 제외 사유별 행 수, 토큰 수 분포, 처리 속도(rows/sec)를 한 번에 남깁니다.
+행 단위 상세 로그는 DEBUG 레벨로 남으므로 set_verbosity('verbose')로 볼 수 있습니다.
+"""
+
+import logging
+import time
+from array import array
+from collections import Counter
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+# set_verbosity가 레벨을 정하는 패키지 최상위 로거 (하위 모듈 로거가 이 레벨을 따름)
+package_logger = logging.getLogger('preprocessor')
+
+# 행이 결과에서 빠지는 사유
+SKIP_REASONS = (
+    'missing',               # 결측값
+    'callable',              # 호출 가능한 객체
+    'error',                 # 문자열 변환/정리 중 예외
+    'too_short',             # 정리 전 MIN_CONTENT_LENGTH 미만
+    'empty_after_cleaning',  # 정리 후 빈 문자열
+    'tokenize_error',        # 토큰화 중 예외
+    'few_tokens',            # 토큰 수 MIN_TOKEN_COUNT 미만
+    'duplicate',             # 정리된 텍스트가 앞선 행과 같음
+)
+
+VERBOSITY_LEVELS = {
+    'quiet': logging.WARNING,
+    'normal': logging.INFO,
+    'verbose': logging.DEBUG,
+}
+
+
+def set_verbosity(verbosity='normal'):
+    """
+    preprocessor 패키지의 로그 레벨을 정하는 함수
+    verbosity: 'quiet'(경고만) / 'normal'(실행 요약) / 'verbose'(행 단위 상세) 또는 logging 레벨 숫자
+    로그 핸들러가 설정되어 있지 않으면 표준 에러로 출력하는 핸들러를 붙입니다.
+    """
+    level = VERBOSITY_LEVELS[verbosity] if isinstance(verbosity, str) else verbosity
+    package_logger.setLevel(level)
+    if not package_logger.handlers and not logging.getLogger().handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter('%(levelname)s %(name)s: %(message)s'))
+        package_logger.addHandler(handler)
+    return level
+
+
+class PreprocessStats:
+    """
+    전처리 한 번(또는 스트리밍 전체)의 집계 통계
+    입력 행 수, 제외 사유별 행 수, 결과 행의 토큰 수 분포, 경과 시간을 모읍니다.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.input_rows = 0
+        self.output_rows = 0
+        self.skipped = Counter()
+        self.token_counts = array('I')
+
+    def add_input(self, rows):
+        self.input_rows += rows
+
+    def skip(self, reason, count=1):
+        if count:
+            self.skipped[reason] += int(count)
+
+    def record_output(self, tokens):
+        """결과 행들의 토큰 목록(Series 또는 list)을 기록하는 함수"""
+        counts = [len(t) for t in tokens]
+        self.output_rows += len(counts)
+        self.token_counts.extend(counts)
+
+    def summary(self):
+        """JSON으로 저장할 수 있는 dict로 반환하는 함수"""
+        elapsed = time.perf_counter() - self.started
+        counts = np.frombuffer(self.token_counts, dtype=np.uint32) if self.token_counts else None
+        tokens = {
+            'min': int(counts.min()),
+            'p50': float(np.percentile(counts, 50)),
+            'p90': float(np.percentile(counts, 90)),
+            'max': int(counts.max()),
+            'mean': round(float(counts.mean()), 2),
+        } if counts is not None else {}
+        return {
+            'input_rows': self.input_rows,
+            'output_rows': self.output_rows,
+            'skipped': {reason: self.skipped[reason] for reason in SKIP_REASONS if self.skipped[reason]},
+            'tokens': tokens,
+            'elapsed_sec': round(elapsed, 3),
+            'rows_per_sec': round(self.input_rows / elapsed, 1) if elapsed else 0.0,
+        }
+
+    def log_summary(self, level=logging.INFO):
+        summary = self.summary()
+        skipped = ', '.join(f"{reason} {count}" for reason, count in summary['skipped'].items()) or '없음'
+        logger.log(level, f"전처리 완료: {summary['input_rows']}행 -> {summary['output_rows']}행 "
+                          f"({summary['elapsed_sec']:.2f}초, {summary['rows_per_sec']:.0f} rows/s)")
+        logger.log(level, f"제외된 행: {skipped}")
+        if summary['tokens']:
+            tokens = summary['tokens']
+            logger.log(level, f"토큰 수: 최소 {tokens['min']}, 중앙값 {tokens['p50']:.0f}, "
+                              f"p90 {tokens['p90']:.0f}, 최대 {tokens['max']}, 평균 {tokens['mean']}")
+        return summary
@@ -0,0 +1,116 @@
+# preprocessor/streaming.py
+"""
+대용량 CSV를 청크 단위로 읽어 전처리 결과를 DataFrame 묶음으로 내보내는 스트리밍 API
+
+파일 전체를 메모리에 올리지 않고 chunk_rows 행씩 읽어 전처리하므로,
+요약/임베딩 단계도 묶음 단위로 받아 일정한 메모리 안에서 처리할 수 있습니다.
+청크 사이의 중복은 정리된 텍스트의 8바이트 해시 집합으로 걸러냅니다.
+"""
+
+import hashlib
+import logging
+from typing import Iterator, Union
+
+import pandas as pd
+
+from .near_dup import NearDuplicateIndex, mark_near_duplicates
+from .parallel import ParallelTokenizer
+from .preprocess import detect_csv_encoding, load_article, preprocess_dataframe
+from .stats import PreprocessStats
+
+logger = logging.getLogger(__name__)
+
+# 기본 청크 크기 (행 수)
+DEFAULT_CHUNK_ROWS = 10000
+
+
+def content_hash(text: str) -> int:
+    """정리된 텍스트를 64비트 정수 해시로 바꾸는 함수 (청크 간 중복 확인용)"""
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def load_csv_chunks(csv_path: str, chunk_rows: int = DEFAULT_CHUNK_ROWS, workers: int = None,
+                    chunksize: int = None, tokenizer=None,
+                    near_dup_threshold: float = None) -> Iterator[pd.DataFrame]:
+    """
+    CSV 파일을 chunk_rows 행씩 읽어 전처리한 DataFrame을 차례로 내보내는 제너레이터
+
+    - 'content' 컬럼만 읽으며, 결과의 컬럼은 load_csv와 같습니다.
+    - 앞선 청크에 나온 텍스트(content_clean 기준)는 다시 내보내지 않으므로
+      모든 청크를 이어 붙이면 load_csv 결과와 같은 행이 같은 순서로 나옵니다 (index는 청크별).
+    - 전처리 후 남는 행이 없는 청크는 건너뜁니다.
+    - workers를 지정하면 토큰화 워커(JVM)를 한 번만 띄워 모든 청크에서 재사용합니다.
+    - near_dup_threshold를 지정하면 하나의 LSH 인덱스로 앞선 청크까지 포함해 유사 중복을 찾아
+      'dup_cluster', 'is_canonical' 컬럼을 붙입니다 (클러스터 번호는 스트림 전체에서 유일).
+    """
+    logger.info(f"Loading CSV in chunks of {chunk_rows} rows: {csv_path}")
+    # 청크로 읽는 도중에 디코딩 오류가 나면 다시 시작할 수 없으므로 파일 전체로 판별합니다.
+    encoding = detect_csv_encoding(csv_path, sample_bytes=None)
+    logger.info(f"Successfully loaded with {encoding} encoding")
+
+    columns = pd.read_csv(csv_path, encoding=encoding, nrows=0).columns
+    if 'content' not in columns:
+        logger.warning(f"No 'content' column found. Available columns: {columns.tolist()}")
+        return
+
+    own_tokenizer = None
+    if tokenizer is None and workers is not None and workers > 1:
+        own_tokenizer = tokenizer = ParallelTokenizer(workers=workers, chunksize=chunksize)
+
+    seen = set()
+    near_dup_index = NearDuplicateIndex(threshold=near_dup_threshold) if near_dup_threshold else None
+    # 청크 전체에 걸친 통계 (스트림이 끝날 때 한 번 요약)
+    stats = PreprocessStats()
+    try:
+        # 청크마다 dtype 추론이 달라지지 않도록 content는 항상 문자열로 읽습니다.
+        reader = pd.read_csv(csv_path, encoding=encoding, usecols=['content'],
+                             dtype={'content': str}, chunksize=chunk_rows)
+        for chunk in reader:
+            result = preprocess_dataframe(chunk, tokenizer=tokenizer, workers=workers,
+                                          chunksize=chunksize, stats=stats)
+            if result.empty:
+                continue
+
+            hashes = result['content_clean'].map(content_hash)
+            is_new = ~hashes.isin(seen)
+            seen.update(hashes[is_new])
+            stats.skip('duplicate', (~is_new).sum())
+            result = result[is_new]
+            stats.record_output(result['tokens'])
+            if near_dup_index is not None:
+                result = mark_near_duplicates(result, index=near_dup_index)
+            logger.debug(f"청크 처리: {len(chunk)}행 -> {len(result)}행 (누적 {stats.output_rows}행)")
+            if not result.empty:
+                result.attrs.update(source_path=csv_path, source_encoding=encoding)
+                yield result
+    finally:
+        stats.log_summary()
+        if own_tokenizer is not None:
+            own_tokenizer.close()
+
+
+def load_and_preprocess_chunks(source: Union[str, list],
+                               chunk_rows: int = DEFAULT_CHUNK_ROWS, **kwargs) -> Iterator[pd.DataFrame]:
+    """
+    load_and_preprocess의 스트리밍 버전
+    - CSV: load_csv_chunks로 청크 단위 결과를 내보냄 (kwargs는 load_csv_chunks로 전달)
+    - URL: 기사 하나를 DataFrame 하나로 내보냄
+    - 리스트: 각 소스의 결과를 차례로 내보냄 (실패한 소스는 건너뜀)
+    """
+    if isinstance(source, list):
+        for s in source:
+            try:
+                yield from load_and_preprocess_chunks(s, chunk_rows=chunk_rows, **kwargs)
+            except Exception as e:
+                logger.error(f"소스 '{s}' 처리 중 오류: {e}")
+                continue
+        return
+
+    if source.endswith(".csv"):
+        yield from load_csv_chunks(source, chunk_rows=chunk_rows, **kwargs)
+    elif source.startswith("http://") or source.startswith("https://"):
+        df = load_article(source)
+        if not df.empty:
+            yield df
+    else:
+        raise ValueError("지원하지 않는 입력 형식입니다. CSV 파일 경로나 기사 URL을 입력하세요.")
@@ -0,0 +1,66 @@
+# preprocessor/token_cache.py
+
+import zlib
+
+from common.sqlite_cache import SQLiteLRUCache, content_key
+
+# 토큰 사이 구분자 (토큰에는 공백/제어 문자가 들어가지 않음)
+TOKEN_SEPARATOR = '\x1f'
+# 이보다 긴 토큰 데이터만 zlib으로 압축 (짧은 데이터는 압축하면 오히려 커짐)
+COMPRESS_MIN_BYTES = 256
+
+
+def encode_tokens(tokens):
+    data = TOKEN_SEPARATOR.join(tokens).encode('utf-8')
+    if len(data) >= COMPRESS_MIN_BYTES:
+        return zlib.compress(data), 1
+    return data, 0
+
+
+def decode_tokens(data, compressed):
+    if compressed:
+        data = zlib.decompress(data)
+    text = data.decode('utf-8')
+    return text.split(TOKEN_SEPARATOR) if text else []
+
+
+class TokenCache(SQLiteLRUCache):
+    """
+    정리된 텍스트의 해시를 키로 토큰 목록을 보관하는 SQLite 디스크 캐시
+
+    - 키에는 토큰화 백엔드와 버전(namespace)이 함께 들어가므로
+      형태소 분석기나 토큰화 규칙이 바뀌면 예전 결과를 쓰지 않습니다.
+    - 토큰 데이터 크기 합이 max_bytes를 넘으면 가장 오래 사용되지 않은 항목부터 지웁니다(LRU).
+    - get_many / put_many로 여러 텍스트를 한 번의 트랜잭션으로 처리할 수 있습니다.
+    """
+
+    TABLE = 'tokens'
+    VALUE_COLUMNS = ('tokens BLOB NOT NULL', 'compressed INTEGER NOT NULL')
+
+    def __init__(self, path='token_cache.sqlite', max_bytes=100 * 1024 * 1024):
+        super().__init__(path, max_bytes)
+
+    def get(self, text, namespace=''):
+        """토큰 목록을 조회하는 함수 (없으면 None)"""
+        return self.get_many([text], namespace).get(text)
+
+    def get_many(self, texts, namespace=''):
+        """여러 텍스트의 토큰 목록을 조회해 {텍스트: 토큰 목록}으로 반환하는 함수 (없는 텍스트는 빠짐)"""
+        keys = {content_key(text, namespace): text for text in texts}
+        found = {keys[key]: decode_tokens(data, compressed) for key, (data, compressed) in self._fetch(keys).items()}
+        with self._lock:
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put(self, text, tokens, namespace=''):
+        """토큰 목록을 저장하는 함수"""
+        self.put_many({text: tokens}, namespace)
+
+    def put_many(self, tokens_by_text, namespace=''):
+        """{텍스트: 토큰 목록}을 한 번에 저장하는 함수"""
+        rows = []
+        for text, tokens in tokens_by_text.items():
+            data, compressed = encode_tokens(tokens)
+            rows.append((content_key(text, namespace), (data, compressed), len(data)))
+        self._store(rows)
@@ -0,0 +1,22 @@
+# tests/conftest.py
+import pytest
+
+from tests.page_server import PageServer
+
+
+@pytest.fixture
+def local_server():
+    server = PageServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def fake_openai():
+    from tests.fake_openai import FakeOpenAIServer
+
+    server = FakeOpenAIServer()
+    server.start()
+    yield server
+    server.stop()
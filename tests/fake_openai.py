@@ -0,0 +1,258 @@
+# tests/fake_openai.py
+"""
+테스트용 OpenAI 호환 로컬 서버
+
+/v1/chat/completions 요청에 마지막 user 메시지의 따옴표 안 텍스트를 "요약: ..."으로 돌려줍니다.
+response_format이 json_object인 묶음 요청에는 프롬프트 마지막 줄의 {ID: 기사} JSON을 {ID: "요약: 기사"}로 돌려줍니다.
+앞선 몇 번의 요청에 429를 돌려주거나 응답을 지연시켜 동시성/속도 제한을 확인할 수 있습니다.
+
+Batch API(/v1/files 업로드, /v1/batches 생성/조회, /v1/files/{id}/content)도 흉내 냅니다.
+배치는 batch_polls번 조회한 뒤 완료되며, 결과 파일은 요청과 반대 순서로 씁니다.
+"""
+
+import itertools
+import json
+import re
+import threading
+import time
+from email.parser import BytesParser
+from email.policy import default as default_policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+QUOTED_PATTERN = re.compile(r'"(.*)"', re.DOTALL)
+
+
+def to_jsonl(records):
+    return ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records).encode('utf-8')
+
+
+def fake_summary(prompt):
+    """프롬프트의 따옴표 안 기사 텍스트로 만드는 가짜 요약"""
+    match = QUOTED_PATTERN.search(prompt)
+    return f"요약: {match.group(1) if match else prompt.strip()}"
+
+
+def fake_packed_summaries(articles):
+    """{ID: 기사}로 만드는 가짜 묶음 요약 {ID: 요약} (문자열을 반환하면 그대로 응답 본문이 됨)"""
+    return {article_id: f"요약: {text}" for article_id, text in articles.items()}
+
+
+class FakeOpenAIServer:
+    """
+    OpenAI 호환 API를 흉내 내는 로컬 HTTP 서버
+    rate_limit_failures만큼의 요청에 429(retry_after_ms 헤더 포함)를 돌려줍니다.
+    """
+
+    def __init__(self):
+        self.delay = 0.0
+        self.rate_limit_failures = 0
+        self.retry_after_ms = 10
+        self.respond = fake_summary     # 프롬프트 -> 응답 텍스트
+        self.respond_packed = fake_packed_summaries   # {ID: 기사} -> {ID: 요약} 또는 응답 텍스트
+        self.requests = []              # 받은 chat completions 요청 본문
+        self.rate_limited = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.files = {}                 # 파일 ID -> {'filename', 'purpose', 'data'}
+        self.batches = {}               # 배치 ID -> 배치 객체 (dict)
+        self.batch_polls = 2            # 완료되기까지 필요한 조회 횟수
+        self.batch_failures = set()     # 배치에서 실패시킬 custom_id
+        self.batch_requests = []        # 배치로 처리한 요청 본문
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address
+        return f"http://{host}:{port}/v1"
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def chat_completion(self, body):
+        """chat completions 응답 본문 (dict)"""
+        prompt = body['messages'][-1]['content']
+        if (body.get('response_format') or {}).get('type') == 'json_object':
+            content = self.respond_packed(json.loads(prompt.strip().splitlines()[-1]))
+            if not isinstance(content, str):
+                content = json.dumps(content, ensure_ascii=False)
+        else:
+            content = self.respond(prompt)
+        prompt_tokens = sum(len(m['content']) for m in body['messages'])
+        completion_tokens = len(content)
+        return {
+            'id': f"chatcmpl-{len(self.requests)}",
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': body.get('model', 'fake'),
+            'choices': [{
+                'index': 0,
+                'message': {'role': 'assistant', 'content': content},
+                'finish_reason': 'stop',
+            }],
+            'usage': {
+                'prompt_tokens': prompt_tokens,
+                'completion_tokens': completion_tokens,
+                'total_tokens': prompt_tokens + completion_tokens,
+            },
+        }
+
+    def create_file(self, filename, purpose, data):
+        file_id = f"file-{next(self._ids)}"
+        self.files[file_id] = {'filename': filename, 'purpose': purpose, 'data': data}
+        return self.file_object(file_id)
+
+    def file_object(self, file_id):
+        entry = self.files[file_id]
+        return {
+            'id': file_id,
+            'object': 'file',
+            'bytes': len(entry['data']),
+            'created_at': int(time.time()),
+            'filename': entry['filename'],
+            'purpose': entry['purpose'],
+            'status': 'processed',
+        }
+
+    def create_batch(self, body):
+        batch_id = f"batch-{next(self._ids)}"
+        lines = self.files[body['input_file_id']]['data'].decode('utf-8').splitlines()
+        self.batches[batch_id] = {
+            'id': batch_id,
+            'object': 'batch',
+            'endpoint': body['endpoint'],
+            'input_file_id': body['input_file_id'],
+            'completion_window': body['completion_window'],
+            'created_at': int(time.time()),
+            'status': 'validating',
+            'output_file_id': None,
+            'error_file_id': None,
+            'request_counts': {'total': len(lines), 'completed': 0, 'failed': 0},
+            'polls': 0,
+        }
+        return self.batch_object(batch_id)
+
+    def batch_object(self, batch_id):
+        return {key: value for key, value in self.batches[batch_id].items() if key != 'polls'}
+
+    def poll_batch(self, batch_id):
+        """배치를 조회할 때마다 상태를 진행시키고, batch_polls번째 조회에서 요청을 처리해 완료하는 함수"""
+        batch = self.batches[batch_id]
+        if batch['status'] not in ('completed', 'failed', 'expired', 'cancelled'):
+            batch['polls'] += 1
+            if batch['polls'] >= self.batch_polls:
+                self._run_batch(batch)
+            else:
+                batch['status'] = 'in_progress'
+        return self.batch_object(batch_id)
+
+    def _run_batch(self, batch):
+        outputs, errors = [], []
+        lines = self.files[batch['input_file_id']]['data'].decode('utf-8').splitlines()
+        for line in reversed(lines):
+            request = json.loads(line)
+            custom_id = request['custom_id']
+            if custom_id in self.batch_failures:
+                errors.append({'id': f"req-{next(self._ids)}", 'custom_id': custom_id, 'response': None,
+                               'error': {'code': 'server_error', 'message': 'failed in fake batch'}})
+                continue
+            self.batch_requests.append(request['body'])
+            outputs.append({'id': f"req-{next(self._ids)}", 'custom_id': custom_id, 'error': None,
+                            'response': {'status_code': 200, 'request_id': custom_id,
+                                         'body': self.chat_completion(request['body'])}})
+        if outputs:
+            batch['output_file_id'] = self.create_file('batch_output.jsonl', 'batch_output', to_jsonl(outputs))['id']
+        if errors:
+            batch['error_file_id'] = self.create_file('batch_errors.jsonl', 'batch_output', to_jsonl(errors))['id']
+        batch['request_counts'] = {'total': len(lines), 'completed': len(outputs), 'failed': len(errors)}
+        batch['status'] = 'completed'
+        batch['completed_at'] = int(time.time())
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _send_json(self, status, payload, headers=None):
+                body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _not_found(self):
+                self._send_json(404, {'error': {'message': f"unknown path {self.path}"}})
+
+            def do_GET(self):
+                parts = self.path.strip('/').split('/')
+                with server._lock:
+                    if parts[:2] == ['v1', 'batches'] and len(parts) == 3 and parts[2] in server.batches:
+                        self._send_json(200, server.poll_batch(parts[2]))
+                    elif parts[:2] == ['v1', 'files'] and len(parts) == 4 and parts[2] in server.files:
+                        data = server.files[parts[2]]['data']
+                        self.send_response(200)
+                        self.send_header('Content-Type', 'application/octet-stream')
+                        self.send_header('Content-Length', str(len(data)))
+                        self.end_headers()
+                        self.wfile.write(data)
+                    else:
+                        self._not_found()
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                raw = self.rfile.read(length)
+                if self.path == '/v1/files':
+                    # multipart/form-data 본문을 email 파서로 나눕니다.
+                    header = f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode('utf-8')
+                    message = BytesParser(policy=default_policy).parsebytes(header + raw)
+                    fields = {part.get_param('name', header='content-disposition'): part
+                              for part in message.iter_parts()}
+                    upload = fields['file']
+                    with server._lock:
+                        payload = server.create_file(upload.get_filename(), fields['purpose'].get_content().strip(),
+                                                     upload.get_payload(decode=True))
+                    self._send_json(200, payload)
+                    return
+                if self.path == '/v1/batches':
+                    with server._lock:
+                        payload = server.create_batch(json.loads(raw))
+                    self._send_json(200, payload)
+                    return
+                if self.path != '/v1/chat/completions':
+                    self._not_found()
+                    return
+
+                body = json.loads(raw)
+                with server._lock:
+                    limited = server.rate_limit_failures > 0
+                    if limited:
+                        server.rate_limit_failures -= 1
+                        server.rate_limited += 1
+                    else:
+                        server.requests.append(body)
+                    server.in_flight += 1
+                    server.peak_in_flight = max(server.peak_in_flight, server.in_flight)
+                try:
+                    if limited:
+                        self._send_json(429, {'error': {'message': 'Rate limit reached', 'type': 'requests'}},
+                                        {'retry-after-ms': str(server.retry_after_ms)})
+                        return
+                    if server.delay:
+                        time.sleep(server.delay)
+                    self._send_json(200, server.chat_completion(body))
+                finally:
+                    with server._lock:
+                        server.in_flight -= 1
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
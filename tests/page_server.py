@@ -0,0 +1,181 @@
+# tests/page_server.py
+"""
+테스트와 벤치마크가 함께 쓰는 로컬 HTML 서버와 기사 페이지 데이터
+
+pytest / requests_mock 없이 import할 수 있으므로 benchmarks/의 재생 서버도 이 모듈을 사용합니다.
+"""
+
+import glob
+import os
+import random
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# 개별 기사 페이지에 대한 더미 HTML 응답을 정의합니다.
+MOCK_ARTICLE_HTML_POL_1 = """
+<div class="media_end_head go_trans">
+    <div class="media_end_head_top _LAZY_LOADING_WRAP">
+        <a href="#" class="media_end_head_top_logo">
+            <img alt="연합뉴스" class="media_end_head_top_logo_img" src="#">
+        </a>
+    </div>
+    <div class="media_end_head_journalist">
+        <button type="button" class="media_end_head_journalist_box">
+            <em class="media_end_head_journalist_name">김정수 기자</em>
+            <em class="media_end_head_journalist_name">최민지 기자</em>
+        </button>
+    </div>
+</div>
+"""
+
+MOCK_ARTICLE_HTML_POL_2 = """
+<div class="media_end_head go_trans">
+    <div class="media_end_head_top _LAZY_LOADING_WRAP">
+        <a href="#" class="media_end_head_top_logo">
+            <img alt="헤럴드경제" class="media_end_head_top_logo_img" src="#">
+        </a>
+    </div>
+    <div class="media_end_head_journalist">
+        <button type="button" class="media_end_head_journalist_box">
+            <em class="media_end_head_journalist_name">이진성 기자</em>
+        </button>
+    </div>
+</div>
+"""
+# 경제 뉴스 기사 모의 데이터
+MOCK_ARTICLE_HTML_ECO_1 = """
+<div class="media_end_head go_trans">
+    <div class="media_end_head_top _LAZY_LOADING_WRAP">
+        <a href="#" class="media_end_head_top_logo">
+            <img alt="매일경제" class="media_end_head_top_logo_img" src="#">
+        </a>
+    </div>
+    <div class="media_end_head_journalist">
+        <button type="button" class="media_end_head_journalist_box">
+            <em class="media_end_head_journalist_name">박은정 기자</em>
+        </button>
+    </div>
+</div>
+"""
+
+
+def load_article_templates():
+    """저장된 기사 페이지(tests/fixtures)와 크롤러 테스트용 기사 HTML을 불러오는 함수"""
+    templates = []
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, 'article_*.html'))):
+        with open(path, encoding='utf-8') as f:
+            templates.append(f.read())
+    templates.extend([MOCK_ARTICLE_HTML_POL_1, MOCK_ARTICLE_HTML_POL_2, MOCK_ARTICLE_HTML_ECO_1])
+    return templates
+
+
+class PageServer:
+    """
+    경로별 HTML을 돌려주는 로컬 HTTP 서버
+    pages에 경로별 HTML을 등록해 두면 실제 네트워크 대신 이 서버에서 응답합니다.
+
+    - failures: 경로별로 앞선 몇 번의 요청에 503을 돌려줍니다.
+    - latency: 모든 응답에 더할 지연 시간(초), jitter: 지연 시간에 더할 무작위 범위(초)
+    - error_rate: 무작위로 503 오류를 돌려줄 확률 (seed로 재현 가능)
+    - 응답에 ETag를 붙이고, If-None-Match가 같으면 304를 돌려줍니다.
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, seed=42, host='127.0.0.1', port=0):
+        self.pages = {}
+        self.failures = {}
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.requests = 0
+        self.errors = 0
+        self.request_log = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address
+        return f"http://{host}:{port}"
+
+    def url(self, path):
+        return f"{self.base_url}{path}"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # keep-alive 연결 재사용을 허용합니다.
+            disable_nagle_algorithm = True  # 헤더와 본문을 따로 보낼 때 생기는 지연을 막습니다.
+
+            def _send_empty(self, status, headers=None):
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def do_GET(self):
+                with server._lock:
+                    server.requests += 1
+                    server.request_log.append(self.path)
+                    server.in_flight += 1
+                    server.peak_in_flight = max(server.peak_in_flight, server.in_flight)
+                    remaining = server.failures.get(self.path, 0)
+                    if remaining:
+                        server.failures[self.path] = remaining - 1
+                    fail = bool(remaining) or server._random.random() < server.error_rate
+                    if fail:
+                        server.errors += 1
+                    delay = server.latency + server._random.uniform(0, server.jitter)
+                try:
+                    if delay:
+                        time.sleep(delay)
+                    if fail:
+                        self._send_empty(503)
+                        return
+                    page = server.pages.get(self.path)
+                    if page is None:
+                        self._send_empty(404)
+                        return
+                    body = page.encode('utf-8')
+                    etag = '"%08x"' % zlib.crc32(body)
+                    if self.headers.get('If-None-Match') == etag:
+                        self._send_empty(304, {'ETag': etag})
+                        return
+                    self.send_response(200)
+                    self.send_header('ETag', etag)
+                    self.send_header('Content-Type', 'text/html; charset=utf-8')
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                finally:
+                    with server._lock:
+                        server.in_flight -= 1
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -2,9 +2,19 @@
 import pytest
 import os
 import csv
+import json
+import time
 import requests_mock
-from crawler.crawler import crawl_news_articles, crawl_multiple_sections, save_data_to_csv, get_reporter_and_agency
+from crawler.crawler import crawl_news_articles, crawl_multiple_sections, save_data_to_csv, deep_crawl
+from crawler.http_client import HttpClient, get_default_client, DEFAULT_TIMEOUT
+from crawler.cache import ResponseCache
+from crawler.frontier import CrawlFrontier
+from crawler.seen_index import SeenArticleIndex, parse_article_key
+from crawler.rate_limit import TokenBucket, HostRateLimiter
+from crawler.sink import CsvSink, JsonlSink, NEWS_FIELDS
+from crawler.metrics import CrawlMetrics, MetricsHook
 from datetime import date
+from tests.page_server import MOCK_ARTICLE_HTML_POL_1, MOCK_ARTICLE_HTML_POL_2, MOCK_ARTICLE_HTML_ECO_1
 
 # 테스트에 사용할 임시 파일 경로를 정의합니다.
 TEST_CSV_PATH = "tests/test_output.csv"
@@ -46,53 +56,6 @@ MOCK_HTML_ECONOMY = """
 </div>
 """
 
-# 개별 기사 페이지에 대한 더미 HTML 응답을 정의합니다.
-MOCK_ARTICLE_HTML_POL_1 = """
-<div class="media_end_head go_trans">
-    <div class="media_end_head_top _LAZY_LOADING_WRAP">
-        <a href="#" class="media_end_head_top_logo">
-            <img alt="연합뉴스" class="media_end_head_top_logo_img" src="#">
-        </a>
-    </div>
-    <div class="media_end_head_journalist">
-        <button type="button" class="media_end_head_journalist_box">
-            <em class="media_end_head_journalist_name">김정수 기자</em>
-            <em class="media_end_head_journalist_name">최민지 기자</em>
-        </button>
-    </div>
-</div>
-"""
-
-MOCK_ARTICLE_HTML_POL_2 = """
-<div class="media_end_head go_trans">
-    <div class="media_end_head_top _LAZY_LOADING_WRAP">
-        <a href="#" class="media_end_head_top_logo">
-            <img alt="헤럴드경제" class="media_end_head_top_logo_img" src="#">
-        </a>
-    </div>
-    <div class="media_end_head_journalist">
-        <button type="button" class="media_end_head_journalist_box">
-            <em class="media_end_head_journalist_name">이진성 기자</em>
-        </button>
-    </div>
-</div>
-"""
-# 경제 뉴스 기사 모의 데이터
-MOCK_ARTICLE_HTML_ECO_1 = """
-<div class="media_end_head go_trans">
-    <div class="media_end_head_top _LAZY_LOADING_WRAP">
-        <a href="#" class="media_end_head_top_logo">
-            <img alt="매일경제" class="media_end_head_top_logo_img" src="#">
-        </a>
-    </div>
-    <div class="media_end_head_journalist">
-        <button type="button" class="media_end_head_journalist_box">
-            <em class="media_end_head_journalist_name">박은정 기자</em>
-        </button>
-    </div>
-</div>
-"""
-
 @pytest.fixture(scope="module", autouse=True)
 def setup_and_teardown():
     # 테스트가 끝난 후에 임시 파일을 삭제합니다.
@@ -167,4 +130,389 @@ def test_save_data_to_csv_creates_file_with_new_fields():
     assert rows[0]['news_agency'] == '연합뉴스'
     assert rows[0]['reporters'] == '김철수'
     assert rows[1]['news_agency'] == '매일경제'
-    assert rows[1]['reporters'] == '박영희'
\ No newline at end of file
+    assert rows[1]['reporters'] == '박영희'
+
+def _register_section(server, count):
+    """로컬 서버에 섹션 페이지와 기사 페이지를 등록하고 섹션 URL을 반환합니다."""
+    agencies = ['연합뉴스', '헤럴드경제', '매일경제']
+    items = []
+    for i in range(count):
+        items.append(
+            f'<li class="sa_item _SECTION_HEADLINE"><div class="sa_text">'
+            f'<a href="{server.url(f"/article/{i}")}" class="sa_text_title">'
+            f'<strong class="sa_text_strong">기사 제목 {i}</strong></a></div></li>'
+        )
+        server.pages[f'/article/{i}'] = (
+            f'<a class="media_end_head_top_logo"><img alt="{agencies[i % 3]}"></a>'
+            f'<em class="media_end_head_journalist_name">기자{i}</em>'
+            f'<div id="dic_area">본문 {i}<br>둘째 줄</div>'
+        )
+    server.pages['/section'] = f'<ul>{"".join(items)}</ul>'
+    return server.url('/section')
+
+
+def test_crawl_news_articles_concurrent_matches_sequential(local_server):
+    """
+    동시 수집 모드가 순차 수집과 같은 순서와 형태의 데이터를 반환하고
+    동시 요청 수가 max_workers를 넘지 않는지 테스트
+    """
+    section_url = _register_section(local_server, 6)
+    local_server.latency = 0.05
+
+    sequential = crawl_news_articles(section_url)
+    assert local_server.peak_in_flight == 1
+
+    local_server.peak_in_flight = 0
+    concurrent = crawl_news_articles(section_url, max_workers=3)
+
+    assert concurrent == sequential
+    assert [a['content'] for a in concurrent] == [f'기사 제목 {i}' for i in range(6)]
+    assert concurrent[4]['news_agency'] == '헤럴드경제'
+    assert concurrent[4]['full_content'] == '본문 4\n둘째 줄'
+    assert 1 < local_server.peak_in_flight <= 3
+
+
+def test_http_client_retries_server_errors_and_reuses_session(local_server):
+    """
+    공유 HttpClient가 5xx 응답을 백오프 후 재시도하고
+    기본 타임아웃 정책을 적용하는지 테스트
+    """
+    local_server.pages['/flaky'] = '<p>ok</p>'
+    local_server.failures['/flaky'] = 2
+
+    client = HttpClient(backoff_factor=0.01)
+    response = client.get(local_server.url('/flaky'))
+
+    assert response.status_code == 200
+    assert response.text == '<p>ok</p>'
+    assert local_server.request_log.count('/flaky') == 3
+    assert get_default_client() is get_default_client()
+    assert get_default_client().timeout == DEFAULT_TIMEOUT
+    # 동시 수집에서도 호스트별 속도 제한이 기본으로 걸려 있습니다.
+    assert isinstance(get_default_client().rate_limiter, HostRateLimiter)
+
+
+def test_http_client_retries_take_rate_limiter_tokens(local_server):
+    """rate_limiter가 있으면 5xx 재시도도 매번 호스트 토큰을 받은 뒤 보내는지 테스트"""
+    class CountingLimiter(HostRateLimiter):
+        def __init__(self):
+            super().__init__(rate=1000, burst=10)
+            self.acquired = 0
+
+        def acquire(self, url):
+            self.acquired += 1
+            return super().acquire(url)
+
+    local_server.pages['/flaky'] = '<p>ok</p>'
+    local_server.failures['/flaky'] = 2
+    limiter = CountingLimiter()
+
+    client = HttpClient(backoff_factor=0.01, rate_limiter=limiter)
+    response = client.get(local_server.url('/flaky'))
+
+    assert response.status_code == 200
+    assert local_server.request_log.count('/flaky') == 3
+    assert limiter.acquired == 3
+
+
+def test_response_cache_revalidates_trusts_and_evicts(local_server, tmp_path):
+    """
+    디스크 캐시가 ETag 조건부 요청(304)과 신뢰 모드, LRU 제거를 올바르게 처리하는지 테스트
+    """
+    local_server.pages['/a'] = '<p>기사 A</p>' * 50
+    local_server.pages['/b'] = '<p>기사 B</p>' * 50
+
+    cache = ResponseCache(str(tmp_path / 'cache.sqlite'))
+    client = HttpClient(cache=cache)
+
+    first = client.get(local_server.url('/a'))
+    second = client.get(local_server.url('/a'))
+    assert first.text == second.text == '<p>기사 A</p>' * 50
+    assert getattr(second, 'from_cache', False)
+    assert cache.stats()['misses'] == 1
+    assert cache.stats()['revalidated'] == 1
+    assert len(local_server.request_log) == 2
+
+    # 신뢰 모드에서는 네트워크 요청 없이 캐시에서 바로 응답합니다.
+    cache.trust_hours = 1
+    assert client.get(local_server.url('/a')).text == first.text
+    assert len(local_server.request_log) == 2
+    assert cache.stats()['hits'] == 1
+
+    # 용량을 한 항목 크기로 줄이면 가장 오래 사용되지 않은 항목이 제거됩니다.
+    cache.max_bytes = cache.stats()['bytes']
+    client.get(local_server.url('/b'))
+    assert cache.get(local_server.url('/a')) is None
+    assert cache.get(local_server.url('/b')) is not None
+    assert cache.stats()['evictions'] == 1
+    cache.close()
+
+
+def test_incremental_crawl_skips_seen_articles(local_server, tmp_path):
+    """
+    증분 모드에서 이미 수집한 (oid, aid) 기사는 상세 페이지를 다시 요청하지 않는지 테스트
+    """
+    assert parse_article_key('https://n.news.naver.com/mnews/article/015/0005175719') == 15 * 10 ** 10 + 5175719
+    assert parse_article_key('https://n.news.naver.com/article/015/0005175719?sid=101') == 15 * 10 ** 10 + 5175719
+    assert parse_article_key('http://mock-url/pol1') is None
+
+    def headline(aid):
+        return (f'<li class="sa_item _SECTION_HEADLINE"><a class="sa_text_title" '
+                f'href="{local_server.url(f"/mnews/article/015/{aid}")}">'
+                f'<strong class="sa_text_strong">기사 {aid}</strong></a></li>')
+
+    for aid in ('0000000001', '0000000002', '0000000003'):
+        local_server.pages[f'/mnews/article/015/{aid}'] = f'<div id="dic_area">본문 {aid}</div>'
+    local_server.pages['/section'] = headline('0000000001') + headline('0000000002')
+
+    index_path = str(tmp_path / 'seen.idx')
+    seen_index = SeenArticleIndex(index_path)
+    first = crawl_news_articles(local_server.url('/section'), seen_index=seen_index)
+    seen_index.save()
+    assert [a['content'] for a in first] == ['기사 0000000001', '기사 0000000002']
+
+    # 새 프로세스처럼 파일에서 인덱스를 다시 읽고, 헤드라인에 새 기사 하나를 추가합니다.
+    local_server.request_log.clear()
+    local_server.pages['/section'] += headline('0000000003')
+    seen_index = SeenArticleIndex(index_path)
+    assert len(seen_index) == 2
+
+    second = crawl_news_articles(local_server.url('/section'), seen_index=seen_index)
+    assert [a['content'] for a in second] == ['기사 0000000003']
+    assert second[0]['index'] == 2
+    assert local_server.request_log == ['/section', '/mnews/article/015/0000000003']
+
+
+def test_token_bucket_limits_request_rate():
+    """토큰 버킷이 burst 이후의 요청을 초당 rate개로 제한하는지 테스트"""
+    bucket = TokenBucket(rate=50, burst=2)
+    started = time.perf_counter()
+    for _ in range(12):
+        bucket.acquire()
+    # 처음 2개는 즉시, 나머지 10개는 50/초 속도로 진행되어야 합니다.
+    assert time.perf_counter() - started >= 10 / 50 * 0.9
+
+
+def test_crawl_multiple_sections_in_parallel_with_rate_limiter(local_server, capsys):
+    """
+    섹션을 병렬로 크롤링해도 결과 순서가 유지되고,
+    호스트별 속도 제한과 섹션별 소요 시간 보고가 동작하는지 테스트
+    """
+    section_url = _register_section(local_server, 3)
+    local_server.pages['/section2'] = local_server.pages['/section']
+    urls = {'정치': section_url, '경제': local_server.url('/section2')}
+
+    client = HttpClient(rate_limiter=HostRateLimiter(rate=40, burst=1))
+    started = time.perf_counter()
+    articles = crawl_multiple_sections(urls, max_workers=3, client=client, section_workers=2)
+    elapsed = time.perf_counter() - started
+
+    assert [a['category'] for a in articles] == ['정치'] * 3 + ['경제'] * 3
+    assert [a['content'] for a in articles[:3]] == ['기사 제목 0', '기사 제목 1', '기사 제목 2']
+    # 요청 8개(섹션 2 + 기사 6) 중 첫 번째를 뺀 7개는 초당 40개 이하로 나가야 합니다.
+    assert len(local_server.request_log) == 8
+    assert elapsed >= 7 / 40 * 0.9
+
+    output = capsys.readouterr().out
+    assert '섹션별 소요 시간' in output
+    assert '[경제] 3개 기사' in output
+
+
+def test_streaming_sink_writes_rows_as_articles_complete(local_server, tmp_path):
+    """
+    스트리밍 출력이 고정 스키마로 기사마다 바로 기록되고,
+    collect=False이면 결과를 메모리에 모으지 않는지 테스트
+    """
+    section_url = _register_section(local_server, 3)
+    csv_path = str(tmp_path / 'stream.csv')
+    jsonl_path = str(tmp_path / 'stream.jsonl')
+
+    with CsvSink(csv_path) as sink:
+        # 스키마에 없는 필드는 무시하고, 빠진 필드는 빈 값으로 기록합니다.
+        sink.write({'index': 99, 'content': '수동 행', 'extra': '무시됨'})
+        with open(csv_path, encoding='utf-8') as f:
+            assert list(csv.DictReader(f))[0]['content'] == '수동 행'
+
+        result = crawl_multiple_sections({'정치': section_url}, max_workers=2, sink=sink, collect=False)
+        assert result == []
+
+    with open(csv_path, encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        rows = list(reader)
+    assert reader.fieldnames == NEWS_FIELDS
+    assert rows[0]['link'] == ''
+    assert sorted(r['content'] for r in rows[1:]) == ['기사 제목 0', '기사 제목 1', '기사 제목 2']
+    assert all(r['category'] == '정치' for r in rows[1:])
+
+    with JsonlSink(jsonl_path) as sink:
+        crawl_news_articles(section_url, sink=sink)
+    with open(jsonl_path, encoding='utf-8') as f:
+        records = [json.loads(line) for line in f]
+    assert [r['content'] for r in records] == ['기사 제목 0', '기사 제목 1', '기사 제목 2']
+    assert records[0]['category'] == ''
+
+
+def test_failed_articles_are_not_written_to_sink(local_server, tmp_path):
+    """
+    상세 페이지 요청에 실패한 기사는 sink와 인덱스에 남기지 않고,
+    다음 실행에서 성공하면 그때 한 번만 기록되는지 테스트
+    """
+    items = ''
+    for i in range(3):
+        path = f'/mnews/article/015/000000000{i}'
+        local_server.pages[path] = (f'<a class="media_end_head_top_logo"><img alt="언론사{i}"></a>'
+                                    f'<div id="dic_area">본문 {i}</div>')
+        items += (f'<li class="sa_item _SECTION_HEADLINE"><a class="sa_text_title" href="{local_server.url(path)}">'
+                  f'<strong class="sa_text_strong">기사 제목 {i}</strong></a></li>')
+    local_server.pages['/section'] = items
+    section_url = local_server.url('/section')
+    missing = local_server.pages.pop('/mnews/article/015/0000000001')
+    seen_index = SeenArticleIndex(str(tmp_path / 'seen.idx'))
+    csv_path = str(tmp_path / 'articles.csv')
+
+    with CsvSink(csv_path) as sink:
+        rows = crawl_news_articles(section_url, seen_index=seen_index, sink=sink)
+    # 반환 목록에는 실패한 기사도 기본값으로 남습니다.
+    assert [r['news_agency'] for r in rows] == ['언론사0', 'No Agency', '언론사2']
+
+    local_server.pages['/mnews/article/015/0000000001'] = missing
+    with CsvSink(csv_path, append=True) as sink:
+        crawl_news_articles(section_url, seen_index=seen_index, sink=sink)
+
+    with open(csv_path, encoding='utf-8') as f:
+        written = list(csv.DictReader(f))
+    assert [r['content'] for r in written] == ['기사 제목 0', '기사 제목 2', '기사 제목 1']
+    assert all(r['news_agency'] != 'No Agency' for r in written)
+
+
+def test_deep_crawl_follows_pages_and_resumes_from_journal(local_server, tmp_path):
+    """
+    딥 크롤링이 날짜별 페이지를 따라가고,
+    중간에 중단된 뒤 다시 실행하면 완료된 기사를 다시 요청하지 않고 이어서 진행하는지 테스트
+    """
+    # 날짜마다 3페이지(페이지당 기사 2개)가 있고, 4페이지부터는 마지막 페이지가 반복됩니다.
+    for day in ('20250101', '20250102'):
+        for page in range(1, 6):
+            items = ''
+            for n in range(2):
+                num = min(page, 3) * 10 + n
+                path = f'/article/{day}/{num}'
+                local_server.pages[path] = f'<div id="dic_area">{day} 본문 {num}</div>'
+                items += (f'<li class="sa_item"><a class="sa_text_title" href="{local_server.url(path)}">'
+                          f'<strong class="sa_text_strong">{day} 기사 {num}</strong></a></li>')
+            local_server.pages[f'/section?date={day}&page={page}'] = f'<ul>{items}</ul>'
+
+    class InterruptingSink:
+        """일곱 번째 기사를 기록하려는 순간 강제 종료를 흉내 내는 sink"""
+        def __init__(self, fail_at=None):
+            self.rows = []
+            self.fail_at = fail_at
+
+        def write(self, row):
+            if len(self.rows) + 1 == self.fail_at:
+                raise KeyboardInterrupt
+            self.rows.append(row)
+
+    urls = {'정치': local_server.url('/section')}
+    journal = str(tmp_path / 'journal.jsonl')
+
+    first_sink = InterruptingSink(fail_at=7)
+    with pytest.raises(KeyboardInterrupt):
+        deep_crawl(urls, '2025-01-01', '2025-01-02', max_pages=5, journal_path=journal, sink=first_sink)
+    assert len(first_sink.rows) == 6
+
+    second_sink = InterruptingSink()
+    collected = deep_crawl(urls, '2025-01-01', '2025-01-02', max_pages=5, journal_path=journal, sink=second_sink)
+    assert collected == 6
+
+    rows = first_sink.rows + second_sink.rows
+    assert len({r['link'] for r in rows}) == 12
+    assert {r['date'] for r in rows} == {'2025-01-01', '2025-01-02'}
+
+    # 기록까지 끝난 기사는 다시 요청하지 않습니다. (중단 순간의 기사 하나만 재요청)
+    article_requests = [p for p in local_server.request_log if p.startswith('/article/')]
+    assert len(article_requests) == 13
+    # 4페이지에서 3페이지 목록이 반복되므로 5페이지는 요청하지 않습니다.
+    assert not any(p.endswith('page=5') for p in local_server.request_log)
+
+    # 모두 끝난 뒤 다시 실행하면 아무것도 요청하지 않습니다.
+    local_server.request_log.clear()
+    assert deep_crawl(urls, '2025-01-01', '2025-01-02', max_pages=5, journal_path=journal) == 0
+
+
+def test_deep_crawl_does_not_count_or_write_failed_articles(local_server, tmp_path):
+    """딥 크롤링에서 상세 페이지 요청에 실패한 기사는 sink, 저널, 수집 수에서 모두 빠지는지 테스트"""
+    items = ''
+    for n in range(3):
+        path = f'/article/20250101/{n}'
+        local_server.pages[path] = f'<div id="dic_area">본문 {n}</div>'
+        items += (f'<li class="sa_item"><a class="sa_text_title" href="{local_server.url(path)}">'
+                  f'<strong class="sa_text_strong">기사 {n}</strong></a></li>')
+    local_server.pages['/section?date=20250101&page=1'] = f'<ul>{items}</ul>'
+    del local_server.pages['/article/20250101/1']
+    urls = {'정치': local_server.url('/section')}
+    journal = str(tmp_path / 'journal.jsonl')
+
+    class ListSink:
+        def __init__(self):
+            self.rows = []
+
+        def write(self, row):
+            self.rows.append(row)
+
+    first_sink = ListSink()
+    assert deep_crawl(urls, '2025-01-01', '2025-01-01', max_pages=1, journal_path=journal, sink=first_sink) == 2
+    assert [r['content'] for r in first_sink.rows] == ['기사 0', '기사 2']
+
+    # 실패한 기사는 저널에도 수집 완료로 남지 않습니다.
+    frontier = CrawlFrontier(journal)
+    assert frontier.seen_links == {local_server.url(f'/article/20250101/{n}') for n in (0, 2)}
+    frontier.close()
+
+
+def test_crawl_metrics_records_stages_counters_and_failures(local_server, tmp_path):
+    """
+    CrawlMetrics가 단계별 타이머, 바이트 수, 상태 코드, 실패를 기록하고
+    훅과 JSON 요약 내보내기가 동작하는지 테스트
+    """
+    section_url = _register_section(local_server, 3)
+    del local_server.pages['/article/1']  # 404 응답
+    local_server.pages['/section'] += (
+        '<li class="sa_item _SECTION_HEADLINE"><a class="sa_text_title" href="http://127.0.0.1:1/closed">'
+        '<strong class="sa_text_strong">연결 실패</strong></a></li>'
+    )
+
+    class RecordingHook(MetricsHook):
+        def __init__(self):
+            self.timings = []
+            self.failures = []
+
+        def on_timing(self, stage, seconds):
+            self.timings.append(stage)
+
+        def on_failure(self, stage, url, error):
+            self.failures.append((stage, url))
+
+    hook = RecordingHook()
+    metrics = CrawlMetrics(hooks=[hook])
+    client = HttpClient(retries=0)
+    articles = crawl_multiple_sections({'정치': section_url}, client=client, metrics=metrics)
+    assert len(articles) == 4
+
+    summary = metrics.summary()
+    assert summary['timers']['section_fetch']['count'] == 1
+    assert summary['timers']['article_fetch']['count'] == 4
+    assert summary['timers']['parse']['count'] == 3
+    assert summary['timers']['section']['count'] == 1
+    assert summary['status_codes'] == {'200': 3, '404': 1}
+    assert summary['counters']['headlines'] == 4
+    assert summary['counters']['bytes_downloaded'] > 0
+    assert summary['counters']['failures.article_fetch'] == 1
+    assert summary['counters']['articles_without_content'] == 1
+    assert summary['failures'][0]['url'] == 'http://127.0.0.1:1/closed'
+    assert hook.failures == [('article_fetch', 'http://127.0.0.1:1/closed')]
+    assert 'clean' in hook.timings
+
+    path = metrics.export_json(str(tmp_path / 'metrics.json'))
+    with open(path, encoding='utf-8') as f:
+        assert json.load(f)['counters']['articles'] == 3
@@ -0,0 +1,70 @@
+# tests/test_parsers.py
+import json
+import logging
+import os
+
+import pytest
+
+from crawler import parsers
+from crawler.parsers import PARSER_BACKENDS, HAS_LXML, parse_article_html, clean_article_text
+from tests.page_server import MOCK_ARTICLE_HTML_POL_1, MOCK_ARTICLE_HTML_POL_2, MOCK_ARTICLE_HTML_ECO_1
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+# 저장된 기사 페이지와 기존 html.parser 전체 파싱 방식으로 얻은 기대 결과
+with open(os.path.join(FIXTURE_DIR, 'article_expected.json'), encoding='utf-8') as f:
+    EXPECTED = json.load(f)
+
+
+def _load_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def _details(html, parser):
+    """get_article_details와 같은 방식으로 (뉴스사, 기자, 본문)을 만드는 함수"""
+    agency, reporters, content_text = parse_article_html(html, parser=parser)
+    content_text = clean_article_text(content_text) if content_text is not None else "No Content"
+    return [agency, reporters, content_text.strip()]
+
+
+def _backends():
+    return [pytest.param(b, marks=pytest.mark.skipif(b == 'lxml' and not HAS_LXML, reason="lxml not installed"))
+            for b in PARSER_BACKENDS]
+
+
+@pytest.mark.parametrize('parser', _backends())
+@pytest.mark.parametrize('fixture_name', sorted(EXPECTED))
+def test_parser_backends_match_saved_fixtures(fixture_name, parser):
+    """모든 파서 백엔드가 저장된 기사 페이지에서 동일한 뉴스사/기자/본문을 추출하는지 테스트"""
+    assert _details(_load_fixture(fixture_name), parser) == EXPECTED[fixture_name]
+
+
+@pytest.mark.parametrize('parser', _backends())
+def test_parser_backends_match_full_parse_on_mock_articles(parser):
+    """크롤러 테스트용 기사 HTML에서도 기존 전체 파싱 결과와 같은지 테스트"""
+    for html in (MOCK_ARTICLE_HTML_POL_1, MOCK_ARTICLE_HTML_POL_2, MOCK_ARTICLE_HTML_ECO_1):
+        assert _details(html, parser) == _details(html, 'html.parser')
+
+
+def test_unknown_parser_raises():
+    with pytest.raises(ValueError):
+        parse_article_html('<div></div>', parser='regex')
+
+
+@pytest.mark.parametrize('parser', _backends())
+def test_parser_backends_handle_empty_document(parser):
+    """빈 응답(404 등)에서도 모든 백엔드가 같은 기본값을 반환하는지 테스트"""
+    assert _details('', parser) == ['No Agency', 'No Reporter', 'No Content']
+
+
+def test_lxml_fallback_warns_once(monkeypatch, caplog):
+    """lxml이 없을 때 strainer로 대신 파싱하고, 경고는 기사마다가 아니라 한 번만 남기는지 테스트"""
+    monkeypatch.setattr(parsers, 'HAS_LXML', False)
+    monkeypatch.setattr(parsers, '_lxml_fallback_warned', False)
+
+    with caplog.at_level(logging.WARNING, logger='crawler.parsers'):
+        for html in (MOCK_ARTICLE_HTML_POL_1, MOCK_ARTICLE_HTML_POL_2):
+            assert _details(html, 'lxml') == _details(html, 'strainer')
+
+    assert len([r for r in caplog.records if r.name == 'crawler.parsers']) == 1
@@ -0,0 +1,365 @@
+# tests/test_preprocessor.py
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from preprocessor import ParallelTokenizer, clean_text, load_csv, preprocess_dataframe, tokenize_texts
+from preprocessor.preprocess import clean_text_series
+
+# 테스트에 사용할 임시 파일 경로를 정의합니다.
+TEST_INPUT_CSV_PATH = "tests/test_preprocess_input.csv"
+
+# 결측값, 짧은 텍스트, 링크/특수문자, 중복(정리 후 같은 텍스트), 숫자 등 다양한 경우를 담은 데이터
+MIXED_CONTENT = [
+    '정부가 내년도 예산안을 국회에 제출했다',
+    None,
+    '짧다',
+    'https://n.news.naver.com/article/015/0005175719',
+    '정부가   내년도 예산안을 국회에 제출했다!!',
+    '"반도체 수출" 석 달 연속 증가… 업계 기대감 커져',
+    np.nan,
+    'Fed holds interest rates steady amid inflation concerns',
+    '   ',
+    12345678,
+    '삼성전자 3분기 실적 발표 http://example.com 영업이익 증가',
+    '★☆★☆★☆',
+    '반도체 수출 석 달 연속 증가 업계 기대감 커져',
+    '서울 아침 기온 영하 5도 출근길 추위',
+]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup_and_teardown():
+    yield
+    if os.path.exists(TEST_INPUT_CSV_PATH):
+        os.remove(TEST_INPUT_CSV_PATH)
+
+
+def test_clean_text_series_matches_clean_text():
+    """일괄 정리 함수가 clean_text와 같은 결과를 내는지 테스트"""
+    texts = pd.Series([t for t in MIXED_CONTENT if isinstance(t, str)])
+    assert clean_text_series(texts).tolist() == [clean_text(t) for t in texts]
+
+
+def test_batch_preprocessing_matches_row_wise():
+    """일괄 처리 경로가 행 단위 처리와 index까지 동일한 결과를 내는지 테스트"""
+    df = pd.DataFrame({'content': MIXED_CONTENT})
+
+    row_wise = preprocess_dataframe(df.copy(), batch=False)
+    batch = preprocess_dataframe(df.copy(), batch=True)
+
+    pd.testing.assert_frame_equal(batch, row_wise)
+    assert len(batch) > 0
+    assert '정부가 내년도 예산안을 국회에 제출했다' in batch['content_clean'].tolist()
+
+
+def test_load_csv_batch_matches_row_wise():
+    """CSV 파일 입력에서도 두 경로의 결과가 같은지 테스트"""
+    pd.DataFrame({'content': MIXED_CONTENT, 'link': range(len(MIXED_CONTENT))}).to_csv(
+        TEST_INPUT_CSV_PATH, index=False)
+
+    pd.testing.assert_frame_equal(load_csv(TEST_INPUT_CSV_PATH, batch=True),
+                                  load_csv(TEST_INPUT_CSV_PATH, batch=False))
+
+
+def test_parallel_tokenization_keeps_order():
+    """여러 프로세스로 나눠 토큰화해도 입력 순서와 결과가 순차 처리와 같은지 테스트"""
+    texts = [clean_text(t) for t in MIXED_CONTENT if isinstance(t, str) and clean_text(t)]
+
+    with ParallelTokenizer(workers=2, chunksize=1) as tokenizer:
+        first = tokenizer.tokenize(texts)
+        # 같은 워커를 재사용해 한 번 더 호출
+        second = tokenizer.tokenize(list(reversed(texts)))
+
+    expected = tokenize_texts(texts)
+    assert first == expected
+    assert second == list(reversed(expected))
+
+
+def test_parallel_batch_preprocessing_matches_serial():
+    """workers를 지정한 일괄 처리가 순차 일괄 처리와 같은 결과를 내는지 테스트"""
+    df = pd.DataFrame({'content': MIXED_CONTENT})
+
+    pd.testing.assert_frame_equal(preprocess_dataframe(df.copy(), workers=2),
+                                  preprocess_dataframe(df.copy()))
+
+
+def test_import_has_no_heavy_side_effects():
+    """패키지 import만으로 JVM/NLTK/langdetect가 불러와지지 않는지 테스트"""
+    from benchmarks.bench_import import measure_import
+
+    _, heavy = measure_import('preprocessor')
+    assert heavy == []
+
+
+def test_import_keeps_warning_filters():
+    """패키지 import가 프로세스 전체의 경고 필터를 바꾸지 않는지 테스트"""
+    import subprocess
+    import sys
+
+    script = ("import warnings; before = list(warnings.filters); import preprocessor; "
+              "print(warnings.filters[:len(warnings.filters) - len(before)])")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run([sys.executable, '-c', script], cwd=root,
+                            capture_output=True, text=True, check=True).stdout
+    assert "'ignore', None, <class 'Warning'>" not in output
+
+
+def test_resources_are_created_lazily_once():
+    """리소스가 처음 사용할 때 한 번만 만들어지는지 테스트"""
+    from preprocessor import resources
+
+    calls = []
+    resources.register('test_resource', lambda: calls.append(1) or object())
+    assert not resources.is_loaded('test_resource')
+
+    first = resources.get('test_resource')
+    resources.warm_up(['test_resource'])
+    assert resources.get('test_resource') is first
+    assert calls == [1]
+
+
+@pytest.fixture
+def token_cache(tmp_path):
+    from preprocessor.preprocess import configure_token_cache
+
+    cache = configure_token_cache(str(tmp_path / 'tokens.sqlite'))
+    yield cache
+    configure_token_cache(None)
+    cache.close()
+
+
+def test_token_cache_reuses_results_across_runs(token_cache):
+    """토큰 캐시를 켜도 결과가 같고, 두 번째 실행은 모두 캐시에서 가져오는지 테스트"""
+    df = pd.DataFrame({'content': MIXED_CONTENT})
+    expected = preprocess_dataframe(df.copy(), batch=False)
+
+    first = preprocess_dataframe(df.copy())
+    misses = token_cache.misses
+    second = preprocess_dataframe(df.copy())
+
+    pd.testing.assert_frame_equal(first, expected)
+    pd.testing.assert_frame_equal(second, expected)
+    assert token_cache.misses == misses
+    assert token_cache.stats()['hit_ratio'] > 0
+
+
+def test_token_cache_roundtrip_namespace_and_eviction(tmp_path):
+    """토큰 목록 저장/조회, 네임스페이스 구분, 용량 초과 시 LRU 정리를 테스트"""
+    from preprocessor.token_cache import TokenCache
+
+    cache = TokenCache(str(tmp_path / 'tokens.sqlite'), max_bytes=2000)
+    long_tokens = ['반도체'] * 200  # 압축 저장되는 긴 토큰 목록
+    cache.put('긴 문서', long_tokens, namespace='v1')
+    cache.put('빈 문서', [], namespace='v1')
+
+    assert cache.get('긴 문서', namespace='v1') == long_tokens
+    assert cache.get('빈 문서', namespace='v1') == []
+    assert cache.get('긴 문서', namespace='v2') is None
+
+    cache.put_many({f'문서 {i}': [f'토큰{i}'] * 30 for i in range(50)}, namespace='v1')
+    stats = cache.stats()
+    assert stats['bytes'] <= 2000
+    assert stats['evictions'] > 0
+    assert cache.get('문서 49', namespace='v1') == ['토큰49'] * 30
+    cache.close()
+
+
+def test_language_detection_batch_matches_scalar_and_skips_slow_path():
+    """일괄 언어 감지가 하나씩 감지한 결과와 같고, 분명한 텍스트는 langdetect를 쓰지 않는지 테스트"""
+    from preprocessor.language import (detect_language_batch, detect_language_safe,
+                                       language_detection_stats, reset_language_detection_stats)
+
+    texts = pd.Series([t if isinstance(t, str) else None for t in MIXED_CONTENT]
+                      + ['삼성전자 Galaxy S24 Ultra launch event', 'Bonjour tout le monde, ça va?', '12345'],
+                      index=range(100, 100 + len(MIXED_CONTENT) + 3))
+    expected = [detect_language_safe(t) if isinstance(t, str) else 'en' for t in texts]
+
+    reset_language_detection_stats()
+    batch = detect_language_batch(texts)
+    assert batch.tolist() == expected
+    assert batch.index.equals(texts.index)
+    # 두 번 실행해도 같은 결과 (seed 고정)
+    assert detect_language_batch(texts).tolist() == expected
+
+    stats = language_detection_stats()
+    assert stats['hangul'] > 0 and stats['latin'] > 0
+    assert stats.get('langdetect', 0) < stats['hangul'] + stats['latin']
+
+    reset_language_detection_stats()
+    detect_language_batch(pd.Series(['정부가 내년도 예산안을 국회에 제출했다'] * 1000))
+    assert language_detection_stats()['slow_path_ratio'] == 0.0
+
+
+def test_csv_chunks_match_full_load_with_cross_chunk_dedup(tmp_path):
+    """청크 단위 결과를 이어 붙이면 한 번에 읽은 결과와 같고, 청크 사이 중복도 제거되는지 테스트"""
+    from preprocessor import load_csv_chunks
+
+    csv_path = str(tmp_path / 'articles.csv')
+    # 같은 내용이 여러 청크에 걸쳐 반복되도록 세 번 이어 붙입니다.
+    content = [t for t in MIXED_CONTENT if not isinstance(t, int)] * 3
+    pd.DataFrame({'content': content, 'link': range(len(content))}).to_csv(csv_path, index=False)
+
+    chunks = list(load_csv_chunks(csv_path, chunk_rows=4))
+    assert len(chunks) > 1
+    streamed = pd.concat(chunks, ignore_index=True)
+    full = load_csv(csv_path).reset_index(drop=True)
+
+    pd.testing.assert_frame_equal(streamed, full)
+    assert streamed['content_clean'].is_unique
+
+
+@pytest.mark.parametrize("encoding, expected", [
+    ('utf-8', 'utf-8'),
+    ('utf-8-sig', 'utf-8-sig'),
+    ('utf-16', 'utf-16'),
+    ('cp949', 'cp949'),
+])
+def test_detect_csv_encoding_and_provenance(tmp_path, encoding, expected):
+    """BOM/앞부분 디코딩으로 인코딩을 판별하고, 결과에 출처 인코딩이 기록되는지 테스트"""
+    from preprocessor import detect_csv_encoding
+
+    csv_path = str(tmp_path / f'{encoding}.csv')
+    pd.DataFrame({'content': [t for t in MIXED_CONTENT if isinstance(t, str)]}).to_csv(
+        csv_path, index=False, encoding=encoding)
+
+    assert detect_csv_encoding(csv_path) == expected
+    result = load_csv(csv_path)
+    assert result.attrs['source_encoding'] == expected
+    assert '정부가 내년도 예산안을 국회에 제출했다' in result['content_clean'].tolist()
+
+
+def test_read_csv_detects_encoding_beyond_ascii_sample(tmp_path):
+    """앞부분이 모두 ASCII이고 cp949 문자가 파일 뒷부분에서야 나와도 올바른 인코딩으로 읽는지 테스트"""
+    from preprocessor.preprocess import ENCODING_SAMPLE_BYTES, _read_csv
+
+    csv_path = str(tmp_path / 'late_cp949.csv')
+    filler = ['ascii only row number %d' % i for i in range(ENCODING_SAMPLE_BYTES // 20)]
+    pd.DataFrame({'content': filler + ['서울 아침 기온 영하 5도 출근길 추위']}).to_csv(
+        csv_path, index=False, encoding='cp949')
+
+    df = _read_csv(csv_path)
+    assert df.attrs['source_encoding'] == 'cp949'
+    assert df['content'].iloc[-1] == '서울 아침 기온 영하 5도 출근길 추위'
+
+
+NEAR_DUP_ARTICLES = [
+    '연합뉴스 정부는 오늘 내년도 예산안을 국회에 제출했다고 밝혔다 예산 규모는 역대 최대 수준으로 복지 분야 지출이 크게 늘었다',
+    '삼성전자가 3분기 실적을 발표했다 반도체 부문의 영업이익이 전년 대비 크게 증가하며 시장 기대를 웃돌았다',
+    '뉴시스 정부는 오늘 내년도 예산안을 국회에 제출했다고 밝혔다 예산 규모는 역대 최대 수준으로 복지 분야 지출이 크게 늘었다고 전했다',
+    '서울 아침 기온이 영하 5도까지 떨어지며 출근길 시민들이 두꺼운 외투를 꺼내 입었다',
+    '삼성전자가 3분기 실적을 발표했다 반도체 부문 영업이익이 전년 대비 크게 증가하며 시장 기대를 웃돌았다는 평가다',
+]
+
+
+def test_near_duplicates_are_clustered_with_first_as_canonical():
+    """고쳐 쓴 기사들이 같은 클러스터로 묶이고 먼저 나온 기사가 대표가 되는지 테스트"""
+    from preprocessor import mark_near_duplicates
+
+    df = pd.DataFrame({'content_clean': NEAR_DUP_ARTICLES}, index=[10, 11, 12, 13, 14])
+    marked = mark_near_duplicates(df, threshold=0.7)
+
+    assert marked['dup_cluster'].tolist() == [0, 1, 0, 3, 1]
+    assert marked['is_canonical'].tolist() == [True, True, False, True, False]
+    assert marked.index.equals(df.index)
+
+    # 기준을 아주 높이면 완전히 같은 기사만 묶입니다.
+    strict = mark_near_duplicates(df, threshold=1.0)
+    assert strict['is_canonical'].all()
+
+
+def test_near_duplicate_index_keeps_every_cluster_per_band():
+    """band 값이 겹치는 서로 다른 대표 기사가 여럿이어도 나중에 추가한 대표 기사의 중복을 찾는지 테스트"""
+    from preprocessor import NearDuplicateIndex
+
+    index = NearDuplicateIndex(threshold=0.7)
+    # 모든 문서가 모든 band에서 같은 값을 갖도록 해 band 충돌을 강제로 만듭니다.
+    index._band_keys = lambda signature: [b'shared'] * index.bands
+
+    first, second, second_copy = NEAR_DUP_ARTICLES[0], NEAR_DUP_ARTICLES[1], NEAR_DUP_ARTICLES[4]
+    assert index.add(first) == (0, True)
+    assert index.add(second) == (1, True)
+    assert index.add(second_copy) == (1, False)
+
+
+def test_near_duplicate_index_spans_stream_chunks(tmp_path):
+    """스트리밍에서 앞선 청크의 기사와도 유사 중복을 찾는지 테스트"""
+    from preprocessor import load_csv_chunks
+
+    csv_path = str(tmp_path / 'near_dup.csv')
+    pd.DataFrame({'content': NEAR_DUP_ARTICLES}).to_csv(csv_path, index=False)
+
+    streamed = pd.concat(load_csv_chunks(csv_path, chunk_rows=2, near_dup_threshold=0.7),
+                         ignore_index=True)
+    assert streamed['dup_cluster'].tolist() == [0, 1, 0, 3, 1]
+    full = load_csv(csv_path, near_dup_threshold=0.7)
+    assert full['is_canonical'].tolist() == streamed['is_canonical'].tolist()
+
+
+def test_preprocess_stats_match_between_paths_and_are_logged_once(caplog):
+    """두 경로의 실행 통계가 같고, INFO 레벨에서는 행마다가 아니라 실행 요약만 남는지 테스트"""
+    import logging
+
+    df = pd.DataFrame({'content': MIXED_CONTENT})
+    with caplog.at_level(logging.INFO, logger='preprocessor'):
+        batch = preprocess_dataframe(df.copy(), batch=True)
+        row_wise = preprocess_dataframe(df.copy(), batch=False)
+
+    batch_stats = batch.attrs['preprocess_stats']
+    row_stats = row_wise.attrs['preprocess_stats']
+    for key in ('input_rows', 'output_rows', 'skipped', 'tokens'):
+        assert batch_stats[key] == row_stats[key]
+    assert batch_stats['input_rows'] == len(MIXED_CONTENT)
+    assert batch_stats['output_rows'] == len(batch)
+    assert batch_stats['input_rows'] == batch_stats['output_rows'] + sum(batch_stats['skipped'].values())
+    assert batch_stats['skipped']['missing'] == 2
+    assert batch_stats['skipped']['duplicate'] == 2
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert not any(message.startswith('Processing row') for message in messages)
+    assert sum(message.startswith('전처리 완료') for message in messages) == 2
+
+
+@pytest.mark.parametrize("suffix", ['.parquet', '.arrow'])
+def test_artifact_roundtrip_keeps_token_lists_and_provenance(tmp_path, suffix):
+    """저장한 전처리 결과를 다시 읽으면 tokens가 리스트 그대로이고 attrs와 컬럼 선택이 유지되는지 테스트"""
+    pytest.importorskip('pyarrow')
+    from preprocessor import iter_artifact, load_artifact, save_artifact
+
+    result = preprocess_dataframe(pd.DataFrame({'content': NEAR_DUP_ARTICLES}), near_dup_threshold=0.7)
+    path = str(tmp_path / f'articles{suffix}')
+    save_artifact(result, path)
+
+    loaded = load_artifact(path)
+    pd.testing.assert_frame_equal(loaded, result.reset_index(drop=True))
+    assert all(isinstance(tokens, list) for tokens in loaded['tokens'])
+    assert loaded.attrs['preprocess_stats'] == result.attrs['preprocess_stats']
+    assert 'tokenizer' in loaded.attrs
+
+    tokens_only = load_artifact(path, columns=['tokens'])
+    assert tokens_only.columns.tolist() == ['tokens']
+    assert tokens_only['tokens'].tolist() == result['tokens'].tolist()
+
+    batches = list(iter_artifact(path, columns=['content', 'tokens'], batch_rows=2))
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert pd.concat(batches, ignore_index=True)['tokens'].tolist() == result['tokens'].tolist()
+
+
+def test_artifact_writer_appends_stream_chunks(tmp_path):
+    """청크 스트림을 ArtifactWriter로 이어 쓰면 한 번에 전처리한 결과와 같은지 테스트"""
+    pytest.importorskip('pyarrow')
+    from preprocessor import ArtifactWriter, load_artifact, load_csv_chunks
+
+    csv_path = str(tmp_path / 'articles.csv')
+    pd.DataFrame({'content': MIXED_CONTENT * 3}).to_csv(csv_path, index=False)
+    path = str(tmp_path / 'articles.parquet')
+    with ArtifactWriter(path) as writer:
+        for chunk in load_csv_chunks(csv_path, chunk_rows=4):
+            writer.write(chunk)
+
+    loaded = load_artifact(path)
+    full = load_csv(csv_path)
+    pd.testing.assert_frame_equal(loaded, full.reset_index(drop=True))
+    assert loaded.attrs['source_path'] == csv_path
@@ -0,0 +1,370 @@
+# tests/test_summarizer.py
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from answer.rate_limit import AdaptiveRateLimiter, estimate_tokens
+from answer.summarizer import FAILED_SUMMARY, ArticleSummarizer
+
+ARTICLES = [f"기사 {i}: 오늘의 주요 뉴스 내용입니다" for i in range(12)]
+
+
+def make_summarizer(server, **kwargs):
+    return ArticleSummarizer(api_key='test-key', base_url=server.base_url, **kwargs)
+
+
+def write_articles(tmp_path, articles=ARTICLES):
+    csv_path = str(tmp_path / 'articles.csv')
+    pd.DataFrame({'content': articles}).to_csv(csv_path, index=False)
+    return csv_path
+
+
+def test_import_does_not_run_script():
+    """모듈 import만으로 요약 스크립트가 실행되지 않는지 테스트"""
+    import answer.summarizer as summarizer
+
+    assert not hasattr(summarizer, 'summarizer')
+    assert not hasattr(summarizer, 'output_path')
+
+
+def test_process_csv_runs_concurrently_and_keeps_row_order(fake_openai, tmp_path):
+    """동시 요약이 concurrency 이하로 겹쳐 실행되고 결과가 행 순서대로 저장되는지 테스트"""
+    fake_openai.delay = 0.05
+    summarizer = make_summarizer(fake_openai, concurrency=4)
+
+    started = time.perf_counter()
+    output_path = summarizer.process_csv(write_articles(tmp_path))
+    elapsed = time.perf_counter() - started
+
+    result = pd.read_csv(output_path)
+    assert result['summary'].tolist() == [f"요약: {article}" for article in ARTICLES]
+    assert 1 < fake_openai.peak_in_flight <= 4
+    # 순차 실행(12 x 0.05초)보다 빨라야 합니다.
+    assert elapsed < len(ARTICLES) * fake_openai.delay
+
+
+def test_rate_limited_requests_back_off_and_retry(fake_openai):
+    """429 응답을 받으면 속도를 낮추고 다시 시도해 모든 요약을 받는지 테스트"""
+    fake_openai.rate_limit_failures = 3
+    summarizer = make_summarizer(fake_openai, concurrency=2, requests_per_minute=6000)
+
+    summaries = summarizer.summarize_texts(ARTICLES[:6])
+
+    assert summaries == [f"요약: {article}" for article in ARTICLES[:6]]
+    assert fake_openai.rate_limited == 3
+    assert summarizer.rate_limiter.rate_limited == 3
+    assert summarizer.rate_limiter.factor < 1.0
+
+
+def test_exhausted_retries_mark_row_as_failed(fake_openai):
+    """재시도 횟수를 넘긴 행은 '요약 실패'로 채우고 나머지는 계속 진행하는지 테스트"""
+    fake_openai.rate_limit_failures = 2
+    summarizer = make_summarizer(fake_openai, concurrency=1, max_retries=1)
+
+    summaries = summarizer.summarize_texts(ARTICLES[:2])
+
+    assert summaries == [FAILED_SUMMARY, f"요약: {ARTICLES[1]}"]
+
+
+def test_last_failed_attempt_raises_without_backoff():
+    """마지막 시도까지 실패하면 백오프 없이 바로 예외를 내는지 테스트 (연결 오류는 시도 사이에만 기다림)"""
+    import openai
+
+    summarizer = ArticleSummarizer(api_key='test-key', base_url='http://127.0.0.1:1/v1', max_retries=1)
+
+    started = time.perf_counter()
+    with pytest.raises(openai.APIConnectionError):
+        summarizer.summarize_text(ARTICLES[0])
+
+    # 첫 실패 뒤 0.5초만 기다리고, 두 번째 실패 뒤에는 기다리지 않습니다.
+    assert time.perf_counter() - started < 1.2
+
+
+def test_rate_limiter_enforces_request_and_token_budgets():
+    """분당 요청/토큰 예산을 넘는 만큼 기다리는지 테스트"""
+    requests = AdaptiveRateLimiter(requests_per_minute=1200)   # 초당 20건, 한 번에 20건까지
+    started = time.perf_counter()
+    for _ in range(30):
+        requests.acquire()
+    assert time.perf_counter() - started >= 0.4
+
+    tokens = AdaptiveRateLimiter(tokens_per_minute=60000)      # 초당 1000토큰
+    started = time.perf_counter()
+    for _ in range(3):
+        tokens.acquire(500)
+    assert time.perf_counter() - started >= 0.4
+
+    # 1초 분량(1000토큰)보다 큰 요청도 예상치 전부를 차감하므로 다음 요청이 그만큼 기다립니다.
+    large = AdaptiveRateLimiter(tokens_per_minute=60000)
+    large.acquire(1500)
+    assert large._tokens.tokens == pytest.approx(-500, abs=20)
+    started = time.perf_counter()
+    large.acquire(1500)
+    assert time.perf_counter() - started >= 1.4
+
+    assert estimate_tokens("hello world!") == 3
+    assert estimate_tokens("안녕하세요") == 5
+
+
+def test_rate_limiter_recovers_after_successes():
+    """429로 낮춘 속도가 성공이 이어지면 원래대로 돌아오는지 테스트"""
+    limiter = AdaptiveRateLimiter(requests_per_minute=600)
+    limiter.on_rate_limited(retry_after=0)
+    assert limiter.factor == pytest.approx(0.5)
+    assert limiter._requests.rate == pytest.approx(5.0)
+
+    for _ in range(20):
+        limiter.on_success()
+    assert limiter.factor == 1.0
+    assert limiter._requests.rate == pytest.approx(10.0)
+
+
+def test_summary_cache_skips_unchanged_articles(fake_openai, tmp_path):
+    """두 번째 실행에서는 새로 바뀐 기사만 요청하고, 모델이 바뀌면 캐시를 쓰지 않는지 테스트"""
+    from answer.cache import SummaryCache
+
+    cache = SummaryCache(str(tmp_path / 'summaries.sqlite'))
+    summarizer = make_summarizer(fake_openai, cache=cache)
+    first = summarizer.summarize_texts(ARTICLES[:4] + ARTICLES[:2])
+    assert len(fake_openai.requests) == 4   # 같은 텍스트는 한 번만 요청
+
+    changed = ARTICLES[:3] + ["새로 바뀐 기사"]
+    second = summarizer.summarize_texts(changed)
+    assert len(fake_openai.requests) == 5
+    assert second[:3] == first[:3]
+    assert second[3] == "요약: 새로 바뀐 기사"
+    assert cache.stats()['hits'] == 3
+
+    other_model = make_summarizer(fake_openai, model='gpt-4o-mini', cache=cache)
+    other_model.summarize_texts(ARTICLES[:2])
+    assert len(fake_openai.requests) == 7
+
+
+def test_summary_cache_serves_stale_entries_when_api_fails(fake_openai, tmp_path):
+    """만료된 요약은 다시 요청하고, 요청이 실패하면 serve_stale일 때만 만료된 요약을 쓰는지 테스트"""
+    from answer.cache import SummaryCache
+
+    cache = SummaryCache(str(tmp_path / 'summaries.sqlite'), max_age_hours=0)
+    make_summarizer(fake_openai, cache=cache).summarize_texts(ARTICLES[:2])
+
+    fake_openai.rate_limit_failures = 100
+    fake_openai.retry_after_ms = 1
+    strict = make_summarizer(fake_openai, cache=cache, max_retries=0)
+    assert strict.summarize_texts(ARTICLES[:2]) == [FAILED_SUMMARY, FAILED_SUMMARY]
+
+    fallback = make_summarizer(fake_openai, cache=cache, max_retries=0, serve_stale=True)
+    assert fallback.summarize_texts(ARTICLES[:2]) == [f"요약: {article}" for article in ARTICLES[:2]]
+    assert cache.stats()['stale_hits'] == 2
+
+
+def test_summary_cache_evicts_least_recently_used(tmp_path):
+    """용량을 넘으면 가장 오래 사용되지 않은 요약부터 지우는지 테스트"""
+    from answer.cache import SummaryCache
+
+    cache = SummaryCache(str(tmp_path / 'summaries.sqlite'), max_bytes=250)
+    cache.put('a', 'x' * 100, namespace='ns')
+    cache.put('b', 'y' * 100, namespace='ns')
+    assert cache.get('a', namespace='ns') == 'x' * 100
+    assert cache.get('a', namespace='other') is None
+    cache.put('c', 'z' * 100, namespace='ns')
+
+    assert cache.get('b', namespace='ns') is None
+    assert cache.get('a', namespace='ns') == 'x' * 100
+    stats = cache.stats()
+    assert stats['evictions'] == 1
+    assert stats['entries'] == 2
+    assert stats['bytes'] == 200
+    cache.close()
+
+
+def test_checkpoint_resumes_after_interruption(fake_openai, tmp_path):
+    """중단된 실행을 같은 체크포인트로 다시 시작하면 남은 행만 요청하고, 텍스트가 바뀐 행은 다시 요약하는지 테스트"""
+    csv_path = write_articles(tmp_path)
+    checkpoint_path = str(tmp_path / 'journal.jsonl')
+    output_path = str(tmp_path / 'out.csv')
+
+    interrupted = make_summarizer(fake_openai, concurrency=1)
+    original = interrupted.summarize_text
+    calls = []
+
+    def summarize_then_interrupt(text):
+        if len(calls) == 5:
+            raise KeyboardInterrupt
+        calls.append(text)
+        return original(text)
+
+    interrupted.summarize_text = summarize_then_interrupt
+    with pytest.raises(KeyboardInterrupt):
+        interrupted.process_csv(csv_path, output_path=output_path, checkpoint_path=checkpoint_path)
+    assert not os.path.exists(output_path)
+    with open(checkpoint_path, encoding='utf-8') as f:
+        assert len(f.readlines()) == 5
+
+    resumed = make_summarizer(fake_openai, concurrency=3)
+    resumed.process_csv(csv_path, output_path=output_path, checkpoint_path=checkpoint_path)
+    assert len(fake_openai.requests) == len(ARTICLES)
+    result = pd.read_csv(output_path)
+    assert result['summary'].tolist() == [f"요약: {article}" for article in ARTICLES]
+
+    # 입력 CSV의 한 행이 바뀌면 그 행만 다시 요약합니다.
+    changed = list(ARTICLES)
+    changed[2] = "내용이 바뀐 기사"
+    write_articles(tmp_path, changed)
+    resumed.process_csv(csv_path, output_path=output_path, checkpoint_path=checkpoint_path)
+    assert len(fake_openai.requests) == len(ARTICLES) + 1
+    assert pd.read_csv(output_path)['summary'][2] == "요약: 내용이 바뀐 기사"
+
+
+def test_summary_journal_ignores_truncated_last_line(tmp_path):
+    """강제 종료로 잘린 마지막 줄은 무시하고 그 뒤에 이어서 기록하는지 테스트"""
+    from answer.checkpoint import SummaryJournal
+
+    path = str(tmp_path / 'journal.jsonl')
+    with SummaryJournal(path) as journal:
+        journal.record([0, 3], "같은 기사", "요약 A")
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"row": 1, "digest": "ab')
+
+    with SummaryJournal(path) as journal:
+        assert journal.get(0, "같은 기사") == "요약 A"
+        assert journal.get(3, "같은 기사") == "요약 A"
+        assert journal.get(0, "다른 기사") is None
+        assert journal.get(1, "기사") is None
+        journal.record([1], "기사", "요약 B")
+
+    with SummaryJournal(path) as journal:
+        assert journal.get(1, "기사") == "요약 B"
+
+
+def test_batch_mode_submits_polls_and_ingests_results(fake_openai, tmp_path):
+    """배치 모드가 요청 파일을 올리고 완료될 때까지 조회한 뒤 결과를 custom_id로 행에 맞춰 넣는지 테스트"""
+    import json
+
+    from answer.batch import custom_id_for
+
+    articles = ARTICLES[:5] + ARTICLES[:1]
+    csv_path = write_articles(tmp_path, articles)
+    summarizer = make_summarizer(fake_openai)
+    fake_openai.batch_polls = 3
+    fake_openai.batch_failures = {custom_id_for(ARTICLES[3], summarizer.cache_namespace())}
+
+    output_path = summarizer.process_csv_batch(csv_path, poll_interval=0.01)
+
+    result = pd.read_csv(output_path)
+    assert result['summary'].tolist() == [f"요약: {article}" for article in articles]
+    # 중복 제외 5건을 배치로 요청하고, 배치에서 실패한 1건만 일반 요청으로 다시 보냅니다.
+    assert len(fake_openai.batch_requests) == 4
+    assert len(fake_openai.requests) == 1
+    (batch,) = fake_openai.batches.values()
+    assert batch['polls'] == 3
+
+    requests_path = output_path.replace('.csv', '_batch_requests.jsonl')
+    with open(requests_path, encoding='utf-8') as f:
+        custom_ids = [json.loads(line)['custom_id'] for line in f]
+    # 같은 기사는 실행마다 같은 custom_id를 받습니다.
+    assert custom_ids == [custom_id_for(article, summarizer.cache_namespace()) for article in ARTICLES[:5]]
+
+
+def test_batch_mode_skips_malformed_output_lines(fake_openai, tmp_path, monkeypatch):
+    """결과 파일에 JSON으로 읽을 수 없는 줄이 있어도 나머지는 받고, 그 기사만 일반 요청으로 다시 보내는지 테스트"""
+    run_batch = fake_openai._run_batch
+
+    def run_batch_with_truncated_line(batch):
+        run_batch(batch)
+        output = fake_openai.files[batch['output_file_id']]
+        first, rest = output['data'].split(b'\n', 1)
+        output['data'] = first[:len(first) // 2] + b'\n' + rest
+
+    monkeypatch.setattr(fake_openai, '_run_batch', run_batch_with_truncated_line)
+    summarizer = make_summarizer(fake_openai)
+    fake_openai.batch_polls = 1
+
+    summaries = summarizer.summarize_batch(ARTICLES[:3], requests_path=str(tmp_path / 'requests.jsonl'),
+                                           poll_interval=0.01)
+
+    assert summaries == [f"요약: {article}" for article in ARTICLES[:3]]
+    assert len(fake_openai.batch_requests) == 3
+    assert len(fake_openai.requests) == 1
+
+
+def test_batch_mode_resumes_existing_batch_and_times_out(fake_openai, tmp_path):
+    """시간 안에 끝나지 않으면 TimeoutError를 내고, 같은 batch_id로 다시 호출하면 결과를 받는지 테스트"""
+    summarizer = make_summarizer(fake_openai)
+    fake_openai.batch_polls = 5
+    requests_path = str(tmp_path / 'requests.jsonl')
+
+    with pytest.raises(TimeoutError):
+        summarizer.summarize_batch(ARTICLES[:3], requests_path=requests_path, poll_interval=0.01, timeout=0.015)
+    (batch_id,) = fake_openai.batches
+
+    summaries = summarizer.summarize_batch(ARTICLES[:3], batch_id=batch_id, poll_interval=0.01)
+    assert summaries == [f"요약: {article}" for article in ARTICLES[:3]]
+    assert len(fake_openai.batches) == 1
+
+
+def test_packing_cuts_request_count(fake_openai):
+    """묶음 모드가 토큰 예산 안에서 기사를 묶어 요청 수를 줄이고 결과를 기사별로 나누는지 테스트"""
+    from answer.packing import pack_texts
+
+    summarizer = make_summarizer(fake_openai, pack_token_budget=100, pack_max_articles=5)
+    packs = pack_texts(ARTICLES, token_budget=100, max_articles=5)
+    assert [text for pack in packs for text in pack] == ARTICLES
+    assert all(len(pack) <= 5 for pack in packs)
+
+    summaries = summarizer.summarize_texts(ARTICLES)
+
+    assert summaries == [f"요약: {article}" for article in ARTICLES]
+    assert len(fake_openai.requests) == len(packs) < len(ARTICLES)
+    assert all(body['response_format'] == {'type': 'json_object'} for body in fake_openai.requests)
+
+
+def test_packing_falls_back_to_single_requests_for_bad_items(fake_openai):
+    """묶음 응답에서 빠지거나 형식이 틀린 기사, JSON이 아닌 응답은 기사 하나씩 다시 요청하는지 테스트"""
+    from answer.packing import parse_packed_response
+
+    responses = iter([
+        lambda articles: {'1': "요약: 첫 기사", '2': 123, '9': "요청하지 않은 ID"},
+        lambda articles: "JSON이 아닌 응답",
+    ])
+    fake_openai.respond_packed = lambda articles: next(responses)(articles)
+    summarizer = make_summarizer(fake_openai, concurrency=1, pack_token_budget=1000, pack_max_articles=3)
+
+    summaries = summarizer.summarize_texts(ARTICLES[:6])
+
+    assert summaries[0] == "요약: 첫 기사"
+    assert summaries[1:] == [f"요약: {article}" for article in ARTICLES[1:6]]
+    single_requests = [body for body in fake_openai.requests if 'response_format' not in body]
+    assert len(single_requests) == 5   # 첫 묶음의 2, 3번 + 두 번째 묶음 전체
+
+    assert parse_packed_response('{"summaries": {"1": " 요약 "}}', ['1', '2']) == {'1': "요약"}
+    assert parse_packed_response('["요약"]', ['1']) == {}
+
+
+def test_packing_keeps_single_request_cache_separate(fake_openai, tmp_path):
+    """묶음 모드에서도 개별 요청 캐시를 그대로 쓰고, 묶음 응답 요약과 개별 재요청 요약을 따로 저장하는지 테스트"""
+    from answer.cache import SummaryCache
+
+    cache = SummaryCache(str(tmp_path / 'summaries.sqlite'))
+    single = make_summarizer(fake_openai, cache=cache)
+    single.summarize_texts(ARTICLES[:2])
+    fake_openai.requests.clear()
+
+    fake_openai.respond_packed = lambda articles: {'1': f"요약: {articles['1']}"}
+    packing = make_summarizer(fake_openai, cache=cache, concurrency=1, pack_token_budget=1000, pack_max_articles=3)
+    # 묶음 모드를 켜도 배치 custom_id와 개별 요청 캐시 키는 그대로입니다.
+    assert packing.cache_namespace() == single.cache_namespace()
+
+    summaries = packing.summarize_texts(ARTICLES[:5])
+
+    assert summaries == [f"요약: {article}" for article in ARTICLES[:5]]
+    # 캐시된 2건은 요청하지 않고, 나머지 3건을 한 묶음으로 보낸 뒤 빠진 2건만 하나씩 다시 요청합니다.
+    assert len(fake_openai.requests) == 3
+    assert set(cache.get_many(ARTICLES[:5], packing.packed_cache_namespace())) == {ARTICLES[2]}
+    assert set(cache.get_many(ARTICLES[:5], single.cache_namespace())) == set(ARTICLES[:2] + ARTICLES[3:5])
+
+    # 묶음 응답의 요약은 개별 요청 모드에서 쓰지 않습니다.
+    fake_openai.requests.clear()
+    single.summarize_texts(ARTICLES[:5])
+    assert len(fake_openai.requests) == 1